@@ -0,0 +1,129 @@
+"""
+Sync and async switch telemetry collection benchmark against the local mock switch (mock_switch.py).
+Mock switch serves module responses of the archived switch telemetry (database/archive) with the module latency.
+Telemetry is collected for a number of polling cycles in the sync mode (modules are requested one by one)
+and in the async mode (modules are requested concurrently) through the long-lived switch session.
+Collection time per cycle, mock switch requests statistics and session connection pool statistics
+are printed for both modes. Module containers of both modes are checked to be the same
+(request statistics keys are ignored) and the same as the archived telemetry.
+
+Usage: python async_collection_benchmark.py <telemetry pickle file> [latency ms] [cycles number]
+Mock switch listens on the free port of the loopback address. 
+Telemetry pickled by the earlier collector versions (drafts/storage) is loaded as well.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the collection module in the parent
+from bin.mock_switch import REQUEST_KEYS, MockSwitch
+from bin.port_record_benchmark import load_telemetry
+from collection.switch_session import SwitchSession
+from collection.switch_telemetry_request import SwitchTelemetryRequest
+
+LATENCY = 50
+CYCLES_NUMBER = 5
+MODES = ['sync', 'async']
+
+
+def get_containers(sw_telemetry) -> dict:
+    """Function returns module containers of the switch telemetry without the request statistics keys.
+
+    Args:
+        sw_telemetry (SwitchTelemetryRequest): switch telemetry.
+
+    Returns:
+        dict: (module_name, module_type, container key) and module container pairs.
+    """
+
+    containers = {}
+    for container, (module_name, module_type) in sw_telemetry._ch_unique_containers:
+        containers[(module_name, module_type, None)] = container
+    for container, (module_name, module_type) in sw_telemetry._vf_unique_containers:
+        for vf_id, vf_container in container.items():
+            containers[(module_name, module_type, vf_id)] = vf_container
+    return {module: {key: value for key, value in container.items() if key not in REQUEST_KEYS}
+            for module, container in containers.items()}
+
+
+def get_changed_modules(containers: dict, expected_containers: dict) -> list:
+    """Function returns modules which containers are not the same as expected containers.
+    Modules absent in containers are not checked."""
+
+    return [module for module, container in containers.items() if container != expected_containers.get(module)]
+
+
+def measure_mode(mock_switch: MockSwitch, mode: str, cycles_number: int) -> dict:
+    """Function collects switch telemetry for the cycles_number cycles and measures collection time.
+
+    Args:
+        mock_switch (MockSwitch): running mock switch.
+        mode (str): 'sync' - modules are requested one by one, 'async' - modules are requested concurrently.
+        cycles_number (int): number of polling cycles.
+
+    Returns:
+        dict: collection time per cycle (sec), mock switch and session pool statistics, last cycle telemetry.
+    """
+
+    mock_switch.reset_stats()
+    cycle_times = []
+    with SwitchSession(mock_switch.sw_ipaddress, mock_switch.username, mock_switch.password, 
+                       rest_port=mock_switch.port) as session, \
+            contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(cycles_number):
+            start_time = time.perf_counter()
+            sw_telemetry = SwitchTelemetryRequest(mock_switch.sw_ipaddress, mock_switch.username, mock_switch.password,
+                                                  async_mode=(mode == 'async'), session=session, rest_port=mock_switch.port)
+            cycle_times.append(time.perf_counter() - start_time)
+        pool_stats = session.pool_stats
+    return {'cycle': sum(cycle_times) / len(cycle_times),
+            'mock-stats': mock_switch.stats,
+            'pool-stats': pool_stats,
+            'telemetry': sw_telemetry}
+
+
+def run_benchmark(sw_telemetry, latency: float, cycles_number: int) -> None:
+    """Function prints collection time per cycle of the sync and async modes and compares collected containers."""
+
+    with MockSwitch(sw_telemetry, latency=latency) as mock_switch:
+        results = {mode: measure_mode(mock_switch, mode, cycles_number) for mode in MODES}
+
+    print(f"Module latency: {latency * 1000:.0f} ms, cycles: {cycles_number}, "
+          f"max concurrent requests: {SwitchTelemetryRequest.MAX_CONCURRENT_REQUESTS}")
+    print(f"{'mode':>6} {'cycle ms':>10} {'requests':>9} {'concurrent':>11} {'tcp conns':>10} {'corrupted':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>6} {result['cycle'] * 1000:>10.1f} {result['mock-stats']['module-requests']:>9} "
+              f"{result['mock-stats']['max-concurrent-requests']:>11} {result['pool-stats']['tcp-connections']:>10} "
+              f"{str(result['telemetry'].corrupted_request):>10}")
+    print(f"async speedup: {results['sync']['cycle'] / results['async']['cycle']:.2f}")
+
+    archived_containers = get_containers(sw_telemetry)
+    sync_containers = get_containers(results['sync']['telemetry'])
+    async_containers = get_containers(results['async']['telemetry'])
+    print(f"modules: {len(sync_containers)}, "
+          f"sync and async containers differ: {get_changed_modules(async_containers, sync_containers) or 'none'}, "
+          f"containers differ from the archived telemetry: {get_changed_modules(sync_containers, archived_containers) or 'none'}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else LATENCY / 1000
+    cycles_number = int(sys.argv[3]) if len(sys.argv) > 3 else CYCLES_NUMBER
+    run_benchmark(load_telemetry(sys.argv[1]), latency, cycles_number)
@@ -0,0 +1,117 @@
+"""
+Micro-benchmark of the changed ports detection (BaseParser.get_changed_vfid_ports).
+Synthetic fc port statistics of 48, 512 and 4096 ports are compared with the previous statistics
+where CHANGED_PORTS_SHARE of the ports have changed FC_PORT_STATS_CHANGED values.
+Fingerprint based detection is compared with the per key detection of each port (previous implementation).
+
+Usage: python change_detection_benchmark.py [repeats]
+"""
+
+import os
+import random
+import sys
+import time
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the parser module in the parent
+from parser.base_parser import BaseParser
+from parser.fcport_stats_parser import FCPortStatisticsParser
+
+PORTS_NUMBERS = [48, 512, 4096]
+REPEATS = 20
+CHANGED_PORTS_SHARE = 0.02
+# number of the port statistics keys which are not checked for changes
+OTHER_KEYS_NUMBER = 150
+
+
+def get_ports(ports_number: int) -> dict:
+    """Function creates synthetic port statistics dictionaries with the changed and constant keys."""
+
+    ports_dct = {}
+    for i in range(ports_number):
+        port_dct = {key: f'{key}-value' for key in FCPortStatisticsParser.FC_PORT_PATH}
+        port_dct.update({f'counter-{j}': i * j for j in range(OTHER_KEYS_NUMBER)})
+        port_dct.update({key: 'OK' for key in FCPortStatisticsParser.FC_PORT_STATS_CHANGED})
+        ports_dct[f'{i // 64}/{i % 64}'] = port_dct
+    return ports_dct
+
+
+def change_ports(ports_dct: dict, seed: int = 0) -> dict:
+    """Function copies port statistics and changes one of the FC_PORT_STATS_CHANGED values of the CHANGED_PORTS_SHARE ports."""
+
+    rnd = random.Random(seed)
+    changed_ports_dct = {slot_port: dict(port_dct) for slot_port, port_dct in ports_dct.items()}
+    for slot_port in rnd.sample(list(changed_ports_dct), max(1, int(len(changed_ports_dct) * CHANGED_PORTS_SHARE))):
+        changed_ports_dct[slot_port][rnd.choice(FCPortStatisticsParser.FC_PORT_STATS_CHANGED)] = 'Critical'
+    return changed_ports_dct
+
+
+def get_changed_values_per_key(now_dct: dict, prev_dct: dict, keys: list, tag: str = '-prev') -> dict:
+    """Function finds changed values key by key (previous implementation of the BaseParser.get_changed_values)."""
+
+    changed_values_dct = {}
+    for key in keys:
+        if not key in set(now_dct).intersection(prev_dct):
+            continue
+        if prev_dct[key] != now_dct[key]:
+            changed_values_dct[key] = now_dct[key]
+            changed_values_dct[key + tag] = prev_dct[key]
+    return changed_values_dct
+
+
+def get_changed_vfid_ports_per_key(ports_vfid_now_dct, ports_vfid_prev_dct, changed_keys, const_keys, time_now, time_prev):
+    """Function finds changed ports checking each key of each port (previous implementation)."""
+
+    ports_vfid_changed_dct = {}
+    for slot_port, port_now_dct in ports_vfid_now_dct.items():
+        if slot_port not in ports_vfid_prev_dct:
+            continue
+        port_changed_dct = get_changed_values_per_key(port_now_dct, ports_vfid_prev_dct[slot_port], changed_keys)
+        BaseParser.copy_dict_values(port_changed_dct, port_now_dct, keys=const_keys)
+        if port_changed_dct:
+            port_changed_dct['time-generated-hrf'] = time_now
+            port_changed_dct['time-generated-prev-hrf'] = time_prev
+            ports_vfid_changed_dct[slot_port] = port_changed_dct
+    return ports_vfid_changed_dct
+
+
+def measure(detection_func, ports_now_dct: dict, ports_prev_dct: dict, repeats: int):
+    """Function returns changed ports and the best detection time (sec)."""
+
+    detection_times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        changed_ports_dct = detection_func(ports_now_dct, ports_prev_dct,
+                                           changed_keys=FCPortStatisticsParser.FC_PORT_STATS_CHANGED,
+                                           const_keys=FCPortStatisticsParser.FC_PORT_PATH,
+                                           time_now='now', time_prev='prev')
+        detection_times.append(time.perf_counter() - start_time)
+    return changed_ports_dct, min(detection_times)
+
+
+def run_benchmark(repeats: int) -> None:
+    """Function prints detection time of both implementations for each ports number."""
+
+    print(f"{'ports':>6} {'changed':>8} {'per key ms':>11} {'fingerprint ms':>15} {'speedup':>8} {'identical':>10}")
+    for ports_number in PORTS_NUMBERS:
+        ports_prev_dct = get_ports(ports_number)
+        ports_now_dct = change_ports(ports_prev_dct)
+        per_key_changed, per_key_time = measure(get_changed_vfid_ports_per_key, ports_now_dct, ports_prev_dct, repeats)
+        fingerprint_changed, fingerprint_time = measure(BaseParser.get_changed_vfid_ports, ports_now_dct, ports_prev_dct, repeats)
+        print(f"{ports_number:>6} {len(fingerprint_changed):>8} {per_key_time * 1000:>11.2f} {fingerprint_time * 1000:>15.2f} "
+              f"{per_key_time / fingerprint_time:>7.1f}x {str(per_key_changed == fingerprint_changed):>10}")
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else REPEATS)
@@ -0,0 +1,122 @@
+"""
+Dashboard export benchmark of the 'gauge' and 'collector' export modes.
+Ports of the archived switch telemetry (database/archive) are replicated to PORTS_NUMBER ports
+of the first logical switch. Parsers of the previous and current telemetry are built in turn
+for a number of polling cycles. Update cost (fill_dashboard_gauge_metrics, parsers publishing in the 'collector' mode),
+first scrape cost (exposition of the switch registry, including the dashboard render from the published parsers 
+in the 'collector' mode) and next scrapes cost of each cycle are measured for both export modes.
+Last cycle series of both export modes are checked to be the same
+(stale series are evicted in both modes).
+
+Usage: python export_benchmark.py <previous telemetry pickle file> <current telemetry pickle file> [cycles number]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the parser module in the parent
+from prometheus_client import CollectorRegistry, generate_latest
+
+import database as db
+from bin.port_record_benchmark import PORTS_NUMBER, load_telemetry, replicate_ports
+from dashboard.brocade_dashboard import BrocadeDashboard
+from parser.brocade_parser import BrocadeParser
+from parser.request_status_parser import RequestStatusParser
+
+CYCLES_NUMBER = 10
+# scrapes of each polling cycle
+SCRAPES_NUMBER = 2
+
+
+def build_parsers(sw_telemetry_prev, sw_telemetry_now, cycles_number: int) -> list:
+    """Function builds brocade and request status parsers of the polling cycles
+    (previous and current telemetry in turn, each parser is compared with the previous one)."""
+
+    parsers = []
+    brocade_parser_prev = None
+    for cycle in range(cycles_number):
+        sw_telemetry = sw_telemetry_prev if cycle % 2 == 0 else sw_telemetry_now
+        brocade_parser = BrocadeParser(sw_telemetry, brocade_parser_prev)
+        brocade_parser.build_all()
+        parsers.append((brocade_parser, RequestStatusParser(sw_telemetry, {})))
+        brocade_parser_prev = brocade_parser.get_snapshot()
+    return parsers
+
+
+def measure_mode(sw_telemetry, parsers: list, export_mode: str) -> dict:
+    """Function fills the dashboard with the cycles parsers and scrapes the registry after each cycle.
+
+    Args:
+        sw_telemetry (SwitchTelemetryRequest): switch telemetry dashboard is created with.
+        parsers (list): brocade and request status parsers of the polling cycles.
+        export_mode (str): dashboard export mode.
+
+    Returns:
+        dict: update, first scrape and next scrape time per cycle (sec) and last scrape series.
+    """
+
+    registry = CollectorRegistry()
+    update_times, first_scrape_times, scrape_times = [], [], []
+    # switch log is saved to the temporary directory
+    with tempfile.TemporaryDirectory() as switch_log_dir, contextlib.redirect_stdout(io.StringIO()):
+        db.SWITCH_LOG_DIR = switch_log_dir
+        dashboard = BrocadeDashboard(sw_telemetry, 'export_benchmark', registry, export_mode)
+        for brocade_parser, request_status_parser in parsers:
+            start_time = time.perf_counter()
+            dashboard.fill_dashboard_gauge_metrics(brocade_parser, request_status_parser)
+            update_times.append(time.perf_counter() - start_time)
+            for scrape in range(SCRAPES_NUMBER):
+                start_time = time.perf_counter()
+                exposition = generate_latest(registry)
+                (scrape_times if scrape else first_scrape_times).append(time.perf_counter() - start_time)
+    # generation metrics are exported in the 'collector' mode only
+    series = set(line for line in exposition.decode().splitlines() 
+                 if not line.startswith('#') and not line.startswith('collector_dashboard_generation'))
+    # first cycle creates the toolbars children and is not measured
+    return {'update': sum(update_times[1:]) / (len(update_times) - 1),
+            'first-scrape': sum(first_scrape_times[1:]) / (len(first_scrape_times) - 1),
+            'scrape': sum(scrape_times[SCRAPES_NUMBER - 1:]) / (len(scrape_times) - SCRAPES_NUMBER + 1),
+            'series': series}
+
+
+def run_benchmark(sw_telemetry_prev, sw_telemetry_now, cycles_number: int) -> None:
+    """Function prints update and scrape cost per cycle of both export modes 
+    (total is the update and first scrape cost)."""
+
+    sw_telemetry_prev = replicate_ports(sw_telemetry_prev, PORTS_NUMBER)
+    sw_telemetry_now = replicate_ports(sw_telemetry_now, PORTS_NUMBER)
+    parsers = build_parsers(sw_telemetry_prev, sw_telemetry_now, cycles_number)
+
+    results = {export_mode: measure_mode(sw_telemetry_now, parsers, export_mode) for export_mode in BrocadeDashboard.EXPORT_MODES}
+    print(f"Ports: {PORTS_NUMBER}, cycles: {cycles_number}, scrapes per cycle: {SCRAPES_NUMBER}")
+    print(f"{'mode':>10} {'update ms':>10} {'1st scrape ms':>14} {'scrape ms':>10} {'total ms':>10} {'series':>8}")
+    for export_mode, result in results.items():
+        print(f"{export_mode:>10} {result['update'] * 1000:>10.1f} {result['first-scrape'] * 1000:>14.1f} "
+              f"{result['scrape'] * 1000:>10.1f} {(result['update'] + result['first-scrape']) * 1000:>10.1f} "
+              f"{len(result['series']):>8}")
+    print(f"collector series missing in gauge mode: {len(results['collector']['series'] - results['gauge']['series'])}, "
+          f"gauge series missing in collector mode: {len(results['gauge']['series'] - results['collector']['series'])}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    cycles_number = int(sys.argv[3]) if len(sys.argv) > 3 else CYCLES_NUMBER
+    run_benchmark(load_telemetry(sys.argv[1]), load_telemetry(sys.argv[2]), cycles_number)
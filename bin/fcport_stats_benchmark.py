@@ -0,0 +1,136 @@
+"""
+FC port statistics parser benchmark of the counter matrix engine and the per port counters loop.
+Ports of the two consecutive archived switch telemetry (database/archive) are replicated
+to 48, 512 and 4096 ports of the first logical switch. Parser is built with the previous parser snapshot.
+Parser build time and counters growth calculation time (counters delta, error statuses and categories) are measured.
+Results of both engines are compared.
+
+Usage: python fcport_stats_benchmark.py <previous telemetry pickle file> <current telemetry pickle file> [repeats]
+"""
+
+import copy
+import os
+import sys
+import time
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the parser module in the parent
+from bin.port_record_benchmark import load_telemetry
+from parser.fcport_counter_matrix import FCPortCounterMatrix
+from parser.fcport_params_parser import FCPortParametersParser
+from parser.fcport_stats_parser import FCPortStatisticsParser
+from parser.switch_parser import SwitchParser
+
+PORTS_NUMBERS = [48, 512, 4096]
+REPEATS = 5
+# ports number of the replicated slot
+SLOT_PORTS_NUMBER = 64
+
+
+def replicate_ports(sw_telemetry, ports_number: int):
+    """Function replicates fc interface and fc statistics port containers of the first logical switch
+    to the ports_number ports (slot_port numbers are SLOT_PORTS_NUMBER ports per slot).
+    Other logical switches are removed.
+
+    Args:
+        sw_telemetry (SwitchTelemetryRequest): archived switch telemetry.
+        ports_number (int): number of ports.
+
+    Returns:
+        SwitchTelemetryRequest: switch telemetry copy with the replicated ports.
+    """
+
+    sw_telemetry = copy.deepcopy(sw_telemetry)
+    vf_id = next(vf_id for vf_id, container in sw_telemetry.fc_statistics.items() if container.get('Response'))
+    for container_name, leaf in [('fc_interface', 'fibrechannel'), ('fc_statistics', 'fibrechannel-statistics')]:
+        vfid_containers = getattr(sw_telemetry, container_name)
+        port_containers = vfid_containers[vf_id]['Response'][leaf]
+        replicated_containers = []
+        for i in range(ports_number):
+            port_container = copy.deepcopy(port_containers[i % len(port_containers)])
+            port_container['name'] = f'{i // SLOT_PORTS_NUMBER}/{i % SLOT_PORTS_NUMBER}'
+            replicated_containers.append(port_container)
+        vfid_containers[vf_id]['Response'][leaf] = replicated_containers
+        for other_vf_id in [other_vf_id for other_vf_id in vfid_containers if other_vf_id != vf_id]:
+            del vfid_containers[other_vf_id]
+    return sw_telemetry
+
+
+class TimedFCPortStatisticsParser(FCPortStatisticsParser):
+    """FC port statistics parser with the counters growth calculation time (sec) in the growth_time attribute."""
+
+
+    def _calculate_counters_growth(self, other):
+        start_time = time.perf_counter()
+        fcport_stats_growth = super()._calculate_counters_growth(other)
+        self.growth_time = time.perf_counter() - start_time
+        return fcport_stats_growth
+
+
+def build_parser(sw_telemetry, fcport_stats_prev, matrix_engine: bool):
+    """Function builds fc port statistics parser and returns it with the build time (sec)."""
+
+    FCPortStatisticsParser.COUNTER_MATRIX_ENGINE = matrix_engine
+    sw_parser = SwitchParser(sw_telemetry)
+    fcport_params_parser = FCPortParametersParser(sw_telemetry, sw_parser)
+    start_time = time.perf_counter()
+    fcport_stats_parser = TimedFCPortStatisticsParser(sw_telemetry, sw_parser, fcport_params_parser, fcport_stats_prev)
+    return fcport_stats_parser, time.perf_counter() - start_time
+
+
+def measure_engine(sw_telemetry_prev, sw_telemetry_now, matrix_engine: bool, repeats: int):
+    """Function measures the best parser build time and counters growth calculation time 
+    with the previous parser snapshot.
+
+    Returns:
+        tuple: parser built with the previous snapshot, build time, counters growth calculation time.
+    """
+
+    fcport_stats_prev, _ = build_parser(sw_telemetry_prev, None, matrix_engine)
+    fcport_stats_prev = fcport_stats_prev.get_snapshot()
+    build_times, growth_times = [], []
+    for _ in range(repeats):
+        fcport_stats_parser, build_time = build_parser(sw_telemetry_now, fcport_stats_prev, matrix_engine)
+        build_times.append(build_time)
+        growth_times.append(fcport_stats_parser.growth_time)
+    return fcport_stats_parser, min(build_times), min(growth_times)
+
+
+def run_benchmark(sw_telemetry_prev, sw_telemetry_now, repeats: int) -> None:
+    """Function prints the build and counters growth time of both engines for each ports number."""
+
+    print(f"{'ports':>6} {'engine':>7} {'build ms':>10} {'growth ms':>10} {'speedup':>8} {'identical':>10}")
+    for ports_number in PORTS_NUMBERS:
+        replicated_prev = replicate_ports(sw_telemetry_prev, ports_number)
+        replicated_now = replicate_ports(sw_telemetry_now, ports_number)
+        loop_parser, loop_time, loop_growth_time = measure_engine(replicated_prev, replicated_now, False, repeats)
+        matrix_parser, matrix_time, matrix_growth_time = measure_engine(replicated_prev, replicated_now, True, repeats)
+        identical = (loop_parser.fcport_stats == matrix_parser.fcport_stats and
+                     loop_parser.fcport_stats_growth == matrix_parser.fcport_stats_growth and
+                     loop_parser.sw_parser.fc_switch == matrix_parser.sw_parser.fc_switch)
+        speedup = loop_growth_time / matrix_growth_time if matrix_growth_time else 0
+        print(f"{ports_number:>6} {'loop':>7} {loop_time * 1000:>10.1f} {loop_growth_time * 1000:>10.1f}")
+        print(f"{ports_number:>6} {'matrix':>7} {matrix_time * 1000:>10.1f} {matrix_growth_time * 1000:>10.1f} "
+              f"{speedup:>7.1f}x {str(identical):>10}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    if not FCPortCounterMatrix.is_available():
+        print('numpy is not installed, counter matrix engine is not available')
+        sys.exit(1)
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else REPEATS
+    run_benchmark(load_telemetry(sys.argv[1]), load_telemetry(sys.argv[2]), repeats)
@@ -0,0 +1,27 @@
+"""
+Single process collector for all switches from the inventory.
+Inventory: switches configured in config/switch_access.py and config/http_ports.py.
+Switch names: config/switch_names.py.
+"""
+
+import sys
+import os
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to 
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the collection module in the parent
+from collection.inventory_metrics_collection import collect_inventory_metrics
+
+
+if __name__ == '__main__':
+    collect_inventory_metrics()
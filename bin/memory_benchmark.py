@@ -0,0 +1,125 @@
+"""
+Resident memory benchmark of the parsed switch telemetry.
+Builds a number of brocade and request status parsers from the archived switch telemetry
+(database/archive) with the raw telemetry retained and released (release_telemetry mode).
+Each mode is measured in the separate process. Memory is reported per parser set and per 100 ports.
+
+Usage: python memory_benchmark.py <archived telemetry pickle file> [parser sets number]
+"""
+
+import copy
+import gc
+import json
+import os
+import pickle
+import subprocess
+import sys
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the parser module in the parent
+from parser.brocade_parser import BrocadeParser
+from parser.request_status_parser import RequestStatusParser
+
+# number of parser sets built in each mode
+PARSER_SETS_NUMBER = 20
+MODES = ['retained', 'released']
+
+
+def get_rss() -> int:
+    """Function returns resident set size of the current process (bytes)."""
+
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def get_ports_number(brocade_parser: BrocadeParser) -> int:
+    """Function counts fc ports of all logical switches of the parsed telemetry."""
+
+    if not brocade_parser.fcport_params_parser:
+        return 0
+    return sum(len(ports_vfid_dct) for ports_vfid_dct in brocade_parser.fcport_params_parser.fcport_params.values())
+
+
+def measure_mode(telemetry_filename: str, mode: str, parser_sets_number: int) -> dict:
+    """Function builds parser sets from the copies of the archived telemetry
+    (each polling cycle telemetry is the separate object) and measures resident memory the parser sets hold.
+
+    Args:
+        telemetry_filename (str): archived telemetry pickle file.
+        mode (str): 'retained' - parsers keep the raw telemetry, 'released' - raw telemetry is dropped after parsing.
+        parser_sets_number (int): number of parser sets to build.
+
+    Returns:
+        dict: mode, ports number and resident memory held by the parser sets.
+    """
+
+    with open(telemetry_filename, 'rb') as file:
+        sw_telemetry = pickle.load(file)
+
+    parser_sets = []
+    gc.collect()
+    rss_start = get_rss()
+    for _ in range(parser_sets_number):
+        sw_telemetry_copy = copy.deepcopy(sw_telemetry)
+        request_status_parser = RequestStatusParser(sw_telemetry_copy, {})
+        brocade_parser = BrocadeParser(sw_telemetry_copy)
+        if mode == 'released':
+            request_status_parser.release_telemetry()
+            brocade_parser.release_telemetry()
+        parser_sets.append((request_status_parser, brocade_parser))
+        del sw_telemetry_copy
+    gc.collect()
+    rss_end = get_rss()
+
+    return {'mode': mode,
+            'ports': get_ports_number(parser_sets[0][1]),
+            'rss_per_set': (rss_end - rss_start) / parser_sets_number}
+
+
+def run_benchmark(telemetry_filename: str, parser_sets_number: int) -> None:
+    """Function measures each mode in the separate process (modes do not share freed memory) and prints the results.
+
+    Args:
+        telemetry_filename (str): archived telemetry pickle file.
+        parser_sets_number (int): number of parser sets to build in each mode.
+    """
+
+    results = {}
+    for mode in MODES:
+        output = subprocess.run([sys.executable, __file__, telemetry_filename, str(parser_sets_number), mode],
+                                capture_output=True, text=True, check=True).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    ports_number = results['retained']['ports']
+    print(f"Telemetry: {telemetry_filename}, ports: {ports_number}, parser sets: {parser_sets_number}")
+    for mode in MODES:
+        rss_per_set = results[mode]['rss_per_set']
+        rss_per_100_ports = rss_per_set * 100 / ports_number if ports_number else 0
+        print(f"{mode:>10}: {rss_per_set / 1024:10.1f} KiB per parser set, {rss_per_100_ports / 1024:10.1f} KiB per 100 ports")
+    reduction = results['retained']['rss_per_set'] - results['released']['rss_per_set']
+    if ports_number:
+        print(f"{'reduction':>10}: {reduction / 1024:10.1f} KiB per parser set, {reduction * 100 / ports_number / 1024:10.1f} KiB per 100 ports")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    telemetry_filename = sys.argv[1]
+    parser_sets_number = int(sys.argv[2]) if len(sys.argv) > 2 else PARSER_SETS_NUMBER
+    if len(sys.argv) > 3:
+        # single mode measurement in the child process
+        print(json.dumps(measure_mode(telemetry_filename, sys.argv[3], parser_sets_number)))
+    else:
+        run_benchmark(telemetry_filename, parser_sets_number)
@@ -0,0 +1,314 @@
+"""
+Local stand-in of the Brocade switch REST API.
+Switch serves module requests (/rest/running/<module_name>/<module_type>) from the archived switch telemetry
+(database/archive) with the configurable latency. Module response is the archived module container
+without the request statistics keys added by SwitchTelemetryRequest (status code is the archived status code).
+VF dependent module is served for the 'vf-id' request parameter.
+
+Both SwitchSession auth modes are supported. In 'basic' auth mode credentials are checked in each request.
+In 'session' auth mode /rest/login returns session token in the Authorization header,
+token is checked in each request (401 if token is unknown or revoked) and /rest/logout revokes the token.
+Tokens may be revoked and logins may be rejected to emulate switch session expiration and login failures.
+
+Switch listens on the loopback address and the free unprivileged port by default 
+(SwitchSession and SwitchTelemetryRequest are created with the switch port as the rest_port).
+"""
+
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+# request statistics and status keys added to the module containers by SwitchTelemetryRequest
+REQUEST_KEYS = ['status-code', 'date', 'time', 'error-message', 'request-duration', 'response-bytes',
+                'decode-duration', 'request-retries', 'module-retries', 'cancelled', 'cached', 'stale',
+                'telemetry-age', 'failed-status-code', 'failed-error-message']
+
+MOCK_SWITCH_IPADDRESS = '127.0.0.1'
+# free port is selected by the OS
+MOCK_SWITCH_PORT = 0
+# status code of the module failed in the archived telemetry
+FAILED_STATUS_CODE = 503
+
+
+class MockSwitch:
+    """
+    Class of the local stand-in Brocade switch REST API server.
+
+    Attributes:
+        sw_ipaddress (str): loopback IP address the switch listens on.
+        port (int): port the switch listens on (REST API port of the switch).
+        latency (float): module response delay (sec).
+        username (str): Username to access the switch.
+        password (str): Password to access the switch.
+        reject_logins (bool): /rest/login responds with 401 status code if True.
+        stats (dict): server statistics (module requests, max concurrent requests, tcp connections,
+            basic auth requests, logins, rejected logins, logouts, rejected requests).
+        tokens (set): active session tokens.
+    """
+
+    def __init__(self, sw_telemetry, sw_ipaddress: str = MOCK_SWITCH_IPADDRESS, port: int = MOCK_SWITCH_PORT, 
+                 latency: float = 0, username: str = 'admin', password: str = 'password'):
+        """
+        Args:
+            sw_telemetry (SwitchTelemetryRequest): archived switch telemetry module responses are served from.
+            sw_ipaddress (str): loopback IP address to listen on. Defaults to MOCK_SWITCH_IPADDRESS.
+            port (int): port to listen on. Defaults to MOCK_SWITCH_PORT (free port).
+            latency (float): module response delay (sec). Defaults to 0.
+            username (str): Username to access the switch. Defaults to 'admin'.
+            password (str): Password to access the switch. Defaults to 'password'.
+        """
+
+        self._sw_ipaddress = sw_ipaddress
+        self._port = port
+        self.latency = latency
+        self._username = username
+        self._password = password
+        self.reject_logins = False
+        self._routes = MockSwitch._get_routes(sw_telemetry)
+        self._tokens = set()
+        self._login_number = 0
+        self._active_requests = 0
+        self._lock = threading.Lock()
+        self._connections = set()
+        self._stats = {'module-requests': 0, 'max-concurrent-requests': 0, 'basic-auth-requests': 0,
+                       'logins': 0, 'rejected-logins': 0, 'logouts': 0, 'rejected-requests': 0}
+        self._server = None
+
+
+    @staticmethod
+    def _get_routes(sw_telemetry) -> dict:
+        """Function creates module responses of the archived switch telemetry.
+
+        Args:
+            sw_telemetry (SwitchTelemetryRequest): archived switch telemetry.
+
+        Returns:
+            dict: (module_name, module_type, vf_id) and (status code, response body) pairs.
+                vf_id is None if module is requested without 'vf-id' parameter.
+        """
+
+        routes = {}
+        for container, (module_name, module_type) in sw_telemetry._ch_unique_containers:
+            routes[(module_name, module_type, None)] = MockSwitch._get_response(container)
+        for container, (module_name, module_type) in sw_telemetry._vf_unique_containers:
+            for vf_id, vf_container in container.items():
+                # 'vf-id' parameter is not sent if VF mode is disabled or there is the single virtual switch
+                routes[(module_name, module_type, vf_id if len(container) > 1 else None)] = MockSwitch._get_response(vf_container)
+        return routes
+
+
+    @staticmethod
+    def _get_response(container: dict) -> tuple:
+        """Function converts module container to the status code and json response body."""
+
+        status_code = container.get('status-code') or FAILED_STATUS_CODE
+        body = {key: value for key, value in container.items() if key not in REQUEST_KEYS}
+        return status_code, json.dumps(body).encode()
+
+
+    def start(self) -> None:
+        """Function starts the server thread."""
+
+        self._server = ThreadingHTTPServer((self.sw_ipaddress, self._port), MockSwitchHandler)
+        # port selected by the OS
+        self._port = self._server.server_address[1]
+        self._server.daemon_threads = True
+        self._server.mock_switch = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+
+    def stop(self) -> None:
+        """Function stops the server."""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+    def revoke_tokens(self) -> None:
+        """Function revokes all session tokens (switch session expired)."""
+
+        with self._lock:
+            self._tokens.clear()
+
+
+    def reset_stats(self) -> None:
+        """Function resets server statistics."""
+
+        with self._lock:
+            self._stats = dict.fromkeys(self._stats, 0)
+            self._connections.clear()
+
+
+    def login(self, authorization: str) -> Optional[str]:
+        """Function creates session token if credentials are valid and logins are not rejected.
+
+        Args:
+            authorization (str): Authorization header of the login request.
+
+        Returns:
+            Optional[str]: session token. None if login is rejected.
+        """
+
+        with self._lock:
+            if self.reject_logins or not self._check_credentials(authorization):
+                self._stats['rejected-logins'] += 1
+                return
+            self._stats['logins'] += 1
+            self._login_number += 1
+            token = 'Custom_Basic ' + base64.b64encode(f'{self._username}:session-{self._login_number}'.encode()).decode()
+            self._tokens.add(token)
+            return token
+
+
+    def logout(self, authorization: str) -> bool:
+        """Function revokes session token of the logout request.
+
+        Returns:
+            bool: True if token is valid.
+        """
+
+        with self._lock:
+            if authorization not in self._tokens:
+                return False
+            self._stats['logouts'] += 1
+            self._tokens.discard(authorization)
+            return True
+
+
+    def get_module(self, path: str, authorization: str, client_address: tuple) -> tuple:
+        """Function returns module response of the GET request after the latency delay.
+
+        Args:
+            path (str): request path with the query string.
+            authorization (str): Authorization header of the request.
+            client_address (tuple): client address of the request connection.
+
+        Returns:
+            tuple: status code and json response body.
+        """
+
+        with self._lock:
+            self._connections.add(client_address)
+            if not (authorization in self._tokens or self._check_credentials(authorization)):
+                self._stats['rejected-requests'] += 1
+                return 401, json.dumps({'errors': {'error': [{'error-message': 'Unauthorized'}]}}).encode()
+            if authorization.startswith('Basic '):
+                self._stats['basic-auth-requests'] += 1
+            self._stats['module-requests'] += 1
+            self._active_requests += 1
+            self._stats['max-concurrent-requests'] = max(self._stats['max-concurrent-requests'], self._active_requests)
+        try:
+            time.sleep(self.latency)
+            url = urlsplit(path)
+            _, _, _, module_name, module_type = url.path.rstrip('/').split('/')[:5]
+            vf_id = parse_qs(url.query).get('vf-id')
+            route = (module_name, module_type, int(vf_id[0]) if vf_id else None)
+            if route not in self._routes:
+                return 404, json.dumps({'errors': {'error': [{'error-message': 'Not Found'}]}}).encode()
+            return self._routes[route]
+        finally:
+            with self._lock:
+                self._active_requests -= 1
+
+
+    def _check_credentials(self, authorization: str) -> bool:
+        """Function checks basic auth credentials."""
+
+        credentials = base64.b64encode(f'{self._username}:{self._password}'.encode()).decode()
+        return authorization == 'Basic ' + credentials
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}, port: {self.port}"
+
+
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
+    @property
+    def port(self):
+        return self._port
+
+
+    @property
+    def username(self):
+        return self._username
+
+
+    @property
+    def password(self):
+        return self._password
+
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'tcp-connections': len(self._connections)}
+
+
+    @property
+    def tokens(self):
+        with self._lock:
+            return set(self._tokens)
+
+
+class MockSwitchHandler(BaseHTTPRequestHandler):
+    """Request handler of the MockSwitch server (keep-alive connections)."""
+
+    protocol_version = 'HTTP/1.1'
+    # response headers and body are written separately
+    disable_nagle_algorithm = True
+
+
+    def do_GET(self):
+        status_code, body = self.server.mock_switch.get_module(self.path, self.headers.get('Authorization', ''),
+                                                               self.client_address)
+        self._send(status_code, body)
+
+
+    def do_POST(self):
+        mock_switch = self.server.mock_switch
+        authorization = self.headers.get('Authorization', '')
+        if self.path.startswith('/rest/login'):
+            token = mock_switch.login(authorization)
+            if token is None:
+                self._send(401, json.dumps({'errors': {'error': [{'error-message': 'Login failed'}]}}).encode())
+            else:
+                self._send(200, b'', {'Authorization': token})
+        elif self.path.startswith('/rest/logout'):
+            self._send(204 if mock_switch.logout(authorization) else 401, b'')
+        else:
+            self._send(404, b'')
+
+
+    def _send(self, status_code: int, body: bytes, headers: dict = None) -> None:
+        """Function sends response with the json body."""
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/yang-data+json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, *args):
+        pass
@@ -0,0 +1,173 @@
+"""
+Port records memory benchmark of the fc port parameters, fc port statistics and sfp media parsers.
+Ports of the archived switch telemetry (database/archive) are replicated to PORTS_NUMBER ports
+of the first logical switch. Memory (tracemalloc) held by the port containers
+(fcport_params, fcport_stats and sfp_media) of a number of parser sets is measured
+for the port records and for the same ports converted to the port dictionaries
+(port parameters are copied to each fc port statistics and sfp media dictionary).
+
+Usage: python port_record_benchmark.py <previous telemetry pickle file> <current telemetry pickle file> [parser sets number]
+Telemetry pickled by the earlier collector versions (drafts/storage) is loaded as well.
+"""
+
+import copy
+import gc
+import os
+import pickle
+import sys
+import tracemalloc
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the parser module in the parent
+from collection.switch_telemetry_request import SwitchTelemetryRequest
+from parser.brocade_parser import BrocadeParser
+
+PORTS_NUMBER = 512
+PARSER_SETS_NUMBER = 5
+# ports number of the replicated slot
+SLOT_PORTS_NUMBER = 64
+MODES = ['dicts', 'records']
+# parser and port container attribute pairs
+PORT_CONTAINERS = [('fcport_params_parser', 'fcport_params'),
+                   ('fcport_stats_parser', 'fcport_stats'),
+                   ('sfp_media_parser', 'sfp_media')]
+# module and class of the switch telemetry pickled by the earlier collector versions (drafts/storage)
+LEGACY_TELEMETRY_CLASSES = [('switch_telemetry_httpx_cls', 'BrocadeSwitchTelemetry')]
+# SwitchTelemetryRequest attributes absent in the legacy telemetry
+LEGACY_TELEMETRY_DEFAULTS = {'_username': None, '_password': None, '_rest_port': None, '_async_mode': False,
+                             '_max_concurrent_requests': SwitchTelemetryRequest.MAX_CONCURRENT_REQUESTS,
+                             '_corrupted_request': False}
+
+
+class TelemetryUnpickler(pickle.Unpickler):
+    """Unpickler loads the legacy switch telemetry as SwitchTelemetryRequest 
+    (legacy telemetry module is not required on the path)."""
+
+    def find_class(self, module, name):
+        if (module, name) in LEGACY_TELEMETRY_CLASSES:
+            return SwitchTelemetryRequest
+        return super().find_class(module, name)
+
+
+def load_telemetry(telemetry_filename: str):
+    """Function loads archived switch telemetry. 
+    Legacy telemetry attributes are renamed and absent attributes are added with the default values."""
+
+    with open(telemetry_filename, 'rb') as file:
+        sw_telemetry = TelemetryUnpickler(file).load()
+    # legacy telemetry access protocol attribute
+    if '_secure_login' in vars(sw_telemetry):
+        sw_telemetry._secure_access = vars(sw_telemetry).pop('_secure_login')
+    for attr_name, value in LEGACY_TELEMETRY_DEFAULTS.items():
+        vars(sw_telemetry).setdefault(attr_name, value)
+    return sw_telemetry
+
+
+def replicate_ports(sw_telemetry, ports_number: int):
+    """Function replicates fc interface, fc statistics and media rdp port containers of the first logical switch
+    to the ports_number ports (slot_port numbers are SLOT_PORTS_NUMBER ports per slot).
+    Other logical switches are removed.
+
+    Args:
+        sw_telemetry (SwitchTelemetryRequest): archived switch telemetry.
+        ports_number (int): number of ports.
+
+    Returns:
+        SwitchTelemetryRequest: switch telemetry copy with the replicated ports.
+    """
+
+    sw_telemetry = copy.deepcopy(sw_telemetry)
+    vf_id = next(vf_id for vf_id, container in sw_telemetry.fc_interface.items() if container.get('Response'))
+    for container_name, leaf, protocol in [('fc_interface', 'fibrechannel', ''),
+                                           ('fc_statistics', 'fibrechannel-statistics', ''),
+                                           ('media_rdp', 'media-rdp', 'fc/')]:
+        vfid_containers = getattr(sw_telemetry, container_name)
+        port_containers = vfid_containers[vf_id]['Response'][leaf]
+        replicated_containers = []
+        for i in range(ports_number):
+            port_container = copy.deepcopy(port_containers[i % len(port_containers)])
+            port_container['name'] = f'{protocol}{i // SLOT_PORTS_NUMBER}/{i % SLOT_PORTS_NUMBER}'
+            replicated_containers.append(port_container)
+        vfid_containers[vf_id]['Response'][leaf] = replicated_containers
+        for other_vf_id in [other_vf_id for other_vf_id in vfid_containers if other_vf_id != vf_id]:
+            del vfid_containers[other_vf_id]
+    return sw_telemetry
+
+
+def get_port_containers(brocade_parser: BrocadeParser, mode: str) -> list:
+    """Function returns port containers of the parser set.
+    Port records are converted to the port dictionaries in the 'dicts' mode."""
+
+    port_containers = []
+    for parser_name, container_name in PORT_CONTAINERS:
+        ports_dct = getattr(getattr(brocade_parser, parser_name), container_name)
+        if mode == 'dicts':
+            ports_dct = {vf_id: {slot_port: dict(port_record) for slot_port, port_record in ports_vfid_dct.items()}
+                         for vf_id, ports_vfid_dct in ports_dct.items()}
+        port_containers.append(ports_dct)
+    return port_containers
+
+
+def measure_mode(sw_telemetry_prev, sw_telemetry_now, mode: str, parser_sets_number: int) -> int:
+    """Function builds parser sets and measures memory held by their port containers.
+
+    Args:
+        sw_telemetry_prev (SwitchTelemetryRequest): previous switch telemetry (counters delta is calculated).
+        sw_telemetry_now (SwitchTelemetryRequest): current switch telemetry.
+        mode (str): 'records' - port records, 'dicts' - port dictionaries.
+        parser_sets_number (int): number of parser sets to build.
+
+    Returns:
+        int: memory held by the port containers of the single parser set (bytes).
+    """
+
+    brocade_parser_prev = BrocadeParser(sw_telemetry_prev).get_snapshot()
+    parser_sets = []
+    gc.collect()
+    tracemalloc.start()
+    memory_start, _ = tracemalloc.get_traced_memory()
+    for _ in range(parser_sets_number):
+        brocade_parser = BrocadeParser(sw_telemetry_now, brocade_parser_prev)
+        brocade_parser.build_all()
+        parser_sets.append(get_port_containers(brocade_parser, mode))
+        del brocade_parser
+    gc.collect()
+    memory_end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (memory_end - memory_start) // parser_sets_number
+
+
+def run_benchmark(sw_telemetry_prev, sw_telemetry_now, parser_sets_number: int) -> None:
+    """Function prints memory held by the port containers of the port dictionaries and port records."""
+
+    sw_telemetry_prev = replicate_ports(sw_telemetry_prev, PORTS_NUMBER)
+    sw_telemetry_now = replicate_ports(sw_telemetry_now, PORTS_NUMBER)
+    # class keys of the port records are added before the measurement
+    measure_mode(sw_telemetry_prev, sw_telemetry_now, 'records', 1)
+
+    results = {mode: measure_mode(sw_telemetry_prev, sw_telemetry_now, mode, parser_sets_number) for mode in MODES}
+    print(f"Ports: {PORTS_NUMBER}, parser sets: {parser_sets_number}")
+    for mode in MODES:
+        print(f"{mode:>10}: {results[mode] / 1024:10.1f} KiB per parser set, {results[mode] * 100 / PORTS_NUMBER / 1024:10.1f} KiB per 100 ports")
+    reduction = results['dicts'] - results['records']
+    print(f"{'reduction':>10}: {reduction / 1024:10.1f} KiB per parser set, {reduction * 100 / PORTS_NUMBER / 1024:10.1f} KiB per 100 ports "
+          f"({reduction / results['dicts']:.0%})")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    parser_sets_number = int(sys.argv[3]) if len(sys.argv) > 3 else PARSER_SETS_NUMBER
+    run_benchmark(load_telemetry(sys.argv[1]), load_telemetry(sys.argv[2]), parser_sets_number)
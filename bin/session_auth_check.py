@@ -0,0 +1,131 @@
+"""
+Session auth mode check of the SwitchSession against the local mock switch (mock_switch.py).
+Mock switch serves module responses of the archived switch telemetry (database/archive).
+Telemetry is collected through the long-lived 'session' auth mode switch session and the checks are:
+    - single login is reused by all requests and cycles (sync and async modes);
+    - session is logged in once again after the switch revoked the session token (401);
+    - failed login is not repeated during the LOGIN_HOLDOFF time and session is logged in after the holdoff;
+    - session is logged out when the switch session is closed.
+Each check result is printed. Exit code is 1 if any check failed.
+
+Usage: python session_auth_check.py <telemetry pickle file> [mock switch port]
+Mock switch listens on the loopback address and the free port if mock switch port is not set.
+Telemetry pickled by the earlier collector versions (drafts/storage) is loaded as well.
+Check takes LOGIN_HOLDOFF time (sec) waiting for the login holdoff expiration.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# getting the name of the directory
+# where the this file is present.
+current = os.path.dirname(os.path.realpath(__file__))
+
+# Getting the parent directory name
+# where the current directory is present.
+parent = os.path.dirname(current)
+
+# adding the parent directory to
+# the sys.path.
+sys.path.append(parent)
+
+# now we can import the collection module in the parent
+from bin.mock_switch import MOCK_SWITCH_PORT, MockSwitch
+from bin.port_record_benchmark import load_telemetry
+from collection.switch_session import SwitchSession
+from collection.switch_telemetry_request import SwitchTelemetryRequest
+
+
+def collect_telemetry(mock_switch: MockSwitch, session: SwitchSession, async_mode: bool) -> SwitchTelemetryRequest:
+    """Function collects switch telemetry of the single polling cycle through the session."""
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SwitchTelemetryRequest(mock_switch.sw_ipaddress, mock_switch.username, mock_switch.password,
+                                      async_mode=async_mode, session=session, rest_port=mock_switch.port)
+
+
+def print_check(check_results: list, name: str, passed: bool, details: str) -> None:
+    """Function prints check result and saves it to the check_results list."""
+
+    check_results.append(passed)
+    print(f"{'passed' if passed else 'FAILED':>6}  {name}: {details}")
+
+
+def run_checks(sw_telemetry, port: int = MOCK_SWITCH_PORT) -> bool:
+    """Function runs session auth mode checks against the mock switch.
+
+    Args:
+        sw_telemetry (SwitchTelemetryRequest): archived switch telemetry mock switch serves.
+        port (int): mock switch port. Defaults to MOCK_SWITCH_PORT (free port).
+
+    Returns:
+        bool: True if all checks passed.
+    """
+
+    check_results = []
+    with MockSwitch(sw_telemetry, port=port) as mock_switch:
+        session = SwitchSession(mock_switch.sw_ipaddress, mock_switch.username, mock_switch.password, 
+                                auth_mode='session', rest_port=mock_switch.port)
+
+        # single login is reused by the requests and cycles
+        corrupted = [collect_telemetry(mock_switch, session, async_mode).corrupted_request for async_mode in [False, True, True]]
+        stats = mock_switch.stats
+        print_check(check_results, 'login reused',
+                    stats['logins'] == 1 and session.pool_stats['logins'] == 1
+                    and stats['basic-auth-requests'] == 0 and not any(corrupted),
+                    f"3 cycles, {stats['module-requests']} module requests, {stats['logins']} login(s), "
+                    f"{stats['basic-auth-requests']} basic auth requests, corrupted cycles {corrupted}")
+
+        # session is logged in again after the switch revoked the token
+        for async_mode in [True, False]:
+            mock_switch.reset_stats()
+            mock_switch.revoke_tokens()
+            sw_telemetry_now = collect_telemetry(mock_switch, session, async_mode)
+            stats = mock_switch.stats
+            print_check(check_results, f"re-login after token revoked ({'async' if async_mode else 'sync'})",
+                        stats['logins'] == 1 and stats['rejected-requests'] >= 1 and not sw_telemetry_now.corrupted_request,
+                        f"{stats['rejected-requests']} request(s) rejected with 401, {stats['logins']} login(s), "
+                        f"corrupted {sw_telemetry_now.corrupted_request}")
+
+        # failed login is not repeated during the holdoff time
+        mock_switch.reset_stats()
+        mock_switch.revoke_tokens()
+        mock_switch.reject_logins = True
+        login_failure_time = time.monotonic()
+        corrupted = [collect_telemetry(mock_switch, session, async_mode).corrupted_request for async_mode in [False, True]]
+        stats = mock_switch.stats
+        print_check(check_results, 'login holdoff',
+                    stats['rejected-logins'] == 1 and stats['logins'] == 0 and all(corrupted),
+                    f"2 cycles with the rejected login, {stats['rejected-logins']} login attempt(s), corrupted cycles {corrupted}")
+
+        # session is logged in once the holdoff time expired
+        mock_switch.reject_logins = False
+        time.sleep(max(0, login_failure_time + SwitchSession.LOGIN_HOLDOFF - time.monotonic()))
+        mock_switch.reset_stats()
+        sw_telemetry_now = collect_telemetry(mock_switch, session, True)
+        stats = mock_switch.stats
+        print_check(check_results, 'login after holdoff',
+                    stats['logins'] == 1 and not sw_telemetry_now.corrupted_request,
+                    f"{stats['logins']} login(s) after {SwitchSession.LOGIN_HOLDOFF}s holdoff, "
+                    f"corrupted {sw_telemetry_now.corrupted_request}")
+
+        # session is logged out when closed
+        mock_switch.reset_stats()
+        with contextlib.redirect_stdout(io.StringIO()):
+            session.close()
+        stats = mock_switch.stats
+        print_check(check_results, 'logout on close',
+                    stats['logouts'] == 1 and not mock_switch.tokens,
+                    f"{stats['logouts']} logout(s), {len(mock_switch.tokens)} active token(s)")
+    return all(check_results)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else MOCK_SWITCH_PORT
+    sys.exit(0 if run_checks(load_telemetry(sys.argv[1]), port) else 1)
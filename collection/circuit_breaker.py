@@ -0,0 +1,180 @@
+import random
+import time
+from typing import Optional
+
+from prometheus_client import CollectorRegistry, Gauge
+
+
+class CircuitBreaker:
+    """
+    Class to stop polling of the unreachable switch.
+    Breaker is opened after failure_threshold consecutive polling cycles the switch is unreachable.
+    While breaker is open switch is not polled and only probed (single chassis request) with exponential backoff
+    (base backoff doubled after each failed probe till max backoff) plus random jitter (0 - jitter share of the backoff).
+    Breaker is half-open while probe is performed. Successful probe closes breaker and full polling is resumed.
+
+    Breaker states: 'closed' - switch is polled, 'open' - switch is not polled, 'half_open' - switch is probed.
+
+    Attributes:
+        failure_threshold (int): number of consecutive failed cycles to open breaker.
+        base_backoff (float): delay before the first probe (sec).
+        max_backoff (float): maximum delay between probes (sec).
+        jitter (float): maximum random extension of the probe delay (share of the backoff).
+        registry (CollectorRegistry): prometheus registry of the breaker metrics. None if metrics are not exported.
+        state (str): breaker state.
+        failure_count (int): number of consecutive failures.
+        next_probe_time (float): unix time of the next probe. None if breaker is closed.
+    """
+
+    STATES = {'closed': 0, 'open': 1, 'half_open': 2}
+
+    FAILURE_THRESHOLD = 3
+    MAX_BACKOFF = 900
+    JITTER = 0.2
+
+
+    def __init__(self, base_backoff: float, failure_threshold: int = FAILURE_THRESHOLD, max_backoff: float = MAX_BACKOFF,
+                 jitter: float = JITTER, registry: Optional[CollectorRegistry] = None):
+        """
+        Args:
+            base_backoff (float): delay before the first probe (sec).
+            failure_threshold (int): number of consecutive failed cycles to open breaker. Defaults to FAILURE_THRESHOLD.
+            max_backoff (float): maximum delay between probes (sec). Defaults to MAX_BACKOFF.
+            jitter (float): maximum random extension of the probe delay (share of the backoff). Defaults to JITTER.
+            registry (CollectorRegistry, optional): prometheus registry to export breaker state, failure count
+                and next probe time. Defaults to None (metrics are not exported).
+        """
+
+        self._base_backoff = base_backoff
+        self._failure_threshold = failure_threshold
+        self._max_backoff = max_backoff
+        self._jitter = jitter
+        self._registry = registry
+
+        self._state = 'closed'
+        self._failure_count = 0
+        # current backoff (doubled after each failed probe)
+        self._backoff = base_backoff
+        # next probe time (monotonic)
+        self._next_probe_deadline = None
+        # next probe time (wall clock)
+        self._next_probe_time = None
+
+        if self.registry is not None:
+            self._gauge_state = Gauge('collector_circuit_breaker_state',
+                                      f'Switch circuit breaker state {CircuitBreaker.STATES}.', registry=self.registry)
+            self._gauge_failures = Gauge('collector_circuit_breaker_failures',
+                                         'Number of consecutive polling cycles switch is unreachable.', registry=self.registry)
+            self._gauge_next_probe = Gauge('collector_circuit_breaker_next_probe_timestamp_seconds',
+                                           'Unix time of the next switch probe (0 if breaker is closed).', registry=self.registry)
+            self._set_metrics()
+
+
+    def is_probe_due(self) -> bool:
+        """Method checks if open breaker backoff is expired. Breaker is switched to the half-open state if probe is due.
+
+        Returns:
+            bool: True if switch need to be probed.
+        """
+
+        if self.state == 'open' and time.monotonic() >= self._next_probe_deadline:
+            self._state = 'half_open'
+            self._set_metrics()
+        return self.state == 'half_open'
+
+
+    def record_success(self) -> None:
+        """Method closes breaker after successful cycle or probe."""
+
+        if self.state != 'closed':
+            print('Circuit breaker closed, polling resumed')
+        self._state = 'closed'
+        self._failure_count = 0
+        self._backoff = self.base_backoff
+        self._next_probe_deadline = None
+        self._next_probe_time = None
+        self._set_metrics()
+
+
+    def record_failure(self) -> None:
+        """Method counts failed cycle or probe.
+        Breaker is opened if failure threshold is reached or probe is failed.
+        Backoff is doubled after each failed probe.
+        """
+
+        self._failure_count += 1
+        if self.state == 'half_open':
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+            self._open()
+        elif self.state == 'closed' and self.failure_count >= self.failure_threshold:
+            self._open()
+        self._set_metrics()
+
+
+    def _open(self) -> None:
+        """Method opens breaker and schedules next probe after the backoff with jitter."""
+
+        delay = self._backoff + random.uniform(0, self.jitter * self._backoff)
+        self._state = 'open'
+        self._next_probe_deadline = time.monotonic() + delay
+        self._next_probe_time = time.time() + delay
+        print(f'Circuit breaker open, {self.failure_count} failure(s), next probe in {delay:.0f} sec')
+
+
+    def _set_metrics(self) -> None:
+        """Method updates breaker metrics."""
+
+        if self.registry is None:
+            return
+        self._gauge_state.set(CircuitBreaker.STATES[self.state])
+        self._gauge_failures.set(self.failure_count)
+        self._gauge_next_probe.set(self.next_probe_time or 0)
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} state: {self.state}, failure_count: {self.failure_count}"
+
+
+    @property
+    def base_backoff(self):
+        return self._base_backoff
+
+
+    @property
+    def failure_threshold(self):
+        return self._failure_threshold
+
+
+    @property
+    def max_backoff(self):
+        return self._max_backoff
+
+
+    @property
+    def jitter(self):
+        return self._jitter
+
+
+    @property
+    def registry(self):
+        return self._registry
+
+
+    @property
+    def state(self):
+        return self._state
+
+
+    @property
+    def is_closed(self):
+        return self._state == 'closed'
+
+
+    @property
+    def failure_count(self):
+        return self._failure_count
+
+
+    @property
+    def next_probe_time(self):
+        return self._next_probe_time
@@ -0,0 +1,180 @@
+import math
+import random
+import threading
+import time
+from typing import Optional
+
+from prometheus_client import CollectorRegistry, Counter, Gauge
+
+
+class CycleScheduler:
+    """
+    Class to schedule switch polling cycles on the fixed time grid.
+    Cycle deadlines are calculated with monotonic clock as grid start plus multiple of the time interval
+    so cycle duration and sleep inaccuracy are not accumulated (no cadence drift).
+    Grid is aligned to the wall clock multiple of the time interval (cycles of the different switches start simultaneously).
+    Optional random jitter (0 - jitter sec) delays each cycle start without grid shift.
+
+    If cycle duration exceeds time interval (overrun) next cycle is started according to the overrun policy:
+    'skip' - missed grid deadlines are skipped and next cycle starts at the next grid deadline,
+    'catch_up' - next cycle starts immediately (single catch-up cycle for all missed deadlines) and grid is kept.
+
+    Attributes:
+        time_interval (float): cycle interval (sec).
+        overrun_policy (str): 'skip' or 'catch_up'.
+        jitter (float): maximum random delay of the cycle start (sec).
+        registry (CollectorRegistry): prometheus registry of the cycle metrics. None if metrics are not exported.
+        overrun_count (int): number of missed grid deadlines.
+    """
+
+    OVERRUN_POLICIES = ['skip', 'catch_up']
+
+
+    def __init__(self, time_interval: float, overrun_policy: str = 'skip', jitter: float = 0,
+                 registry: Optional[CollectorRegistry] = None, stop_event: threading.Event = None):
+        """
+        Args:
+            time_interval (float): cycle interval (sec).
+            overrun_policy (str): 'skip' or 'catch_up'. Defaults to 'skip'.
+            jitter (float): maximum random delay of the cycle start (sec). Defaults to 0.
+            registry (CollectorRegistry, optional): prometheus registry to export overrun count,
+                cycle lag and duration metrics. Defaults to None (metrics are not exported).
+            stop_event (threading.Event, optional): event to interrupt waiting for the next cycle. Defaults to None.
+        """
+
+        if overrun_policy not in CycleScheduler.OVERRUN_POLICIES:
+            raise ValueError(f"Invalid overrun policy '{overrun_policy}'. "
+                             f"Valid policies are {', '.join(CycleScheduler.OVERRUN_POLICIES)}")
+
+        self._time_interval = time_interval
+        self._overrun_policy = overrun_policy
+        self._jitter = jitter
+        self._registry = registry
+        self._stop_event = stop_event if stop_event is not None else threading.Event()
+
+        # grid deadline of the current cycle (monotonic)
+        self._cycle_deadline = None
+        # jitter of the current cycle
+        self._cycle_jitter = 0
+        # start time of the current cycle (monotonic)
+        self._cycle_start_time = None
+        # grid is aligned to the wall clock after the first cycle
+        self._grid_aligned = False
+        self._overrun_count = 0
+
+        if self.registry is not None:
+            self._counter_overrun = Counter('collector_cycle_overruns', 'Number of missed polling cycle deadlines.',
+                                            registry=self.registry)
+            self._gauge_lag = Gauge('collector_cycle_lag_seconds', 'Polling cycle start delay after the grid deadline.',
+                                    registry=self.registry)
+            self._gauge_duration = Gauge('collector_cycle_duration_seconds', 'Polling cycle duration.',
+                                         registry=self.registry)
+            self._gauge_interval = Gauge('collector_cycle_interval_seconds', 'Polling cycle interval.',
+                                         registry=self.registry)
+            self._gauge_interval.set(self.time_interval)
+
+
+    def start_cycle(self) -> None:
+        """Method saves cycle start time and cycle lag (delay after the grid deadline).
+        First cycle is started immediately.
+        """
+
+        self._cycle_start_time = time.monotonic()
+        if self._cycle_deadline is None:
+            self._cycle_deadline = self._cycle_start_time
+        cycle_lag = max(self._cycle_start_time - self._cycle_deadline - self._cycle_jitter, 0)
+        if self.registry is not None:
+            self._gauge_lag.set(cycle_lag)
+
+
+    def finish_cycle(self) -> bool:
+        """Method saves cycle duration, calculates next cycle deadline according to the overrun policy
+        and waits till next cycle deadline.
+
+        Returns:
+            bool: False if waiting was interrupted by the stop event, True otherwise.
+        """
+
+        finish_time = time.monotonic()
+        if self.registry is not None:
+            self._gauge_duration.set(finish_time - self._cycle_start_time)
+
+        self._cycle_deadline = self._get_next_deadline(finish_time)
+        self._cycle_jitter = random.uniform(0, self.jitter) if self.jitter else 0
+        delay = self._cycle_deadline + self._cycle_jitter - time.monotonic()
+        # wait returns True if stop event is set
+        return not self._stop_event.wait(max(delay, 0))
+
+
+    def _get_next_deadline(self, finish_time: float) -> float:
+        """Method calculates next cycle grid deadline.
+        Grid is aligned to the wall clock after the first cycle.
+
+        Args:
+            finish_time (float): current cycle finish time (monotonic).
+
+        Returns:
+            float: next cycle deadline (monotonic).
+        """
+
+        # first cycle was started immediately, 
+        # next cycle starts at the wall clock multiple of the time interval
+        if not self._grid_aligned:
+            self._grid_aligned = True
+            return finish_time + self.time_interval - time.time() % self.time_interval
+
+        next_deadline = self._cycle_deadline + self.time_interval
+        # cycle overrun
+        if finish_time > next_deadline:
+            missed_deadlines = math.ceil((finish_time - next_deadline) / self.time_interval)
+            self._overrun_count += missed_deadlines
+            if self.registry is not None:
+                self._counter_overrun.inc(missed_deadlines)
+            print(f'Cycle overrun: {missed_deadlines} deadline(s) missed, overrun policy: {self.overrun_policy}')
+            if self.overrun_policy == 'skip':
+                # next cycle starts at the next grid deadline
+                next_deadline += missed_deadlines * self.time_interval
+            else:
+                # next cycle starts immediately at the last missed grid deadline
+                next_deadline += (missed_deadlines - 1) * self.time_interval
+        return next_deadline
+
+
+    def stop(self) -> None:
+        """Method interrupts waiting for the next cycle."""
+
+        self._stop_event.set()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} time_interval: {self.time_interval}, overrun_policy: {self.overrun_policy}"
+
+
+    @property
+    def time_interval(self):
+        return self._time_interval
+
+
+    @property
+    def overrun_policy(self):
+        return self._overrun_policy
+
+
+    @property
+    def jitter(self):
+        return self._jitter
+
+
+    @property
+    def registry(self):
+        return self._registry
+
+
+    @property
+    def overrun_count(self):
+        return self._overrun_count
+
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
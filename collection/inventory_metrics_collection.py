@@ -0,0 +1,133 @@
+import atexit
+import importlib
+import signal
+import sys
+from typing import Dict
+
+from prometheus_client import CollectorRegistry
+
+import config.http_ports
+import config.switch_access
+import config.switch_names
+from collection.cycle_scheduler import CycleScheduler
+from collection.switch_metrics_collection import TIME_INTERVAL, SwitchCollector, prepare_database
+
+
+def collect_inventory_metrics() -> None:
+    """Function polls all switches from the inventory concurrently in the single process.
+    Each switch has its own collector (switch session, parsers, switch log and dashboard) running in the separate thread
+    with its own polling cycle and prometheus registry exposed on the switch http port (HTTP_SERVER_PORT).
+    Inventory is rebuilt from the configuration files each TIME_INTERVAL so switches
+    are added or removed without restart. Stopped collectors are restarted.
+    """
+
+    # create nameserver, archive and switch log folders in the database if not exist
+    prepare_database()
+
+    # switch ip address and switch collector pairs
+    sw_collectors: Dict[str, SwitchCollector] = {}
+    # close switch sessions (logout and close connections) on shutdown
+    atexit.register(close_collectors, sw_collectors)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    inventory_scheduler = CycleScheduler(TIME_INTERVAL)
+    # check inventory in infinite loop
+    while True:
+        inventory_scheduler.start_cycle()
+        # add new, remove deleted and restart modified or stopped switch collectors
+        update_collectors(sw_collectors, get_switch_inventory())
+        inventory_scheduler.finish_cycle()
+
+
+def get_switch_inventory() -> Dict[str, dict]:
+    """Function reloads configuration files and builds switch inventory.
+    Inventory contains switches which have both access details (SWITCH_ACCESS)
+    and http server port (HTTP_SERVER_PORT) configured.
+
+    Returns:
+        Dict[str, dict]: switch ip address and switch details (switch-name, switch-access, http-port) pairs.
+    """
+
+    # configuration files are reloaded to apply changes without restart
+    for config_module in [config.switch_access, config.http_ports, config.switch_names]:
+        importlib.reload(config_module)
+
+    sw_inventory = {}
+    for sw_ipaddress, sw_access in config.switch_access.SWITCH_ACCESS.items():
+        if sw_ipaddress not in config.http_ports.HTTP_SERVER_PORT:
+            print(sw_ipaddress, 'http server port is not configured')
+            continue
+        sw_inventory[sw_ipaddress] = {
+            'switch-name': config.switch_names.SWITCH_NAME.get(sw_ipaddress, sw_ipaddress),
+            'switch-access': sw_access,
+            'http-port': config.http_ports.HTTP_SERVER_PORT[sw_ipaddress]
+            }
+    return sw_inventory
+
+
+def update_collectors(sw_collectors: Dict[str, SwitchCollector], sw_inventory: Dict[str, dict]) -> None:
+    """Function synchronizes switch collectors with the inventory.
+    Collectors of the removed or modified switches and stopped collectors (failed threads) are closed.
+    Collectors of the new, modified switches and stopped collectors are started.
+
+    Args:
+        sw_collectors (Dict[str, SwitchCollector]): switch ip address and switch collector pairs.
+        sw_inventory (Dict[str, dict]): switch ip address and switch details pairs.
+    """
+
+    for sw_ipaddress, sw_collector in list(sw_collectors.items()):
+        sw_details = sw_inventory.get(sw_ipaddress)
+        if sw_details is None or get_collector_details(sw_collector) != sw_details or not sw_collector.is_alive:
+            if sw_details is None:
+                print(sw_ipaddress, 'removed from the inventory')
+            elif not sw_collector.is_alive:
+                print(sw_ipaddress, 'collector stopped')
+            else:
+                print(sw_ipaddress, 'modified in the inventory')
+            sw_collector.close()
+            del sw_collectors[sw_ipaddress]
+
+    for sw_ipaddress, sw_details in sw_inventory.items():
+        if sw_ipaddress in sw_collectors:
+            continue
+        print(sw_ipaddress, 'added to the inventory')
+        # each switch has its own registry to avoid gauge names collision
+        sw_collector = SwitchCollector(sw_ipaddress, sw_details['switch-name'], sw_details['switch-access'],
+                                       sw_details['http-port'], CollectorRegistry())
+        try:
+            sw_collector.start()
+        except OSError as error:
+            # http port is busy, collector start is repeated next cycle
+            print(sw_ipaddress, 'collector start failed', str(error))
+            sw_collector.close()
+            continue
+        sw_collector.start_thread()
+        sw_collectors[sw_ipaddress] = sw_collector
+
+
+def get_collector_details(sw_collector: SwitchCollector) -> dict:
+    """Function returns switch details of the running collector in the inventory format.
+
+    Args:
+        sw_collector (SwitchCollector): switch collector.
+
+    Returns:
+        dict: switch details (switch-name, switch-access, http-port).
+    """
+
+    return {
+        'switch-name': sw_collector.initiator_filename,
+        'switch-access': sw_collector.sw_access,
+        'http-port': sw_collector.http_port_number
+        }
+
+
+def close_collectors(sw_collectors: Dict[str, SwitchCollector]) -> None:
+    """Function closes all switch collectors.
+
+    Args:
+        sw_collectors (Dict[str, SwitchCollector]): switch ip address and switch collector pairs.
+    """
+
+    for sw_collector in sw_collectors.values():
+        sw_collector.close()
@@ -0,0 +1,217 @@
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+
+class ModuleScheduler:
+    """
+    Class to schedule switch modules requests.
+    Each module (module name, module type) has its own polling interval.
+    Switch polling cycle interval is the minimum module interval.
+    Last good response of each module container is saved and reused between module refreshes.
+    Reused response gets current cycle date and time (timestamps parsers rely on)
+    while the original retrieval date and time are kept in 'retrieved-date', 'retrieved-time' keys.
+    Request latency of each module container is tracked as exponentially weighted moving average 
+    to budget module timeouts within the polling cycle.
+    Last good response of the failed module is served (stale) till its age exceeds max_stale_intervals module intervals.
+
+    Attributes:
+        module_intervals (dict): module (module name, module type) and polling interval pairs.
+        default_interval (int): polling interval of the modules missing in module_intervals.
+        max_stale_intervals (int): number of module intervals last good response of the failed module is served for.
+        cycle_interval (int): switch polling cycle interval.
+    """
+
+    # weight of the last request latency in the moving average
+    LATENCY_SMOOTHING = 0.3
+    # number of module intervals last good response of the failed module is served for
+    MAX_STALE_INTERVALS = 3
+
+
+    def __init__(self, module_intervals: Dict[Tuple[str, str], int], default_interval: int, 
+                 max_stale_intervals: int = None):
+        """
+        Args:
+            module_intervals (dict): module (module name, module type) and polling interval pairs.
+            default_interval (int): polling interval of the modules missing in module_intervals.
+            max_stale_intervals (int): number of module intervals last good response of the failed module is served for.
+                Defaults to MAX_STALE_INTERVALS.
+        """
+
+        self._module_intervals = dict(module_intervals)
+        self._default_interval = default_interval
+        self._max_stale_intervals = max_stale_intervals if max_stale_intervals is not None else ModuleScheduler.MAX_STALE_INTERVALS
+        self._cycle_interval = min([default_interval, *self._module_intervals.values()])
+        # (module_name, module_type, container_key) and (retrieval time, telemetry) pairs
+        self._saved_telemetry = {}
+        # (module_name, module_type, container_key) and request latency moving average pairs
+        self._latency = {}
+
+
+    def get_module_interval(self, module_name: str, module_type: str) -> int:
+        """Method returns module polling interval.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+
+        Returns:
+            int: module polling interval.
+        """
+
+        return self.module_intervals.get((module_name, module_type), self.default_interval)
+
+
+    def is_due(self, module_name: str, module_type: str, container_key: Optional[int]) -> bool:
+        """Method checks if module container need to be requested in the current cycle.
+        Container is due if there is no saved response or module interval is expired.
+        Half of the cycle interval is used as tolerance for the cycle start time jitter.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            bool: True if module container need to be requested.
+        """
+
+        saved_telemetry = self._saved_telemetry.get((module_name, module_type, container_key))
+        if saved_telemetry is None:
+            return True
+        retrieval_time, _ = saved_telemetry
+        elapsed_time = time.monotonic() - retrieval_time
+        return elapsed_time + self.cycle_interval / 2 >= self.get_module_interval(module_name, module_type)
+
+
+    def save_telemetry(self, module_name: str, module_type: str, container_key: Optional[int], telemetry: dict) -> None:
+        """Method saves module container response to reuse it till module refresh.
+        Response is saved by reference (not copied). Module container is not changed 
+        after it's filled so saved response is shared with the container of the current cycle.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+            telemetry (dict): module container response.
+        """
+
+        self._saved_telemetry[(module_name, module_type, container_key)] = (time.monotonic(), telemetry)
+
+
+    def get_saved_telemetry(self, module_name: str, module_type: str, container_key: Optional[int]) -> dict:
+        """Method returns shallow copy of the saved module container response with the current date and time.
+        Only the request status keys of the top level are changed, module response is shared with the saved one.
+        Original retrieval date and time are saved under 'retrieved-date', 'retrieved-time' keys
+        and response age (sec) under 'telemetry-age' key.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            dict: module container response.
+        """
+
+        retrieval_time, saved_telemetry = self._saved_telemetry[(module_name, module_type, container_key)]
+        current_telemetry = dict(saved_telemetry)
+        current_telemetry['telemetry-age'] = time.monotonic() - retrieval_time
+        current_telemetry['retrieved-date'] = saved_telemetry['date']
+        current_telemetry['retrieved-time'] = saved_telemetry['time']
+        current_telemetry['date'] = datetime.now().strftime("%d/%m/%Y")
+        current_telemetry['time'] = datetime.now().strftime("%H:%M:%S")
+        current_telemetry['cached'] = True
+        return current_telemetry
+
+
+    def update_latency(self, module_name: str, module_type: str, container_key: Optional[int], latency: float) -> None:
+        """Method updates module container request latency moving average.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+            latency (float): last request latency (sec).
+        """
+
+        key = (module_name, module_type, container_key)
+        if key not in self._latency:
+            self._latency[key] = latency
+        else:
+            self._latency[key] += ModuleScheduler.LATENCY_SMOOTHING * (latency - self._latency[key])
+
+
+    def get_latency(self, module_name: str, module_type: str, container_key: Optional[int]) -> Optional[float]:
+        """Method returns module container request latency moving average.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            Optional[float]: request latency (sec). None if module container was not requested yet.
+        """
+
+        return self._latency.get((module_name, module_type, container_key))
+
+
+    def has_saved_telemetry(self, module_name: str, module_type: str, container_key: Optional[int]) -> bool:
+        """Method checks if module container response is saved.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            bool: True if module container response is saved.
+        """
+
+        return (module_name, module_type, container_key) in self._saved_telemetry
+
+
+    def has_stale_telemetry(self, module_name: str, module_type: str, container_key: Optional[int]) -> bool:
+        """Method checks if module container response is saved and may be served for the failed request (stale).
+        Saved response is not served if its age exceeds max_stale_intervals module polling intervals.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            bool: True if saved module container response is not expired.
+        """
+
+        saved_telemetry = self._saved_telemetry.get((module_name, module_type, container_key))
+        if saved_telemetry is None:
+            return False
+        retrieval_time, _ = saved_telemetry
+        max_stale_age = self.max_stale_intervals * self.get_module_interval(module_name, module_type)
+        return time.monotonic() - retrieval_time <= max_stale_age
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} cycle_interval: {self.cycle_interval}"
+
+
+    @property
+    def module_intervals(self):
+        return self._module_intervals
+
+
+    @property
+    def default_interval(self):
+        return self._default_interval
+
+
+    @property
+    def max_stale_intervals(self):
+        return self._max_stale_intervals
+
+
+    @property
+    def cycle_interval(self):
+        return self._cycle_interval
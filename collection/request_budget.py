@@ -0,0 +1,155 @@
+import time
+from typing import Optional
+
+from .module_scheduler import ModuleScheduler
+from .switch_session import SwitchSession
+
+
+class RequestBudget:
+    """
+    Class to budget switch module requests within the polling cycle timeout.
+    Polling cycle has two deadlines: low priority modules deadline (LOW_PRIORITY_SHARE of the cycle timeout)
+    and cycle deadline. Time between the deadlines is reserved for the core modules so
+    core modules are requested even if low priority modules exhausted their budget.
+    Module timeout is the time remaining till the module deadline limited by the module historical latency
+    (LATENCY_TIMEOUT_FACTOR multiple of the latency moving average but not less than MIN_MODULE_TIMEOUT).
+    Low priority module request is cancelled if less than MIN_MODULE_TIMEOUT remains till the low priority deadline.
+    Core module request is cancelled only after the cycle deadline.
+    Module timeout is the total module request time (session retries and re-login included), 
+    request which is not completed in the module timeout is cancelled.
+
+    Attributes:
+        cycle_timeout (float): polling cycle requests timeout (sec). None if cycle is not limited.
+        cancelled_count (int): number of cancelled module requests.
+    """
+
+    # modules requested till the cycle deadline
+    # chassis and logical switches define VF dependent requests, port parameters and statistics are core metrics
+    CORE_MODULES = [('brocade-chassis', 'chassis'),
+                    ('brocade-fibrechannel-logical-switch', 'fibrechannel-logical-switch'),
+                    ('brocade-interface', 'fibrechannel'),
+                    ('brocade-interface', 'fibrechannel-statistics')]
+    # share of the cycle timeout available for the low priority modules
+    LOW_PRIORITY_SHARE = 0.75
+    # module timeout is the multiple of the module latency moving average
+    LATENCY_TIMEOUT_FACTOR = 4
+    # minimum module timeout (sec)
+    MIN_MODULE_TIMEOUT = 5
+
+
+    def __init__(self, cycle_timeout: Optional[float] = None, scheduler: ModuleScheduler = None):
+        """
+        Args:
+            cycle_timeout (float, optional): polling cycle requests timeout (sec).
+                Defaults to None (module timeout is session timeout, requests are not cancelled).
+            scheduler (ModuleScheduler, optional): module requests scheduler with module latency history.
+                Defaults to None (module timeout is not limited by the latency).
+        """
+
+        self._cycle_timeout = cycle_timeout
+        self._scheduler = scheduler
+        self._cancelled_count = 0
+
+        start_time = time.monotonic()
+        if cycle_timeout is not None:
+            self._cycle_deadline = start_time + cycle_timeout
+            self._low_priority_deadline = start_time + cycle_timeout * RequestBudget.LOW_PRIORITY_SHARE
+
+
+    def get_timeout(self, module_name: str, module_type: str, container_key: Optional[int]) -> Optional[float]:
+        """Method calculates module request timeout.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            Optional[float]: module request timeout (sec). None if module request is cancelled.
+        """
+
+        if self.cycle_timeout is None:
+            return SwitchSession.TIMEOUT
+
+        if self.is_core_module(module_name, module_type):
+            remaining_time = self._cycle_deadline - time.monotonic()
+            min_remaining_time = 0
+        else:
+            remaining_time = self._low_priority_deadline - time.monotonic()
+            min_remaining_time = RequestBudget.MIN_MODULE_TIMEOUT
+
+        # module budget is exhausted
+        if remaining_time <= min_remaining_time:
+            self._cancelled_count += 1
+            return
+
+        timeout = min(SwitchSession.TIMEOUT, remaining_time)
+        latency = self.get_latency(module_name, module_type, container_key)
+        if latency is not None:
+            timeout = min(timeout, max(latency * RequestBudget.LATENCY_TIMEOUT_FACTOR, RequestBudget.MIN_MODULE_TIMEOUT))
+        return timeout
+
+
+    def get_latency(self, module_name: str, module_type: str, container_key: Optional[int]) -> Optional[float]:
+        """Method returns module container request latency moving average.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+
+        Returns:
+            Optional[float]: request latency (sec). None if latency history is not available.
+        """
+
+        if self._scheduler is not None:
+            return self._scheduler.get_latency(module_name, module_type, container_key)
+
+
+    def update_latency(self, module_name: str, module_type: str, container_key: Optional[int], latency: float) -> None:
+        """Method saves module container request latency to the latency history.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+            container_key (Optional[int]): container key (vf_id) of the VF dependent module. None for VF independent module.
+            latency (float): request latency (sec).
+        """
+
+        if self._scheduler is not None and latency is not None:
+            self._scheduler.update_latency(module_name, module_type, container_key, latency)
+
+
+    def add_cancelled(self) -> None:
+        """Method counts module request cancelled at the module timeout deadline."""
+
+        self._cancelled_count += 1
+
+
+    @staticmethod
+    def is_core_module(module_name: str, module_type: str) -> bool:
+        """Method checks if module is requested till the cycle deadline.
+
+        Args:
+            module_name (str): module name (for example brocade-fru)
+            module_type (str): module type (for example fan or power-supply)
+
+        Returns:
+            bool: True if module is core module.
+        """
+
+        return (module_name, module_type) in RequestBudget.CORE_MODULES
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} cycle_timeout: {self.cycle_timeout}"
+
+
+    @property
+    def cycle_timeout(self):
+        return self._cycle_timeout
+
+
+    @property
+    def cancelled_count(self):
+        return self._cancelled_count
@@ -1,39 +1,498 @@
 
-import copy
+import atexit
+import multiprocessing
 import os
+import queue
+import signal
+import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from ipaddress import ip_address
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from parser.brocade_parser import BrocadeParser
+from parser.parser_snapshot import ParserSnapshot
 from parser.request_status_parser import RequestStatusParser
 
 from dotenv import load_dotenv
-from prometheus_client import start_http_server
+from prometheus_client import REGISTRY, CollectorRegistry, start_http_server
 
 import database as db
-from config import HTTP_SERVER_PORT, SWITCH_ACCESS
+from config import DEFAULT_MODULE_INTERVAL, HTTP_SERVER_PORT, MAX_STALE_INTERVALS, MODULE_INTERVAL, SWITCH_ACCESS
 from dashboard.brocade_dashboard import BrocadeDashboard
+from collection.circuit_breaker import CircuitBreaker
+from collection.cycle_scheduler import CycleScheduler
+from collection.module_scheduler import ModuleScheduler
+from collection.switch_session import SwitchSession
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
 TIME_INTERVAL = 60
 REQUEST_STATUS_TAG = '-request'
 BROCADE_PARSER_TAG = '-parser'
 TELEMETRY_TAG = '-telemetry'
+# share of the polling cycle interval available for the switch requests (cycle_timeout by default)
+CYCLE_TIMEOUT_SHARE = 0.9
+# number of cycles waiting between pipeline stages
+PIPELINE_QUEUE_SIZE = 2
+# stop marker of the pipeline stage
+PIPELINE_STOP = None
+# brocade parser snapshot of the last not corrupted cycle for each switch in the parse worker process
+_WORKER_BROCADE_PARSER_SNAPSHOTS = {}
 
 
 def collect_switch_metrics(sw_ipaddress: ip_address, initiator_filename: str) -> None:
     """Function connects to the switch, retrieves the telemetry through rest api,
     and fills the dashboard with the collected metrics.
-    Dashboard is a set of proometheus Gauges. Time interval between two collections is 1 minute.
+    Dashboard is a set of proometheus Gauges. Time interval between two collections is 
+    the minimum module polling interval (1 minute by default). Cycles are scheduled on the fixed time grid.
 
     Args:
         sw_ipaddress (ip_address): switch ip address.
         initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
     """
     
+    # create nameserver, archive and switch log folders in the database if not exist
+    prepare_database()
+
     # get http server port number from the configuration file
     http_port_number = HTTP_SERVER_PORT[sw_ipaddress]
+    # switch collector keeps switch session, parsers and dashboard between polling cycles
+    sw_collector = SwitchCollector(sw_ipaddress, initiator_filename, SWITCH_ACCESS[sw_ipaddress], http_port_number)
+    # start http server on the specified port and open long-lived switch session
+    sw_collector.start()
+    # close switch session (logout and close connections) on shutdown
+    atexit.register(sw_collector.close)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    # collect metrics in infinite loop
+    sw_collector.run()
+
+
+class SwitchCollector:
+    """
+    Class to collect metrics of the single switch.
+    Switch state is kept between polling cycles: long-lived switch session, 
+    brocade parser snapshot of the last not corrupted cycle, request status parser snapshot of the previous cycle, 
+    module scheduler (last good module responses) and dashboard (including switch log).
+    Polling cycles are scheduled by the cycle scheduler on the fixed time grid.
+    Unreachable switch is not polled and only probed with exponential backoff by the circuit breaker.
+    Dashboard, cycle scheduler and circuit breaker metrics are registered in the collector registry 
+    exposed on the switch http port.
+
+    Polling cycle is a pipeline of three stages running in the separate threads:
+    fetch (switch telemetry request on the cycle grid), parse (request status and brocade parsers) and 
+    export (nameserver update and dashboard fill). Stages are connected with the bounded queues so 
+    next cycle fetch starts on schedule while previous cycle is parsed and exported.
+    If parse stage falls behind the oldest fetched telemetry is dropped (fetch is never blocked).
+    Export queue is not dropped (switch log is built from the consecutive parsers) and blocks parse stage.
+    Brocade parser is optionally built in the worker process (parse_process switch access key) 
+    so parsing doesn't share GIL with the http server and fetch threads. 
+    Worker process keeps brocade parser snapshot of the last not corrupted cycle.
+
+    Attributes:
+        sw_ipaddress (ip_address): switch ip address.
+        initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+        sw_access (dict): switch access details (authentication, secure_access etc) from the configuration file.
+        http_port_number (int): http server port number to expose switch metrics.
+        registry (CollectorRegistry): prometheus registry of the switch dashboard.
+    """
+
+
+    def __init__(self, sw_ipaddress: ip_address, initiator_filename: str, sw_access: dict, http_port_number: int, 
+                 registry: CollectorRegistry = REGISTRY):
+        """
+        Args:
+            sw_ipaddress (ip_address): switch ip address.
+            initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+            sw_access (dict): switch access details (authentication, secure_access etc) from the configuration file.
+            http_port_number (int): http server port number to expose switch metrics.
+            registry (CollectorRegistry): prometheus registry of the switch dashboard. 
+                Each switch has its own registry in the single process collector. Defaults to REGISTRY.
+        """
+
+        self._sw_ipaddress = sw_ipaddress
+        self._initiator_filename = initiator_filename
+        self._sw_access = sw_access
+        self._http_port_number = http_port_number
+        self._registry = registry
+
+        # module polling intervals and stale response age limit from the configuration file 
+        # (overridden by switch module_interval and max_stale_intervals)
+        self._scheduler = ModuleScheduler({**MODULE_INTERVAL, **sw_access.get('module_interval', {})}, 
+                                          DEFAULT_MODULE_INTERVAL, sw_access.get('max_stale_intervals', MAX_STALE_INTERVALS))
+        # polling cycles on the fixed time grid with overrun policy and jitter from the configuration file
+        self._stop_event = threading.Event()
+        self._cycle_scheduler = CycleScheduler(self.scheduler.cycle_interval, 
+                                               sw_access.get('overrun_policy', 'skip'), sw_access.get('cycle_jitter', 0), 
+                                               self.registry, self._stop_event)
+        # unreachable switch is probed with backoff starting from the cycle interval
+        self._circuit_breaker = CircuitBreaker(self.scheduler.cycle_interval, registry=self.registry)
+        # collector (fetch stage) thread in the single process collector
+        self._thread = None
+        # parse and export stages threads and queues
+        self._parse_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        self._export_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        self._stage_threads = []
+        # brocade parser worker process
+        self._parse_executor = None
+
+        self._http_server = None
+        self._sw_session = None
+        self._dashboard = None
+        # previous state snapshots of the brocade parser of the last not corrupted cycle 
+        # and request status parser of the previous cycle (used instead of the parsers copies)
+        self._brocade_parser_snapshot = None
+        self._request_status_snapshot = None
+
+
+    def start(self) -> None:
+        """Method starts http server on the switch port and opens long-lived switch session."""
+
+        # start http server on the specified port
+        self._http_server, _ = start_http_server(self.http_port_number, registry=self.registry)
+        # open long-lived switch session to reuse connections across polling cycles
+        self._sw_session = get_sw_session(self.sw_ipaddress, self.sw_access)
+
+
+    def run(self) -> None:
+        """Method fetches switch telemetry on the cycle grid till collector is closed.
+        Fetched telemetry is parsed and exported by the pipeline stages threads.
+        """
+
+        self._start_pipeline()
+        try:
+            while not self._stop_event.is_set():
+                self.cycle_scheduler.start_cycle()
+                # collect telemetry and pass it to the parse stage
+                sw_telemetry = self.fetch_telemetry()
+                if sw_telemetry is not None:
+                    self._put_parse_queue(sw_telemetry)
+                # wait next cycle deadline
+                if not self.cycle_scheduler.finish_cycle():
+                    break
+        finally:
+            self._stop_pipeline()
+
+
+    def start_thread(self) -> None:
+        """Method runs collector loop in the separate thread (single process collector)."""
+
+        self._thread = threading.Thread(target=self.run, name=self.initiator_filename, daemon=True)
+        self._thread.start()
+
+
+    def collect_metrics(self) -> None:
+        """Method retrieves switch telemetry, parses it and fills the dashboard (single polling cycle without pipeline).
+        If chassis request is corrupted brocade parser is not initialized and only request status is filled.
+        """
+
+        sw_telemetry = self.fetch_telemetry()
+        if sw_telemetry is None:
+            return
+        request_status_parser_now, brocade_parser_now = self.parse_telemetry(sw_telemetry)
+        self.export_metrics(sw_telemetry, request_status_parser_now, brocade_parser_now)
+
+
+    def fetch_telemetry(self) -> Optional[SwitchTelemetryRequest]:
+        """Method retrieves switch telemetry (fetch stage).
+        If circuit breaker is open switch is not polled. Switch is probed when breaker backoff is expired and 
+        polling is resumed in the same cycle if probe is successful.
+
+        Returns:
+            Optional[SwitchTelemetryRequest]: switch telemetry. None if switch is not polled.
+        """
+
+        if not self.circuit_breaker.is_closed:
+            if not self.circuit_breaker.is_probe_due():
+                print(self.sw_ipaddress, 'circuit breaker is open, polling skipped')
+                return
+            if not self.sw_session.probe(headers=SwitchTelemetryRequest.HEADERS):
+                self.circuit_breaker.record_failure()
+                return
+            self.circuit_breaker.record_success()
+
+        sw_telemetry = get_sw_telemetry(self.sw_ipaddress, self.initiator_filename, self.sw_session, self.sw_access, 
+                                        self.scheduler, self.cycle_timeout)
+        if sw_telemetry.switch_unreachable:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return sw_telemetry
+
+
+    def parse_telemetry(self, sw_telemetry: SwitchTelemetryRequest) -> Tuple[RequestStatusParser, BrocadeParser]:
+        """Method saves switch telemetry to the database and parses it (parse stage).
+        Brocade parser is built in the worker process if parse_process is enabled.
+        If release_telemetry is enabled parsers drop the raw telemetry reference once parsed 
+        (raw telemetry is passed to the archive writer only).
+
+        Args:
+            sw_telemetry (SwitchTelemetryRequest): switch telemetry.
+
+        Returns:
+            Tuple[RequestStatusParser, BrocadeParser]: request status parser and brocade parser 
+                (None if sw_telemetry is corrupted).
+        """
+
+        # save current switch telemetry to the database
+        save_sw_telemetry(sw_telemetry, self.initiator_filename)
+        # get http request status parser (compared with the previous request status snapshot)
+        request_status_parser_now = get_request_status(sw_telemetry, self.initiator_filename, self._request_status_snapshot, 
+                                                       self.release_telemetry)
+        # snapshot is taken before the export stage fills the dashboard with the parser
+        self._request_status_snapshot = request_status_parser_now.get_snapshot()
+
+        # parse retrieved telemetry to export to the dashboard
+        # if chassis request is corrupted parser is not initialized
+        if self.sw_access.get('parse_process', False):
+            brocade_parser_now = self._get_brocade_parser_in_worker(sw_telemetry)
+        else:
+            # parser is compared with the snapshot of the last not corrupted parser 
+            brocade_parser_now = get_brocade_parser(sw_telemetry, self.initiator_filename, self._brocade_parser_snapshot, 
+                                                    self.release_telemetry)
+            if brocade_parser_now:
+                self._brocade_parser_snapshot = brocade_parser_now.get_snapshot()
+        return request_status_parser_now, brocade_parser_now
+
+
+    def export_metrics(self, sw_telemetry: Optional[SwitchTelemetryRequest], 
+                       request_status_parser_now: RequestStatusParser, 
+                       brocade_parser_now: BrocadeParser) -> None:
+        """Method updates nameserver and fills the dashboard (export stage).
+        If brocade parser is not initialized only request status is filled.
+
+        Args:
+            sw_telemetry (SwitchTelemetryRequest): switch telemetry (dashboard is created with). 
+                None if dashboard is created and telemetry is released.
+            request_status_parser_now (RequestStatusParser): request status parser.
+            brocade_parser_now (BrocadeParser): brocade parser. None if sw_telemetry is corrupted.
+        """
+
+        # create switch dashboard (set of toolbars which are set of gauges)
+        if self._dashboard is None:
+            self._dashboard = BrocadeDashboard(sw_telemetry, self.initiator_filename, self.registry, self.export_mode, 
+                                               self.stale_grace_periods)
+            if self.release_telemetry:
+                self._dashboard.release_telemetry()
+
+        if brocade_parser_now and brocade_parser_now.ch_parser:
+            # update namserver with data from the parser if needed
+            db.update_nameserver(brocade_parser_now.ch_parser)
+
+        # fill dashboard gauges with labels and metrics from the parser 
+        # (parsers are published and rendered at scrape time in the collector export mode)
+        self.dashboard.fill_dashboard_gauge_metrics(brocade_parser_now, request_status_parser_now)
+
+
+    def _get_brocade_parser_in_worker(self, sw_telemetry: SwitchTelemetryRequest) -> BrocadeParser:
+        """Method builds brocade parser in the worker process. 
+        Worker process is restarted if it is terminated (previous parser is lost).
+
+        Args:
+            sw_telemetry (SwitchTelemetryRequest): switch telemetry.
+
+        Returns:
+            BrocadeParser: brocade parser. None if sw_telemetry is corrupted.
+        """
+
+        if self._parse_executor is None:
+            # worker process is spawned to avoid forking the threads of the collector process
+            self._parse_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            return self._parse_executor.submit(get_brocade_parser_in_worker, sw_telemetry, self.initiator_filename, 
+                                               self.release_telemetry).result()
+        except BrokenProcessPool:
+            print(self.sw_ipaddress, 'parse worker process terminated, restarting')
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
+            return
+
+
+    def _start_pipeline(self) -> None:
+        """Method starts parse and export stages threads."""
+
+        self._stage_threads = [
+            threading.Thread(target=self._run_parse_stage, name=self.initiator_filename + '-parse', daemon=True),
+            threading.Thread(target=self._run_export_stage, name=self.initiator_filename + '-export', daemon=True)
+            ]
+        for stage_thread in self._stage_threads:
+            stage_thread.start()
+
+
+    def _stop_pipeline(self) -> None:
+        """Method stops parse and export stages after the queued cycles are processed and 
+        stops parse worker process."""
+
+        self._put_parse_queue(PIPELINE_STOP)
+        for stage_thread in self._stage_threads:
+            stage_thread.join(timeout=self.cycle_interval)
+        self._stage_threads = []
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown()
+            self._parse_executor = None
+
+
+    def _put_parse_queue(self, sw_telemetry: SwitchTelemetryRequest) -> None:
+        """Method passes switch telemetry to the parse stage. 
+        If parse queue is full the oldest telemetry is dropped so fetch stage is never blocked.
+
+        Args:
+            sw_telemetry (SwitchTelemetryRequest): switch telemetry or PIPELINE_STOP.
+        """
+
+        while True:
+            try:
+                self._parse_queue.put_nowait(sw_telemetry)
+                return
+            except queue.Full:
+                try:
+                    self._parse_queue.get_nowait()
+                    print(self.sw_ipaddress, 'parse stage is behind, oldest telemetry dropped')
+                except queue.Empty:
+                    pass
+
+
+    def _run_parse_stage(self) -> None:
+        """Method parses fetched telemetry and passes parsers to the export stage till stop marker."""
+
+        while True:
+            sw_telemetry = self._parse_queue.get()
+            if sw_telemetry is PIPELINE_STOP:
+                self._export_queue.put(PIPELINE_STOP)
+                return
+            try:
+                request_status_parser_now, brocade_parser_now = self.parse_telemetry(sw_telemetry)
+            except Exception as error:
+                # failed cycle is skipped, pipeline keeps running
+                print(self.sw_ipaddress, 'parse stage failed', repr(error))
+                continue
+            # released telemetry is not passed to the export stage once dashboard is created
+            if self.release_telemetry and self._dashboard is not None:
+                sw_telemetry = None
+            self._export_queue.put((sw_telemetry, request_status_parser_now, brocade_parser_now))
+
+
+    def _run_export_stage(self) -> None:
+        """Method exports parsed cycles to the dashboard till stop marker."""
+
+        while True:
+            parsed_cycle = self._export_queue.get()
+            if parsed_cycle is PIPELINE_STOP:
+                return
+            try:
+                self.export_metrics(*parsed_cycle)
+            except Exception as error:
+                # failed cycle is skipped, pipeline keeps running
+                print(self.sw_ipaddress, 'export stage failed', repr(error))
+
+
+    def close(self) -> None:
+        """Method stops collector loop and pipeline, closes switch session (logout and connections) and stops http server."""
+
+        self._stop_event.set()
+        # current cycle is finished before switch session is closed
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.cycle_interval)
+        if self._sw_session is not None:
+            self._sw_session.close()
+            self._sw_session = None
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
+
+
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
+    @property
+    def initiator_filename(self):
+        return self._initiator_filename
+
+
+    @property
+    def sw_access(self):
+        return self._sw_access
+
+
+    @property
+    def http_port_number(self):
+        return self._http_port_number
+
+
+    @property
+    def registry(self):
+        return self._registry
+
+
+    @property
+    def sw_session(self):
+        return self._sw_session
+
+
+    @property
+    def scheduler(self):
+        return self._scheduler
+
+
+    @property
+    def cycle_scheduler(self):
+        return self._cycle_scheduler
+
+
+    @property
+    def circuit_breaker(self):
+        return self._circuit_breaker
+
+
+    @property
+    def cycle_interval(self):
+        return self.scheduler.cycle_interval
+
+
+    @property
+    def cycle_timeout(self):
+        # switch requests timeout of the polling cycle so dead switch never stalls the collector past the cycle interval
+        return self.sw_access.get('cycle_timeout', self.cycle_interval * CYCLE_TIMEOUT_SHARE)
+
+
+    @property
+    def release_telemetry(self):
+        # parsers drop the raw telemetry reference once parsed
+        return self.sw_access.get('release_telemetry', False)
+
+
+    @property
+    def export_mode(self):
+        # dashboard gauges are prometheus Gauges ('gauge') or rendered from the parsers by the dashboard collector at scrape time ('collector')
+        return self.sw_access.get('export_mode', 'gauge')
+
+
+    @property
+    def stale_grace_periods(self):
+        # number of fills stale label sets of the dashboard family are kept for before eviction
+        return self.sw_access.get('stale_grace_periods', {})
+
+
+    @property
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+
+    @property
+    def dashboard(self):
+        return self._dashboard
+
+
+def prepare_database() -> None:
+    """Function creates nameserver, archive and switch log folders in the database if not exist."""
 
     # if not found create empty nameserver and save it in the database
     db.create_nameserver()
@@ -43,118 +502,103 @@ def collect_switch_metrics(sw_ipaddress: ip_address, initiator_filename: str) ->
     db.create_directory_if_not_exists(db.SWITCH_LOG_DIR)
 
 
-    # start http server on the specified port
-    start_http_server(http_port_number)
-
-    # start timer to measure execution time
-    start_time = time.time()
-    # get telemetry from the switch through rest api
-    sw_telemetry = get_sw_telemetry(sw_ipaddress, initiator_filename)
-    # get http request status parser
-    request_status_parser_now = get_request_status(sw_telemetry, initiator_filename)
-    # create switch dashboard (set of toolbars which are set of gauges)
-    dashboard = BrocadeDashboard(sw_telemetry, initiator_filename)
-
-    if sw_telemetry.corrupted_request:
-        while sw_telemetry.corrupted_request:
-            # if any request is corrupted parser is not initialized
-            brocade_parser_now = None
-            # fill dashboard gauges with labels and metrics from the parser
-            dashboard.fill_dashboard_gauge_metrics(brocade_parser_now, request_status_parser_now)   
-
-            # wait timer to expire
-            wait_timer(start_time)
-            # start timer to measure execution time
-            start_time = time.time()
-
-            # save previous parsed request status
-            request_status_parser_prev = copy.deepcopy(request_status_parser_now)
-            # get telemetry from the switch through rest api
-            sw_telemetry = get_sw_telemetry(sw_ipaddress, initiator_filename)
-            # get http request status parser
-            request_status_parser_now = get_request_status(sw_telemetry, initiator_filename, request_status_parser_prev)
-            
-    # parse retrieved telemetry to export to the dashboard
-    brocade_parser_now = get_brocade_parser(sw_telemetry, initiator_filename)
-    # update namserver with data from the parser if needed
-    db.update_nameserver(brocade_parser_now.ch_parser)
-    # fill dashboard gauges with labels and metrics from the parser
-    dashboard.fill_dashboard_gauge_metrics(brocade_parser_now, request_status_parser_now)
-    # stop timer
-    wait_timer(start_time)
-        
-    # collect metrics in infinite loop
-    while True:
-        # reset timer
-        start_time = time.time()
-        # save previous parsed telemetry
-        if not sw_telemetry.corrupted_request:
-            brocade_parser_prev = copy.deepcopy(brocade_parser_now)
-        # save previous parsed request status
-        request_status_parser_prev = copy.deepcopy(request_status_parser_now)
-        
-        # collect new telemetry
-        sw_telemetry = get_sw_telemetry(sw_ipaddress, initiator_filename)
-        # get http request status parser
-        request_status_parser_now = get_request_status(sw_telemetry, initiator_filename, request_status_parser_prev)
-        # parse retrieved telemetry to export to the dashboard
-        # if sw_telemetry is corrupted parser is not initialized
-        brocade_parser_now = get_brocade_parser(sw_telemetry, initiator_filename, brocade_parser_prev)
+def get_sw_session(sw_ipaddress: ip_address, sw_access: dict = None) -> SwitchSession:
+    """Function opens long-lived switch session which keeps connections to the switch 
+    (and session token in session auth mode) across polling cycles.
 
-        if brocade_parser_now:
-            # update namserver with data from the parser if needed
-            db.update_nameserver(brocade_parser_now.ch_parser)
+    Args:
+        sw_ipaddress (ip_address): switch ip address.
+        sw_access (dict, optional): switch access details. Defaults to None (SWITCH_ACCESS of the sw_ipaddress).
+
+    Returns:
+        SwitchSession: switch session.
+    """
+
+    sw_access = sw_access if sw_access is not None else SWITCH_ACCESS[sw_ipaddress]
+    # get switch credentials from .env file
+    sw_username, sw_password = get_credentials(sw_ipaddress, sw_access)
+    # get switch access protocol (http or https) from the configuration file
+    secure_access = sw_access["secure_access"]
+    # get switch authentication mode (basic or session) from the configuration file
+    auth_mode = sw_access.get("auth_mode", "basic")
+    # get switch REST API port from the configuration file (default port of the protocol if not set)
+    rest_port = sw_access.get("rest_port")
+    return SwitchSession(sw_ipaddress, sw_username, sw_password, secure_access, auth_mode, rest_port)
 
-        # fill dashboard gauges with labels and metrics from the parser
-        dashboard.fill_dashboard_gauge_metrics(brocade_parser_now, request_status_parser_now)
-        # wait timer to expire
-        wait_timer(start_time)
-    
 
 def get_sw_telemetry(sw_ipaddress: ip_address, 
-                    initiator_filename: str) -> Tuple[SwitchTelemetryRequest, RequestStatusParser]:
+                    initiator_filename: str, 
+                    sw_session: SwitchSession = None, 
+                    sw_access: dict = None, 
+                    scheduler: ModuleScheduler = None, 
+                    cycle_timeout: float = None) -> Tuple[SwitchTelemetryRequest, RequestStatusParser]:
     """Method performs http request to retrieve switch telemetry. 
     Then request status for each module is extracted from switch telemetry .
 
     Args:
         sw_ipaddress (ip_address): switch ip address.
         initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+        sw_session (SwitchSession, optional): long-lived switch session. Defaults to None (new connections for each request).
+        sw_access (dict, optional): switch access details. Defaults to None (SWITCH_ACCESS of the sw_ipaddress).
+        scheduler (ModuleScheduler, optional): module requests scheduler. Defaults to None (all modules are requested).
+        cycle_timeout (float, optional): switch requests timeout of the polling cycle. 
+            Defaults to None (requests are not cancelled).
 
     Returns:
         Union[SwitchTelemetryRequest, RequestStatusParser]: switch telemetry.
     """
     
+    sw_access = sw_access if sw_access is not None else SWITCH_ACCESS[sw_ipaddress]
     # get switch credentials from .env file
-    sw_username, sw_password = get_credentials(sw_ipaddress)
+    sw_username, sw_password = get_credentials(sw_ipaddress, sw_access)
     # get switch access protocol (http or https) from the configuration file
-    secure_access = SWITCH_ACCESS[sw_ipaddress]["secure_access"]
+    secure_access = sw_access["secure_access"]
+    # get switch modules request mode (sequential or concurrent) from the configuration file
+    async_mode = sw_access.get("async_mode", False)
+    max_concurrent_requests = sw_access.get("max_concurrent_requests")
+    rest_port = sw_access.get("rest_port")
     
     st = time.time()
     # collect new telemetry
-    sw_telemetry = SwitchTelemetryRequest(sw_ipaddress, sw_username, sw_password, secure_access)
+    sw_telemetry = SwitchTelemetryRequest(sw_ipaddress, sw_username, sw_password, secure_access, 
+                                          async_mode, max_concurrent_requests, sw_session, scheduler, cycle_timeout, 
+                                          rest_port)
     elapsed_time = time.time() - st
     print('\nCollection time:', time.strftime("%H:%M:%S", time.gmtime(elapsed_time)))
-    # save current switch telemetry to the database
-    db.save_object(sw_telemetry, db.ARCHIVE_DIR, filename=initiator_filename + TELEMETRY_TAG)
+    if sw_session:
+        print('Connection pool:', sw_session.pool_stats)
     return sw_telemetry
 
 
-def get_credentials(sw_ipaddress: ip_address) -> Tuple[str]:
+def save_sw_telemetry(sw_telemetry: SwitchTelemetryRequest, initiator_filename: str) -> None:
+    """Function saves switch telemetry to the database.
+
+    Args:
+        sw_telemetry (SwitchTelemetryRequest): set of switch telemetry retrieved from the switch.
+        initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+    """
+
+    db.save_object(sw_telemetry, db.ARCHIVE_DIR, filename=initiator_filename + TELEMETRY_TAG)
+
+
+def get_credentials(sw_ipaddress: ip_address, sw_access: dict = None) -> Tuple[str]:
     """Function retrieves switch credentials from .env file.
 
     Args:
         sw_ipaddress (ip_address): switch ip address.
+        sw_access (dict, optional): switch access details. Defaults to None (SWITCH_ACCESS of the sw_ipaddress).
 
     Returns:
         Tuple[str]: switch username and password.
     """
 
     load_dotenv()
+    sw_access = sw_access if sw_access is not None else SWITCH_ACCESS[sw_ipaddress]
 
-    if SWITCH_ACCESS[sw_ipaddress]['authentication'] == 'ldap':
+    if sw_access['authentication'] == 'ldap':
         sw_username = os.getenv("SW_USERNAME_LDAP")
         sw_password = os.getenv("SW_PASSWORD_LDAP")
-    elif SWITCH_ACCESS[sw_ipaddress]['authentication'] == 'local':
+    elif sw_access['authentication'] == 'local':
         sw_username = os.getenv("SW_USERNAME_LOCAL")
         sw_password = os.getenv("SW_PASSWORD_LOCAL")
     return sw_username, sw_password
@@ -162,23 +606,28 @@ def get_credentials(sw_ipaddress: ip_address) -> Tuple[str]:
 
 def get_request_status(sw_telemetry: SwitchTelemetryRequest, 
                         initiator_filename: str, 
-                        request_status_parser_prev: RequestStatusParser = None) -> RequestStatusParser:
+                        request_status_parser_prev: ParserSnapshot = None, 
+                        release_telemetry: bool = False) -> RequestStatusParser:
     """Function creates request status summary for each module from the sw_telemetry.
     Saves request status summary to the database.
 
     Args:
         sw_telemetry (SwitchTelemetryRequest): set of switch telemetry retrieved from the switch.
         initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
-        request_status_parser_prev (RequestStatusParser, optional): previous request_status_parser. Defaults to None.
+        request_status_parser_prev (ParserSnapshot, optional): previous request status parser snapshot. Defaults to None.
+        release_telemetry (bool, optional): drop the raw telemetry reference of the parser. Defaults to False.
 
     Returns:
         RequestStatusParser: request status module summary.
     """
 
     # load current nameserver from the database
-    nameserver_dct = db.load_object(db.DATABASE_DIR, db.NS_FILENAME)
+    with db.NS_LOCK:
+        nameserver_dct = db.load_object(db.DATABASE_DIR, db.NS_FILENAME)
     # http request status parser
     request_status_parser_now = RequestStatusParser(sw_telemetry, nameserver_dct, request_status_parser_prev)
+    if release_telemetry:
+        request_status_parser_now.release_telemetry()
     # save current request status to the database
     db.save_object(request_status_parser_now, db.ARCHIVE_DIR, filename=initiator_filename + REQUEST_STATUS_TAG)
     return request_status_parser_now
@@ -186,41 +635,53 @@ def get_request_status(sw_telemetry: SwitchTelemetryRequest,
 
 def get_brocade_parser(sw_telemetry: SwitchTelemetryRequest, 
                         initiator_filename: str, 
-                        brocade_parser_prev: BrocadeParser = None) -> BrocadeParser:
+                        brocade_parser_prev: ParserSnapshot = None, 
+                        release_telemetry: bool = False) -> BrocadeParser:
     """Function parse data for each sw_telemetry module and saves parser to the database.
 
     Args:
         sw_telemetry (SwitchTelemetryRequest): set of switch telemetry retrieved from the switch.
         initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
-        brocade_parser_prev (BrocadeParser, optional): brocade parser from the previous not corrupted iteration. Defaults to None.
+        brocade_parser_prev (ParserSnapshot, optional): brocade parser snapshot from the previous not corrupted iteration. Defaults to None.
+        release_telemetry (bool, optional): drop the raw telemetry reference of the parser and sub-parsers 
+            (parser is saved to the database without the raw telemetry). Defaults to False.
 
     Returns:
         BrocadeParser: brocade parser contains parsers for each module from the sw_telemetry.
     """
 
-    # if any module of sw_telemetry is corrupted brocade_parser is not initialized
-    if sw_telemetry.corrupted_request:
+    # brocade_parser is not initialized if chassis module has no valid data (switch is not identified)
+    # sub-parsers of the other corrupted modules are skipped (degraded mode)
+    if not sw_telemetry.is_valid_container('chassis'):
         return
     # parse retrieved telemetry to export to the dashboard
+    # sub-parsers are built on demand (sub-parsers of the not changed containers are reused from the previous cycle)
     brocade_parser_now = BrocadeParser(sw_telemetry, brocade_parser_prev)            
+    if release_telemetry:
+        brocade_parser_now.release_telemetry()
     # save current switch parser to the database
     db.save_object(brocade_parser_now, db.ARCHIVE_DIR, filename=initiator_filename + BROCADE_PARSER_TAG)
-    return brocade_parser_now        
+    return brocade_parser_now
 
 
-def wait_timer(start_time: time) -> None:
-    """Function pause code execution and waits timer is expired.
+def get_brocade_parser_in_worker(sw_telemetry: SwitchTelemetryRequest, initiator_filename: str, 
+                                 release_telemetry: bool = False) -> BrocadeParser:
+    """Function parses sw_telemetry in the parse worker process. 
+    Brocade parser snapshot of the last not corrupted cycle is kept in the worker process 
+    so it is not transferred to the worker each cycle. 
+    Released parser is transferred back without the raw telemetry.
 
     Args:
-        start_time (time): start timer
-    """
-
-    # stop timer
-    finish_time = time.time()
-    duration = finish_time - start_time
-    # wait till TIME_INTERVAL is expired
-    if duration < TIME_INTERVAL:
-        time.sleep(TIME_INTERVAL - duration)
-
+        sw_telemetry (SwitchTelemetryRequest): set of switch telemetry retrieved from the switch.
+        initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+        release_telemetry (bool, optional): drop the raw telemetry reference of the parser. Defaults to False.
 
+    Returns:
+        BrocadeParser: brocade parser. None if sw_telemetry is corrupted.
+    """
 
+    brocade_parser_prev = _WORKER_BROCADE_PARSER_SNAPSHOTS.get(initiator_filename)
+    brocade_parser_now = get_brocade_parser(sw_telemetry, initiator_filename, brocade_parser_prev, release_telemetry)
+    if brocade_parser_now:
+        _WORKER_BROCADE_PARSER_SNAPSHOTS[initiator_filename] = brocade_parser_now.get_snapshot()
+    return brocade_parser_now
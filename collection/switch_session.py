@@ -0,0 +1,650 @@
+import asyncio
+import time
+from ipaddress import ip_address
+
+import httpx
+
+
+class RequestDeadlineError(httpx.TimeoutException):
+    """Request (including stale connection retries and session re-login) is not completed before its deadline."""
+
+
+class SwitchSession:
+    """
+    Class to keep long-lived http(s) connections to the Brocade switch across polling cycles.
+    Sync and async clients keep keep-alive connections (and TLS sessions for https) in the connection pool
+    so the switch is not forced to accept new TCP connection and perform TLS handshake for each request.
+    Async client is bound to the session's own event loop which is reused by all cycles.
+    Request failed on the stale keep-alive connection (closed by the switch while idle) is retried once
+    on the new connection.
+    In 'basic' auth mode credentials are sent with each request. In 'session' auth mode session is logged in once 
+    through /rest/login and Authorization session token is reused by all requests and cycles. 
+    Session is logged in again if token is rejected (401) and logged out when session is closed.
+    Request timeout is the total request deadline: stale connection retry and re-login get the time remaining 
+    till the deadline only, response is read chunk by chunk till the deadline (async request is cancelled 
+    at the deadline) and RequestDeadlineError is raised once the deadline is passed.
+
+    Attributes:
+        sw_ipaddress (ip_address): IP address of the switch.
+        username (str): Username to access the switch.
+        password (str): Password to access the switch.
+        seccure_access (bool): True if https is used. False if http is used. Default is False (http).
+        auth_mode (str): 'basic' if credentials are sent with each request, 'session' if session token is used. 
+            Default is 'basic'.
+        rest_port (int): REST API port of the switch. None if default port of the protocol is used (80 or 443).
+        pool_stats (dict): connection pool statistics (requests, tcp connections, tls handshakes, stale connection retries, logins).
+    """
+
+    AUTH_MODES = ['basic', 'session']
+
+    LOGIN_HEADERS = {
+        'Accept': 'application/yang-data+json', 
+        'Content-Type': 'application/yang-data+json',
+        }
+    
+    # failed login is not repeated during holdoff time (sec) to avoid account lockout
+    LOGIN_HOLDOFF = 30
+
+    # connection pool limits
+    MAX_CONNECTIONS = 8
+    MAX_KEEPALIVE_CONNECTIONS = 8
+    # idle keep-alive connection is kept in the pool longer than polling interval
+    # to be reused in the next cycle
+    KEEPALIVE_EXPIRY = 120
+    # request timeout
+    TIMEOUT = 31
+    # unreachable switch probe request
+    PROBE_PATH = 'running/brocade-chassis/chassis'
+    PROBE_TIMEOUT = 5
+
+    # errors raised when keep-alive connection was closed by the switch
+    STALE_CONNECTION_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+    # number of retries on the new connection if request failed on the stale connection
+    STALE_CONNECTION_RETRIES = 1
+
+
+    def __init__(self, sw_ipaddress: ip_address, username: str, password: str, secure_access: bool = False, 
+                 auth_mode: str = 'basic', rest_port: int = None):
+        """
+        Args:
+            sw_ipaddress (ip_address): IP address of the switch.
+            username (str): Username to access the switch.
+            password (str): Password to access the switch.
+            seccure_access (bool): True if https is used. False if http is used. Default is False (http).
+            auth_mode (str): 'basic' if credentials are sent with each request, 'session' if session token is used. 
+                Default is 'basic'.
+            rest_port (int): REST API port of the switch. Defaults to None (default port of the protocol).
+        """
+
+        if auth_mode not in SwitchSession.AUTH_MODES:
+            raise ValueError(f"Invalid auth mode '{auth_mode}'. Valid modes are {', '.join(SwitchSession.AUTH_MODES)}")
+
+        self._sw_ipaddress = ip_address(sw_ipaddress)
+        self._username = username
+        self._password = password
+        self._secure_access = secure_access
+        self._auth_mode = auth_mode
+        self._rest_port = rest_port
+
+        self._auth = httpx.BasicAuth(username, password)
+        self._limits = httpx.Limits(max_connections=SwitchSession.MAX_CONNECTIONS,
+                                    max_keepalive_connections=SwitchSession.MAX_KEEPALIVE_CONNECTIONS,
+                                    keepalive_expiry=SwitchSession.KEEPALIVE_EXPIRY)
+        # clients and event loop are created on the first request
+        self._client = None
+        self._async_client = None
+        self._loop = None
+
+        # session auth mode token
+        self._token = None
+        # lock to prevent simultaneous logins of the concurrent requests
+        self._login_lock = None
+        self._login_error = None
+        self._login_error_time = None
+
+        self._pool_stats = {
+            'requests': 0,
+            'tcp-connections': 0,
+            'tls-handshakes': 0,
+            'stale-connection-retries': 0,
+            'logins': 0
+            }
+
+
+    def get(self, url: str, headers: dict = None, timeout: float = TIMEOUT, **kwargs) -> httpx.Response:
+        """Function performs http GET request through the sync client.
+        Request failed on the stale connection is retried.
+        In session auth mode request rejected with 401 status code is repeated with the new session token.
+        Retry and re-login get the time remaining till the request deadline.
+
+        Args:
+            url (str): REST API url.
+            headers (dict): request headers. Defaults to None.
+            timeout (float): total request time (sec) including retries and re-login. Defaults to TIMEOUT.
+            **kwargs: httpx.Client.get arguments (params, etc).
+
+        Returns:
+            httpx.Response: switch response.
+
+        Raises:
+            RequestDeadlineError: request is not completed in timeout.
+        """
+
+        deadline = time.monotonic() + timeout
+        if self.auth_mode == 'basic':
+            return self._request(self.client, 'GET', url, deadline, auth=self._auth, headers=headers, **kwargs)
+        
+        token = self._get_session_token(deadline=deadline)
+        response = self._request(self.client, 'GET', url, deadline, headers=self._add_token(headers, token), **kwargs)
+        # session token is expired or revoked by the switch
+        if response.status_code == 401:
+            print(self.sw_ipaddress, 'session token rejected')
+            token = self._get_session_token(rejected_token=token, deadline=deadline)
+            rejected_response = response
+            response = self._request(self.client, 'GET', url, deadline, headers=self._add_token(headers, token), **kwargs)
+            # rejected request is counted as retry
+            response.extensions['retries'] += rejected_response.extensions['retries'] + 1
+        return response
+
+
+    async def get_async(self, url: str, headers: dict = None, timeout: float = TIMEOUT, **kwargs) -> httpx.Response:
+        """Function performs http GET request through the async client.
+        Request failed on the stale connection is retried.
+        In session auth mode request rejected with 401 status code is repeated with the new session token.
+        Request with retries and re-login is cancelled at the request deadline.
+
+        Args:
+            url (str): REST API url.
+            headers (dict): request headers. Defaults to None.
+            timeout (float): total request time (sec) including retries and re-login. Defaults to TIMEOUT.
+            **kwargs: httpx.AsyncClient.get arguments (params, etc).
+
+        Returns:
+            httpx.Response: switch response.
+
+        Raises:
+            RequestDeadlineError: request is not completed in timeout.
+        """
+
+        deadline = time.monotonic() + timeout
+        try:
+            return await asyncio.wait_for(self._get_async(url, headers, deadline, **kwargs), timeout)
+        except asyncio.TimeoutError:
+            raise RequestDeadlineError('Request deadline exceeded')
+
+
+    async def _get_async(self, url: str, headers: dict, deadline: float, **kwargs) -> httpx.Response:
+        """Function performs http GET request through the async client with retries and re-login.
+
+        Args:
+            url (str): REST API url.
+            headers (dict): request headers.
+            deadline (float): request deadline (time.monotonic).
+            **kwargs: httpx.AsyncClient.get arguments (params, etc).
+
+        Returns:
+            httpx.Response: switch response.
+        """
+
+        if self.auth_mode == 'basic':
+            return await self._request_async(self.async_client, 'GET', url, deadline, auth=self._auth, headers=headers, **kwargs)
+
+        token = await self._get_session_token_async(deadline=deadline)
+        response = await self._request_async(self.async_client, 'GET', url, deadline, 
+                                             headers=self._add_token(headers, token), **kwargs)
+        # session token is expired or revoked by the switch
+        if response.status_code == 401:
+            print(self.sw_ipaddress, 'session token rejected')
+            token = await self._get_session_token_async(rejected_token=token, deadline=deadline)
+            rejected_response = response
+            response = await self._request_async(self.async_client, 'GET', url, deadline, 
+                                                 headers=self._add_token(headers, token), **kwargs)
+            # rejected request is counted as retry
+            response.extensions['retries'] += rejected_response.extensions['retries'] + 1
+        return response
+
+
+    def _request(self, client: httpx.Client, method: str, url: str, deadline: float, **kwargs) -> httpx.Response:
+        """Function performs http request through the sync client.
+        Request failed on the stale connection is retried.
+        Each attempt timeout is the time remaining till the deadline (but not more than TIMEOUT).
+        httpx timeout is applied to each connect, write and read operation so response is read 
+        chunk by chunk and request is stopped once the deadline is passed.
+        Number of retries is saved in the response extensions under 'retries' key.
+
+        Args:
+            client (httpx.Client): sync client.
+            method (str): http method.
+            url (str): REST API url.
+            deadline (float): request deadline (time.monotonic).
+            **kwargs: httpx.Client.request arguments.
+
+        Returns:
+            httpx.Response: switch response.
+
+        Raises:
+            RequestDeadlineError: request is not completed before the deadline.
+        """
+
+        auth = kwargs.pop('auth', httpx.USE_CLIENT_DEFAULT)
+        for attempt in range(SwitchSession.STALE_CONNECTION_RETRIES + 1):
+            request = client.build_request(method, url, timeout=self._get_remaining_time(deadline), 
+                                           extensions={'trace': self._trace}, **kwargs)
+            try:
+                self._pool_stats['requests'] += 1
+                streamed_response = client.send(request, auth=auth, stream=True)
+                try:
+                    response = self._read_response(streamed_response, deadline)
+                finally:
+                    streamed_response.close()
+                # number of request retries is saved in the response extensions
+                response.extensions['retries'] = attempt
+                return response
+            except SwitchSession.STALE_CONNECTION_ERRORS as error:
+                self._check_stale_connection_retry(error, attempt)
+            except RequestDeadlineError:
+                raise
+            # attempt timeout is the time remaining till the deadline
+            except httpx.TimeoutException as error:
+                self._check_deadline(deadline, error)
+                raise
+
+
+    async def _request_async(self, client: httpx.AsyncClient, method: str, url: str, 
+                             deadline: float, **kwargs) -> httpx.Response:
+        """Function performs http request through the async client.
+        Request failed on the stale connection is retried.
+        Each attempt timeout is the time remaining till the deadline (but not more than TIMEOUT).
+        Number of retries is saved in the response extensions under 'retries' key.
+
+        Args:
+            client (httpx.AsyncClient): async client.
+            method (str): http method.
+            url (str): REST API url.
+            deadline (float): request deadline (time.monotonic).
+            **kwargs: httpx.AsyncClient.request arguments.
+
+        Returns:
+            httpx.Response: switch response.
+
+        Raises:
+            RequestDeadlineError: request is not completed before the deadline.
+        """
+
+        for attempt in range(SwitchSession.STALE_CONNECTION_RETRIES + 1):
+            timeout = self._get_remaining_time(deadline)
+            try:
+                self._pool_stats['requests'] += 1
+                response = await client.request(method, url, timeout=timeout, 
+                                                extensions={'trace': self._trace_async}, **kwargs)
+                # number of request retries is saved in the response extensions
+                response.extensions['retries'] = attempt
+                return response
+            except SwitchSession.STALE_CONNECTION_ERRORS as error:
+                self._check_stale_connection_retry(error, attempt)
+            except RequestDeadlineError:
+                raise
+            # attempt timeout is the time remaining till the deadline
+            except httpx.TimeoutException as error:
+                self._check_deadline(deadline, error)
+                raise
+
+
+    def _read_response(self, response: httpx.Response, deadline: float) -> httpx.Response:
+        """Function reads streamed response body chunk by chunk till the deadline.
+
+        Args:
+            response (httpx.Response): streamed switch response.
+            deadline (float): request deadline (time.monotonic).
+
+        Returns:
+            httpx.Response: switch response with the body read.
+
+        Raises:
+            RequestDeadlineError: response body is not read before the deadline.
+        """
+
+        chunks = []
+        for chunk in response.iter_raw():
+            chunks.append(chunk)
+            self._check_deadline(deadline)
+        # raw (not decoded) body is passed with the response headers so content is decoded as in the not streamed response
+        return httpx.Response(response.status_code, headers=response.headers, content=b''.join(chunks), 
+                              request=response.request, extensions=response.extensions)
+
+
+    @staticmethod
+    def _get_remaining_time(deadline: float) -> float:
+        """Function returns the time remaining till the deadline limited by TIMEOUT.
+
+        Args:
+            deadline (float): request deadline (time.monotonic).
+
+        Returns:
+            float: request attempt timeout (sec).
+
+        Raises:
+            RequestDeadlineError: deadline is passed.
+        """
+
+        SwitchSession._check_deadline(deadline)
+        return min(SwitchSession.TIMEOUT, deadline - time.monotonic())
+
+
+    @staticmethod
+    def _check_deadline(deadline: float, error: Exception = None) -> None:
+        """Function raises RequestDeadlineError if deadline is passed.
+
+        Args:
+            deadline (float): request deadline (time.monotonic).
+            error (Exception, optional): request error caused by the deadline. Defaults to None.
+        """
+
+        if time.monotonic() >= deadline:
+            raise RequestDeadlineError('Request deadline exceeded') from error
+
+
+    def _get_session_token(self, rejected_token: str = None, deadline: float = None) -> str:
+        """Function returns current session token. 
+        Session is logged in if there is no token or current token was rejected by the switch.
+
+        Args:
+            rejected_token (str, optional): token rejected by the switch. Defaults to None.
+            deadline (float, optional): login deadline (time.monotonic). Defaults to None (TIMEOUT).
+
+        Returns:
+            str: session token.
+        """
+
+        if self._token is None or self._token == rejected_token:
+            self._check_login_holdoff()
+            try:
+                response = self._request(self.client, 'POST', self._create_url('login'), 
+                                         deadline or time.monotonic() + SwitchSession.TIMEOUT, 
+                                         auth=self._auth, headers=SwitchSession.LOGIN_HEADERS)
+            # login is not completed before the request deadline (not a login failure)
+            except RequestDeadlineError:
+                raise
+            except Exception as error:
+                self._set_login_error(error)
+            self._set_session_token(response)
+        return self._token
+
+
+    async def _get_session_token_async(self, rejected_token: str = None, deadline: float = None) -> str:
+        """Function returns current session token in async mode. 
+        Session is logged in if there is no token or current token was rejected by the switch.
+        Concurrent requests wait for the single login.
+
+        Args:
+            rejected_token (str, optional): token rejected by the switch. Defaults to None.
+            deadline (float, optional): login deadline (time.monotonic). Defaults to None (TIMEOUT).
+
+        Returns:
+            str: session token.
+        """
+
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+
+        async with self._login_lock:
+            if self._token is None or self._token == rejected_token:
+                self._check_login_holdoff()
+                try:
+                    response = await self._request_async(self.async_client, 'POST', self._create_url('login'), 
+                                                         deadline or time.monotonic() + SwitchSession.TIMEOUT,
+                                                         auth=self._auth, headers=SwitchSession.LOGIN_HEADERS)
+                # login is not completed before the request deadline (not a login failure)
+                except RequestDeadlineError:
+                    raise
+                except Exception as error:
+                    self._set_login_error(error)
+                self._set_session_token(response)
+        return self._token
+
+
+    def _set_session_token(self, response: httpx.Response) -> None:
+        """Function extracts session token from the login response.
+
+        Args:
+            response (httpx.Response): switch login response.
+        """
+
+        self._pool_stats['logins'] += 1
+        self._token = None
+        try:
+            response.raise_for_status()
+            token = response.headers.get('Authorization')
+            if not token:
+                raise ValueError('Session token is not found in the login response')
+        except Exception as error:
+            self._set_login_error(error)
+        print(self.sw_ipaddress, 'logged in')
+        self._token = token
+        self._login_error = None
+        self._login_error_time = None
+
+
+    def _check_login_holdoff(self) -> None:
+        """Function raises last login error if login failed during LOGIN_HOLDOFF time."""
+
+        if self._login_error is not None and time.monotonic() - self._login_error_time < SwitchSession.LOGIN_HOLDOFF:
+            raise self._login_error
+
+
+    def _set_login_error(self, error: Exception) -> None:
+        """Function saves login error and raises it.
+
+        Args:
+            error (Exception): login error.
+        """
+
+        print(self.sw_ipaddress, 'login failed', str(error))
+        self._login_error = error
+        self._login_error_time = time.monotonic()
+        raise error
+
+
+    def _logout(self) -> None:
+        """Function logs out switch session and drops session token."""
+
+        if self._token is None:
+            return
+        try:
+            self._request(self.client, 'POST', self._create_url('logout'), time.monotonic() + SwitchSession.TIMEOUT,
+                          headers=self._add_token(SwitchSession.LOGIN_HEADERS, self._token))
+            print(self.sw_ipaddress, 'logged out')
+        except Exception as error:
+            print(self.sw_ipaddress, 'logout failed', str(error))
+        self._token = None
+
+
+    def _create_url(self, path: str) -> str:
+        """Function generates REST API url for the path.
+
+        Args:
+            path (str): REST API path (for example login).
+
+        Returns:
+            str: REST API url.
+        """
+
+        return SwitchSession.get_rest_url(self.sw_ipaddress, self.secure_access, self.rest_port) + path
+
+
+    @staticmethod
+    def get_rest_url(sw_ipaddress: str, secure_access: bool = False, rest_port: int = None) -> str:
+        """Function generates REST API base url of the switch.
+
+        Args:
+            sw_ipaddress (str): IP address of the switch.
+            seccure_access (bool): True if https is used. False if http is used. Default is False (http).
+            rest_port (int): REST API port of the switch. Defaults to None (default port of the protocol).
+
+        Returns:
+            str: REST API base url (for example http://10.10.10.10/rest/).
+        """
+
+        login_protocol = ('https' if secure_access else 'http') + r'://'
+        host = sw_ipaddress if rest_port is None else f'{sw_ipaddress}:{rest_port}'
+        return login_protocol + host + '/rest/'
+
+
+    @staticmethod
+    def _add_token(headers: dict, token: str) -> dict:
+        """Function adds session token to the request headers.
+
+        Args:
+            headers (dict): request headers.
+            token (str): session token.
+
+        Returns:
+            dict: request headers with Authorization session token.
+        """
+
+        return {**(headers or {}), 'Authorization': token}
+
+
+    def probe(self, headers: dict = None, timeout: float = PROBE_TIMEOUT) -> bool:
+        """Function checks if switch is reachable with the single chassis request.
+
+        Args:
+            headers (dict): request headers. Defaults to None.
+            timeout (float): probe request timeout (sec). Defaults to PROBE_TIMEOUT.
+
+        Returns:
+            bool: True if switch responded (any status code), False if request failed.
+        """
+
+        try:
+            response = self.get(self._create_url(SwitchSession.PROBE_PATH), headers=headers, timeout=timeout)
+        except Exception as error:
+            print(self.sw_ipaddress, 'probe failed', str(error))
+            return False
+        print(self.sw_ipaddress, 'probe', response.status_code)
+        return True
+
+
+    def run(self, coroutine):
+        """Function runs coroutine in the session event loop.
+        Async client connections are bound to this loop so it is reused by all cycles.
+
+        Args:
+            coroutine: coroutine to run.
+
+        Returns:
+            coroutine result.
+        """
+
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+
+    def close(self) -> None:
+        """Function logs out switch session, closes all pool connections and session event loop."""
+
+        if self.auth_mode == 'session':
+            self._logout()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._async_client is not None:
+            self.run(self._async_client.aclose())
+            self._async_client = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        # lock is bound to the closed loop
+        self._login_lock = None
+
+
+    def _check_stale_connection_retry(self, error: Exception, attempt: int) -> None:
+        """Function checks if request failed on the stale connection should be retried.
+        Error is raised if all retries are exhausted.
+
+        Args:
+            error (Exception): request exception.
+            attempt (int): attempt number.
+        """
+
+        if attempt == SwitchSession.STALE_CONNECTION_RETRIES:
+            raise error
+        print(self.sw_ipaddress, 'stale connection', str(error), 'retry')
+        self._pool_stats['stale-connection-retries'] += 1
+
+
+    def _trace(self, event_name: str, info: dict) -> None:
+        """Function counts new TCP connections and TLS handshakes (httpcore trace extension callback)."""
+
+        if event_name == 'connection.connect_tcp.complete':
+            self._pool_stats['tcp-connections'] += 1
+        elif event_name == 'connection.start_tls.complete':
+            self._pool_stats['tls-handshakes'] += 1
+
+
+    async def _trace_async(self, event_name: str, info: dict) -> None:
+        """Async version of the trace extension callback."""
+
+        self._trace(event_name, info)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
+
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = httpx.Client(verify=False, limits=self._limits, timeout=SwitchSession.TIMEOUT)
+        return self._client
+
+
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(verify=False, limits=self._limits, timeout=SwitchSession.TIMEOUT)
+        return self._async_client
+
+
+    @property
+    def sw_ipaddress(self):
+        return str(self._sw_ipaddress)
+
+
+    @property
+    def username(self):
+        return self._username
+
+
+    @property
+    def password(self):
+        return self._password
+
+
+    @property
+    def secure_access(self):
+        return self._secure_access
+
+
+    @property
+    def auth_mode(self):
+        return self._auth_mode
+
+
+    @property
+    def rest_port(self):
+        return self._rest_port
+
+
+    @property
+    def pool_stats(self):
+        return dict(self._pool_stats)
@@ -1,9 +1,14 @@
+import asyncio
+import time
 from datetime import datetime
 from ipaddress import ip_address
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 import httpx
-from requests.auth import HTTPBasicAuth
+
+from .module_scheduler import ModuleScheduler
+from .request_budget import RequestBudget
+from .switch_session import RequestDeadlineError, SwitchSession
 
 
 
@@ -25,6 +30,11 @@ class SwitchTelemetryRequest:
         username (str): Username to access the switch.
         password (str): Password to access the switch.
         seccure_access (bool): True if httttps is used. False if http is used. Default is False (http).
+        async_mode (bool): True if modules are requested concurrently (httpx.AsyncClient). Default is False (sequential requests).
+        max_concurrent_requests (int): maximum number of simultaneous requests to the switch in async mode.
+        cycle_timeout (float): requests timeout of the polling cycle. Low priority modules are cancelled 
+            if cycle budget is exhausted while core modules are requested till the cycle timeout.
+        rest_port (int): REST API port of the switch. None if default port of the protocol is used (80 or 443).
     """
     
 
@@ -35,23 +45,53 @@ class SwitchTelemetryRequest:
     
     VF_MODE_RETRIEVE_ERROR = {'errors': {'error': [{'error-message': 'VF mode has not been retreived'}]}}
     VF_ID_RETRIEVE_ERROR = {'errors': {'error': [{'error-message': 'VF IDs has not been retreived'}]}}
+    CANCELLED_REQUEST_ERROR = 'Request cancelled, polling cycle timeout exceeded'
 
     VALID_STATUS_CODES = [200, 400, 404]
+
+    # maximum number of simultaneous requests to the switch in async mode
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # failed request keys copied to the stale telemetry
+    REQUEST_STATISTICS_KEYS = ['request-duration', 'response-bytes', 'decode-duration', 
+                               'request-retries', 'module-retries', 'cancelled']
+
+    # number of retries of the failed module requests within the polling cycle
+    MODULE_RETRIES = 2
+    # delay before the failed module requests retry (sec), multiplied by the attempt number
+    MODULE_RETRY_DELAY = 1
     
 
-    def __init__(self, sw_ipaddress: ip_address, username: str, password: str, secure_access: bool = False):
+    def __init__(self, sw_ipaddress: ip_address, username: str, password: str, secure_access: bool = False, 
+                 async_mode: bool = False, max_concurrent_requests: int = None, session: SwitchSession = None, 
+                 scheduler: ModuleScheduler = None, cycle_timeout: float = None, rest_port: int = None):
         """
         Args:
             sw_ipaddress (ip_address): IP address of the switch.
             username (str): Username to access the switch.
             password (str): Password to access the switch.
             seccure_access (bool): True if httttps is used. False if http is used. Default is False (http).
+            async_mode (bool): True if modules are requested concurrently. False if modules are requested one by one. 
+                Default is False (sequential requests).
+            max_concurrent_requests (int): maximum number of simultaneous requests to the switch in async mode. 
+                Defaults to None (MAX_CONCURRENT_REQUESTS).
+            session (SwitchSession): long-lived switch session which connections are reused across polling cycles. 
+                Defaults to None (temporary session is opened and closed for the current request).
+            scheduler (ModuleScheduler): module requests scheduler. Modules which interval is not expired 
+                are filled with the last good response. Defaults to None (all modules are requested).
+            cycle_timeout (float): requests timeout of the polling cycle (sec). Module timeout is derived from 
+                the time remaining and module latency history. Cancelled module is filled with the last good response 
+                if available. Defaults to None (session timeout for each request, requests are not cancelled).
+            rest_port (int): REST API port of the switch. Defaults to None (default port of the protocol).
         """
         
         self._sw_ipaddress = ip_address(sw_ipaddress)
         self._username = username
         self._password = password
         self._secure_access = secure_access
+        self._rest_port = rest_port
+        self._async_mode = async_mode
+        self._max_concurrent_requests = max_concurrent_requests or SwitchTelemetryRequest.MAX_CONCURRENT_REQUESTS
 
         self._corrupted_request = False
         
@@ -81,14 +121,6 @@ class SwitchTelemetryRequest:
             [self._sw_license, ('brocade-license', 'license')]
             ]
         
-        with httpx.Client(verify=False) as client:
-            for container, (module_name, module_type) in self._ch_unique_containers:
-                container.update(self._get_sw_telemetry(client, module_name, module_type))
-                SwitchTelemetryRequest._get_container_error_message(container)
-            
-        self._vf_enabled = self._check_vfmode_on()
-        self._vfid_lst = self._get_vfid_list()
-        
         # VF dependent attributes
         self._fabric_switch = {}
         self._fc_switch = {}
@@ -128,93 +160,540 @@ class SwitchTelemetryRequest:
             [self._media_rdp, ('brocade-media', 'media-rdp')]
             ]
         
-        with httpx.Client(verify=False) as client:
+        # session and scheduler are not saved as attributes since telemetry is pickled to the database
+        # temporary session is opened if long-lived session is not provided 
+        sw_session = session if session is not None else SwitchSession(sw_ipaddress, username, password, secure_access, 
+                                                                       rest_port=rest_port)
+        # module timeouts within the polling cycle
+        budget = RequestBudget(cycle_timeout, scheduler)
+        try:
+            if self.async_mode:
+                sw_session.run(self._collect_telemetry_async(sw_session, budget, scheduler))
+            else:
+                self._collect_telemetry(sw_session, budget, scheduler)
+        finally:
+            if session is None:
+                sw_session.close()
+
+
+    def _collect_telemetry(self, session: SwitchSession, budget: RequestBudget, scheduler: ModuleScheduler = None) -> None:
+        """Function requests VF independent modules and then VF dependent modules one by one 
+        and fills the corresponding containers.
+
+        Args:
+            session (SwitchSession): switch session to perform requests.
+            budget (RequestBudget): module requests timeouts within the polling cycle.
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None.
+        """
+
+        # VF independent modules
+        ch_request_lst = self._get_scheduled_requests(self._get_ch_requests(), scheduler)
+        ch_telemetry_lst = [self._get_budgeted_telemetry(session, budget, request, scheduler) for request in ch_request_lst]
+        # failed requests are retried
+        for attempt, failed_request_idx in self._get_failed_requests(ch_telemetry_lst):
+            time.sleep(SwitchTelemetryRequest.MODULE_RETRY_DELAY * attempt)
+            for idx in failed_request_idx:
+                ch_telemetry_lst[idx] = self._get_budgeted_telemetry(session, budget, ch_request_lst[idx], scheduler, attempt)
+
+        for request, current_telemetry in zip(ch_request_lst, ch_telemetry_lst):
+            self._set_container_telemetry(request, current_telemetry, scheduler)
+        
+        self._vf_enabled = self._check_vfmode_on()
+        self._vfid_lst = self._get_vfid_list()
+
+        # VF dependent modules
+        vf_request_lst = self._get_scheduled_requests(self._get_vf_requests(), scheduler)
+        vf_telemetry_lst = [self._get_budgeted_telemetry(session, budget, request, scheduler) for request in vf_request_lst]
+        # failed requests are retried
+        for attempt, failed_request_idx in self._get_failed_requests(vf_telemetry_lst):
+            time.sleep(SwitchTelemetryRequest.MODULE_RETRY_DELAY * attempt)
+            for idx in failed_request_idx:
+                vf_telemetry_lst[idx] = self._get_budgeted_telemetry(session, budget, vf_request_lst[idx], scheduler, attempt)
+
+        for request, current_telemetry in zip(vf_request_lst, vf_telemetry_lst):
+            self._set_container_telemetry(request, current_telemetry, scheduler)
+
+
+    async def _collect_telemetry_async(self, session: SwitchSession, budget: RequestBudget, 
+                                       scheduler: ModuleScheduler = None) -> None:
+        """Function requests all VF independent modules concurrently, 
+        then requests all (module, vf_id) pairs of the VF dependent modules concurrently 
+        and fills the corresponding containers. 
+        Number of simultaneous requests is limited by max_concurrent_requests.
+
+        Args:
+            session (SwitchSession): switch session to perform requests.
+            budget (RequestBudget): module requests timeouts within the polling cycle.
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        # VF independent modules
+        ch_request_lst = self._get_scheduled_requests(self._get_ch_requests(), scheduler)
+        ch_telemetry_lst = await asyncio.gather(
+            *[self._get_budgeted_telemetry_async(session, semaphore, budget, request, scheduler) 
+              for request in ch_request_lst])
+        # failed requests are retried concurrently
+        for attempt, failed_request_idx in self._get_failed_requests(ch_telemetry_lst):
+            await asyncio.sleep(SwitchTelemetryRequest.MODULE_RETRY_DELAY * attempt)
+            retry_telemetry_lst = await asyncio.gather(
+                *[self._get_budgeted_telemetry_async(session, semaphore, budget, ch_request_lst[idx], scheduler, attempt) 
+                  for idx in failed_request_idx])
+            for idx, current_telemetry in zip(failed_request_idx, retry_telemetry_lst):
+                ch_telemetry_lst[idx] = current_telemetry
+        
+        for request, current_telemetry in zip(ch_request_lst, ch_telemetry_lst):
+            self._set_container_telemetry(request, current_telemetry, scheduler)
+
+        self._vf_enabled = self._check_vfmode_on()
+        self._vfid_lst = self._get_vfid_list()
+
+        # VF dependent modules
+        vf_request_lst = self._get_scheduled_requests(self._get_vf_requests(), scheduler)
+        vf_telemetry_lst = await asyncio.gather(
+            *[self._get_budgeted_telemetry_async(session, semaphore, budget, request, scheduler) 
+              for request in vf_request_lst])
+        # failed requests are retried concurrently
+        for attempt, failed_request_idx in self._get_failed_requests(vf_telemetry_lst):
+            await asyncio.sleep(SwitchTelemetryRequest.MODULE_RETRY_DELAY * attempt)
+            retry_telemetry_lst = await asyncio.gather(
+                *[self._get_budgeted_telemetry_async(session, semaphore, budget, vf_request_lst[idx], scheduler, attempt) 
+                  for idx in failed_request_idx])
+            for idx, current_telemetry in zip(failed_request_idx, retry_telemetry_lst):
+                vf_telemetry_lst[idx] = current_telemetry
         
-            # vf mode value is not retrieved
-            if self._vf_enabled is None:
-                # ch_container_error = BrocadeSwitchTelemetry._get_container_error_message(self._chassis)
-                for container, _ in self._vf_unique_containers:
-                    container[-2] = SwitchTelemetryRequest.VF_MODE_RETRIEVE_ERROR
-                    container[-2]['status-code'] = None
-                    container[-2]['date'] = datetime.now().strftime("%d/%m/%Y")
-                    container[-2]['time'] = datetime.now().strftime("%H:%M:%S")
-                    
-                    # container[-2] = self._chassis
-                    SwitchTelemetryRequest._get_container_error_message(container[-2])
+        for request, current_telemetry in zip(vf_request_lst, vf_telemetry_lst):
+            self._set_container_telemetry(request, current_telemetry, scheduler)
+
+
+    @staticmethod
+    def _get_failed_requests(telemetry_lst: List[dict]):
+        """Function yields retry attempt number and indexes of the failed requests to retry.
+        Request is failed if status code is not valid. Cancelled requests are not retried (cycle budget is exhausted).
+        Failed requests are retried till all requests succeed or MODULE_RETRIES attempts are exhausted.
+        telemetry_lst is expected to be updated with the retry results before the next attempt.
+
+        Args:
+            telemetry_lst (List[dict]): telemetry of the requests.
+
+        Yields:
+            Tuple[int, List[int]]: retry attempt number and indexes of the failed requests in telemetry_lst.
+        """
+
+        for attempt in range(1, SwitchTelemetryRequest.MODULE_RETRIES + 1):
+            failed_request_idx = [idx for idx, current_telemetry in enumerate(telemetry_lst) 
+                                  if current_telemetry['status-code'] not in SwitchTelemetryRequest.VALID_STATUS_CODES 
+                                  and not current_telemetry.get('cancelled')]
+            if not failed_request_idx:
+                return
+            print(f'Retry {attempt} of {len(failed_request_idx)} failed request(s)')
+            yield attempt, failed_request_idx
+
+
+    def _get_ch_requests(self) -> List[Tuple[dict, None, str, str, None]]:
+        """Function defines the list of VF independent module requests.
+
+        Returns:
+            List[Tuple[dict, None, str, str, None]]: list of requests. 
+                Each request is a container, container key (None), module_name, module_type and vf_id (None).
+        """
+
+        return [(container, None, module_name, module_type, None) 
+                for container, (module_name, module_type) in self._ch_unique_containers]
+
+
+    def _get_scheduled_requests(self, request_lst: List[tuple], scheduler: ModuleScheduler = None) -> List[tuple]:
+        """Function fills containers of the modules which interval is not expired with the last good response
+        and returns the list of requests which need to be performed in the current cycle.
+
+        Args:
+            request_lst (List[tuple]): list of requests (container, container key, module_name, module_type, vf_id).
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None (all modules are requested).
+
+        Returns:
+            List[tuple]: list of requests to perform.
+        """
+
+        if scheduler is None:
+            return request_lst
+        
+        due_request_lst = []
+        for request in request_lst:
+            _, container_key, module_name, module_type, _ = request
+            if scheduler.is_due(module_name, module_type, container_key):
+                due_request_lst.append(request)
+            else:
+                print(module_name, module_type, 'cached')
+                self._set_container_telemetry(request, scheduler.get_saved_telemetry(module_name, module_type, container_key))
+        return due_request_lst
+
+
+    def _set_container_telemetry(self, request: tuple, current_telemetry: dict, scheduler: ModuleScheduler = None) -> None:
+        """Function fills request container with the module telemetry and container error message.
+        If status code is not valid (after retries) container is filled with the last good response 
+        saved in the scheduler (stale telemetry). If there is no last good response or its age exceeds 
+        the scheduler stale age limit container is filled with the failed request telemetry.
+        Request is marked as corrupted if status code of the request (failed request for the stale telemetry) is not valid.
+        Telemetry with valid status code is saved in the scheduler to be reused till module refresh
+        (reused telemetry is not saved again).
+
+        Args:
+            request (tuple): request (container, container key, module_name, module_type, vf_id).
+            current_telemetry (dict): module telemetry.
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None.
+        """
+
+        container, container_key, module_name, module_type, _ = request
+        # failed module is served from the last good response
+        if (current_telemetry['status-code'] not in SwitchTelemetryRequest.VALID_STATUS_CODES 
+                and scheduler is not None and scheduler.has_stale_telemetry(module_name, module_type, container_key)):
+            current_telemetry = SwitchTelemetryRequest._get_stale_telemetry(request, current_telemetry, scheduler)
+        # VF independent module container 
+        if container_key is None:
+            container.update(current_telemetry)
+        # VF dependent module container
+        else:
+            container[container_key] = current_telemetry
+            container = container[container_key]
+        SwitchTelemetryRequest._get_container_error_message(container)
+        if current_telemetry.get('stale'):
+            container['error-message'] = current_telemetry['failed-error-message']
+
+        # stale telemetry has valid status code of the last good response but the request failed
+        if not SwitchTelemetryRequest._get_request_status_code(current_telemetry) in SwitchTelemetryRequest.VALID_STATUS_CODES:
+            print(module_name, module_type, 'corrupted request')
+            self.corrupted_request = True
+        
+        if (scheduler is not None and not current_telemetry.get('cached') 
+                and current_telemetry['status-code'] in SwitchTelemetryRequest.VALID_STATUS_CODES):
+            scheduler.save_telemetry(module_name, module_type, container_key, current_telemetry)
+
+
+    def _get_vf_requests(self) -> List[Tuple[dict, int, str, str, Optional[int]]]:
+        """Function defines the list of VF dependent module requests depending on the VF mode and VF IDs.
+        If VF mode or VF IDs were not retrieved then VF dependent containers are filled with error message.
+
+        Returns:
+            List[Tuple[dict, int, str, str, Optional[int]]]: list of requests. 
+                Each request is a container, container key, module_name, module_type and vf_id to request.
+        """
+
+        vf_request_lst = []
+        
+        # vf mode value is not retrieved
+        if self._vf_enabled is None:
+            # ch_container_error = BrocadeSwitchTelemetry._get_container_error_message(self._chassis)
+            for container, _ in self._vf_unique_containers:
+                container[-2] = SwitchTelemetryRequest.VF_MODE_RETRIEVE_ERROR
+                container[-2]['status-code'] = None
+                container[-2]['date'] = datetime.now().strftime("%d/%m/%Y")
+                container[-2]['time'] = datetime.now().strftime("%H:%M:%S")
+                
+                # container[-2] = self._chassis
+                SwitchTelemetryRequest._get_container_error_message(container[-2])
+        
+        # vf mode disabled
+        elif not self._vf_enabled:
+            for container, (module_name, module_type) in self._vf_unique_containers:
+                vf_request_lst.append((container, -1, module_name, module_type, None))
+        
+        # vf mode is enabled but vf ids was not extracted
+        elif self._vfid_lst is None:
+            # fc_logical_sw_container_error = BrocadeSwitchTelemetry._get_container_error_message(self._fc_logical_switch)
+            for container, _ in self._vf_unique_containers:
+                container[-3] = SwitchTelemetryRequest.VF_ID_RETRIEVE_ERROR
+                container[-3]['status-code'] = None
+                container[-3]['date'] = datetime.now().strftime("%d/%m/%Y")
+                container[-3]['time'] = datetime.now().strftime("%H:%M:%S")
+                # container[-3] = self._fc_logical_switch
+                SwitchTelemetryRequest._get_container_error_message(container[-3])
             
-            # vf mode disabled
-            elif not self._vf_enabled:
-                for container, (module_name, module_type) in self._vf_unique_containers:
-                    container[-1] = self._get_sw_telemetry(client, module_name, module_type)
-                    SwitchTelemetryRequest._get_container_error_message(container[-1])
+        # vf mode is enabled with single virtual switch
+        elif self._vfid_lst and len(self._vfid_lst) == 1:
+            vf_id = self._vfid_lst[0]
+            for container, (module_name, module_type) in self._vf_unique_containers:
+                vf_request_lst.append((container, vf_id, module_name, module_type, None))
             
-            # vf mode is enabled but vf ids was not extracted
-            elif self._vfid_lst is None:
-                # fc_logical_sw_container_error = BrocadeSwitchTelemetry._get_container_error_message(self._fc_logical_switch)
-                for container, _ in self._vf_unique_containers:
-                    container[-3] = SwitchTelemetryRequest.VF_ID_RETRIEVE_ERROR
-                    container[-3]['status-code'] = None
-                    container[-3]['date'] = datetime.now().strftime("%d/%m/%Y")
-                    container[-3]['time'] = datetime.now().strftime("%H:%M:%S")
-                    # container[-3] = self._fc_logical_switch
-                    SwitchTelemetryRequest._get_container_error_message(container[-3])
-                
-            # vf mode is enabled with single virtual switch
-            elif self._vfid_lst and len(self._vfid_lst) == 1:
-                vf_id = self._vfid_lst[0]
+        # vf mode is enabled with multiple virtual switches   
+        elif self._vfid_lst and len(self._vfid_lst) > 1:
+            for vf_id in self._vfid_lst:
                 for container, (module_name, module_type) in self._vf_unique_containers:
-                    container[vf_id] = self._get_sw_telemetry(client, module_name, module_type)
-                    SwitchTelemetryRequest._get_container_error_message(container[vf_id])
-                
-            # vf mode is enabled with multiple virtual switches   
-            elif self._vfid_lst and len(self._vfid_lst) > 1:
-                
-                for vf_id in self._vfid_lst:
-                    for container, (module_name, module_type) in self._vf_unique_containers:
-                        container[vf_id] = self._get_sw_telemetry(client, module_name, module_type, vf_id)
-                        SwitchTelemetryRequest._get_container_error_message(container[vf_id])
+                    vf_request_lst.append((container, vf_id, module_name, module_type, vf_id))
+        return vf_request_lst
+
+
+    def _get_budgeted_telemetry(self, session: SwitchSession, budget: RequestBudget, 
+                                request: tuple, scheduler: ModuleScheduler = None, attempt: int = 0) -> dict:
+        """Funtion retrieves switch telemetry of the request with the timeout from the cycle budget.
+        Request is cancelled if module budget is exhausted or request is not completed in the module timeout.
 
+        Args:
+            session (SwitchSession): switch session to perform request.
+            budget (RequestBudget): module requests timeouts within the polling cycle.
+            request (tuple): request (container, container key, module_name, module_type, vf_id).
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None.
+            attempt (int): retry attempt number saved under 'module-retries' key. Defaults to 0 (first request).
 
-    def _get_sw_telemetry(self, client: httpx.Client, module_name: str, module_type: str, vf_id: int=None) -> dict:
+        Returns:
+            dict: switch telemetry of the request.
+        """
+
+        _, container_key, module_name, module_type, vf_id = request
+        timeout = budget.get_timeout(module_name, module_type, container_key)
+        if timeout is None:
+            current_telemetry = self._get_cancelled_telemetry(request, scheduler)
+        else:
+            current_telemetry = self._get_sw_telemetry(session, module_name, module_type, vf_id, timeout)
+            budget.update_latency(module_name, module_type, container_key, current_telemetry.get('request-duration'))
+            self._check_deadline_cancelled(current_telemetry, budget, module_name, module_type)
+        current_telemetry['module-retries'] = attempt
+        return current_telemetry
+
+
+    async def _get_budgeted_telemetry_async(self, session: SwitchSession, semaphore: asyncio.Semaphore, budget: RequestBudget, 
+                                            request: tuple, scheduler: ModuleScheduler = None, attempt: int = 0) -> dict:
+        """Funtion retrieves switch telemetry of the request with the timeout from the cycle budget in async mode.
+        Timeout is calculated when request acquires semaphore. Request is cancelled if module budget is exhausted
+        or request is not completed in the module timeout.
+
+        Args:
+            session (SwitchSession): switch session to perform request.
+            semaphore (asyncio.Semaphore): semaphore to limit number of simultaneous requests to the switch.
+            budget (RequestBudget): module requests timeouts within the polling cycle.
+            request (tuple): request (container, container key, module_name, module_type, vf_id).
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None.
+            attempt (int): retry attempt number saved under 'module-retries' key. Defaults to 0 (first request).
+
+        Returns:
+            dict: switch telemetry of the request.
+        """
+
+        _, container_key, module_name, module_type, vf_id = request
+        async with semaphore:
+            timeout = budget.get_timeout(module_name, module_type, container_key)
+            if timeout is None:
+                current_telemetry = self._get_cancelled_telemetry(request, scheduler)
+            else:
+                current_telemetry = await self._get_sw_telemetry_async(session, module_name, module_type, vf_id, timeout)
+                budget.update_latency(module_name, module_type, container_key, current_telemetry.get('request-duration'))
+                self._check_deadline_cancelled(current_telemetry, budget, module_name, module_type)
+        current_telemetry['module-retries'] = attempt
+        return current_telemetry
+
+
+    @staticmethod
+    def _check_deadline_cancelled(current_telemetry: dict, budget: RequestBudget, module_name: str, module_type: str) -> None:
+        """Function marks request stopped at the module timeout deadline as cancelled if polling cycle is budgeted.
+        Cancelled request is not retried within the cycle. If cycle is not budgeted request is failed (retried).
+
+        Args:
+            current_telemetry (dict): module telemetry.
+            budget (RequestBudget): module requests timeouts within the polling cycle.
+            module_name (str): requested module (for example brocade-fru)
+            module_type (str): requested sub-module in a module tree (for example fan or power-supply)
+        """
+
+        if current_telemetry.pop('deadline-exceeded', False) and budget.cycle_timeout is not None:
+            budget.add_cancelled()
+            current_telemetry['cancelled'] = True
+            print(module_name, module_type, 'cancelled')
+
+
+    def _get_cancelled_telemetry(self, request: tuple, scheduler: ModuleScheduler = None) -> dict:
+        """Function creates telemetry of the cancelled request with error message and 'cancelled' flag.
+        Cancelled module container is filled with the last good response (if saved) as any failed request.
+
+        Args:
+            request (tuple): request (container, container key, module_name, module_type, vf_id).
+            scheduler (ModuleScheduler): module requests scheduler. Defaults to None.
+
+        Returns:
+            dict: telemetry of the cancelled request with 'cancelled' flag.
+        """
+
+        _, _, module_name, module_type, _ = request
+        current_telemetry = {'errors': {'error': [{'error-message': SwitchTelemetryRequest.CANCELLED_REQUEST_ERROR}]}}
+        current_telemetry['status-code'] = None
+        current_telemetry['date'] = datetime.now().strftime("%d/%m/%Y")
+        current_telemetry['time'] = datetime.now().strftime("%H:%M:%S")
+        current_telemetry['cancelled'] = True
+        print(module_name, module_type, 'cancelled')
+        return current_telemetry
+
+
+    @staticmethod
+    def _get_stale_telemetry(request: tuple, failed_telemetry: dict, scheduler: ModuleScheduler) -> dict:
+        """Function creates telemetry of the failed request from the last good module response (degraded mode).
+        Stale telemetry has 'stale' flag, failed request status code and error message 
+        (under 'failed-status-code', 'failed-error-message' keys), failed request statistics 
+        and last good response age (under 'telemetry-age' key).
+
+        Args:
+            request (tuple): request (container, container key, module_name, module_type, vf_id).
+            failed_telemetry (dict): telemetry of the failed request.
+            scheduler (ModuleScheduler): module requests scheduler with the last good response.
+
+        Returns:
+            dict: stale module telemetry.
+        """
+
+        _, container_key, module_name, module_type, _ = request
+        SwitchTelemetryRequest._get_container_error_message(failed_telemetry)
+        stale_telemetry = scheduler.get_saved_telemetry(module_name, module_type, container_key)
+        stale_telemetry['stale'] = True
+        stale_telemetry['failed-status-code'] = failed_telemetry['status-code']
+        stale_telemetry['failed-error-message'] = failed_telemetry['error-message']
+        # request statistics of the failed request
+        for key in SwitchTelemetryRequest.REQUEST_STATISTICS_KEYS:
+            stale_telemetry[key] = failed_telemetry.get(key)
+        print(module_name, module_type, f"stale, last good response age {stale_telemetry['telemetry-age']:.0f}s")
+        return stale_telemetry
+
+
+    @staticmethod
+    def _get_request_status_code(telemetry: dict) -> Optional[int]:
+        """Function returns status code of the module request performed in the current cycle.
+        Stale telemetry is filled with the last good response so status code of the failed request is returned.
+
+        Args:
+            telemetry (dict): module telemetry.
+
+        Returns:
+            Optional[int]: request status code. None if there is no http response.
+        """
+
+        if telemetry.get('stale'):
+            return telemetry.get('failed-status-code')
+        return telemetry.get('status-code')
+
+
+    def _get_sw_telemetry(self, session: SwitchSession, module_name: str, module_type: str, vf_id: int=None, 
+                          timeout: float = SwitchSession.TIMEOUT) -> dict:
         """Funtion retrieves switch telemetry of the module_name and module_type for the vf_id.
 
         Args:
-            client (httpx.Client): client to connect to the switch.
+            session (SwitchSession): switch session to perform request.
             module_name (str): module to request (for example brocade-fru)
             module_type (str): sub-module in a module tree to request (for example fan or power-supply)
             vf_id (int, optional): virtual fabric id for the VF dependent modules. Defaults to None.
+            timeout (float, optional): request timeout (sec) including retries and re-login. 
+                Defaults to SwitchSession.TIMEOUT.
 
         Returns:
             dict: switch telemetry of the module_name and module_type for the vf_id.
+                Telemetry of the request stopped at the timeout deadline has 'deadline-exceeded' flag.
         """
 
         url = self._create_restapi_url(module_name, module_type)
         params = {'vf-id': vf_id} if vf_id else {}
         
+        start_time = time.perf_counter()
         try:
-            response = client.get(url, 
-                                    auth=HTTPBasicAuth(self.username, self.password),
+            response = session.get(url, 
                                     params=params,
-                                    headers=SwitchTelemetryRequest.HEADERS,
-                                    timeout=31)
-            current_telemetry = response.json()
-            current_telemetry['status-code'] = response.status_code
-            current_telemetry['date'] = datetime.now().strftime("%d/%m/%Y")
-            current_telemetry['time'] = datetime.now().strftime("%H:%M:%S")
-            if not response.status_code in SwitchTelemetryRequest.VALID_STATUS_CODES:
-                print(module_name, module_type, 'corrupted request')
-                self.corrupted_request = True    
-            print(module_name, module_type, response.status_code)
-            return current_telemetry
+                                    headers=SwitchTelemetryRequest.HEADERS, 
+                                    timeout=timeout)
+            return self._get_response_telemetry(response, module_name, module_type, time.perf_counter() - start_time)
         
+        # request is stopped at the timeout deadline
+        except RequestDeadlineError as error:
+            current_telemetry = self._get_error_telemetry(error, module_name, module_type, time.perf_counter() - start_time)
+            current_telemetry['deadline-exceeded'] = True
+            return current_telemetry
+
         except (Exception) as error:
-            current_telemetry ={'errors': {'error': [{'error-message': str(error)}]}}
-            current_telemetry['status-code'] = None
-            current_telemetry['date'] = datetime.now().strftime("%d/%m/%Y")
-            current_telemetry['time'] = datetime.now().strftime("%H:%M:%S")
-            print(module_name, module_type, str(error))
-            self.corrupted_request = True
+            return self._get_error_telemetry(error, module_name, module_type, time.perf_counter() - start_time)
+
+
+    async def _get_sw_telemetry_async(self, session: SwitchSession, module_name: str, module_type: str, 
+                                      vf_id: int=None, timeout: float = SwitchSession.TIMEOUT) -> dict:
+        """Funtion retrieves switch telemetry of the module_name and module_type for the vf_id in async mode.
+
+        Args:
+            session (SwitchSession): switch session to perform request.
+            module_name (str): module to request (for example brocade-fru)
+            module_type (str): sub-module in a module tree to request (for example fan or power-supply)
+            vf_id (int, optional): virtual fabric id for the VF dependent modules. Defaults to None.
+            timeout (float, optional): request timeout (sec) including retries and re-login. 
+                Defaults to SwitchSession.TIMEOUT.
+
+        Returns:
+            dict: switch telemetry of the module_name and module_type for the vf_id.
+                Telemetry of the request stopped at the timeout deadline has 'deadline-exceeded' flag.
+        """
+
+        url = self._create_restapi_url(module_name, module_type)
+        params = {'vf-id': vf_id} if vf_id else {}
+        
+        start_time = time.perf_counter()
+        try:
+            response = await session.get_async(url, 
+                                                params=params,
+                                                headers=SwitchTelemetryRequest.HEADERS, 
+                                                timeout=timeout)
+            return self._get_response_telemetry(response, module_name, module_type, time.perf_counter() - start_time)
+        
+        # request is stopped at the timeout deadline
+        except RequestDeadlineError as error:
+            current_telemetry = self._get_error_telemetry(error, module_name, module_type, time.perf_counter() - start_time)
+            current_telemetry['deadline-exceeded'] = True
             return current_telemetry
+
+        except (Exception) as error:
+            return self._get_error_telemetry(error, module_name, module_type, time.perf_counter() - start_time)
+
+
+    def _get_response_telemetry(self, response: httpx.Response, module_name: str, module_type: str, 
+                                request_duration: float = None) -> dict:
+        """Function converts switch response to the module telemetry and adds status code, request date and time
+        and request statistics (request duration, response size, json decode duration and number of retries).
+
+        Args:
+            response (httpx.Response): switch response.
+            module_name (str): requested module (for example brocade-fru)
+            module_type (str): requested sub-module in a module tree (for example fan or power-supply)
+            request_duration (float, optional): request duration (sec) including retries. Defaults to None.
+
+        Returns:
+            dict: switch telemetry of the module_name and module_type.
+        """
+
+        start_time = time.perf_counter()
+        current_telemetry = response.json()
+        current_telemetry['decode-duration'] = time.perf_counter() - start_time
+        current_telemetry['request-duration'] = request_duration
+        current_telemetry['response-bytes'] = len(response.content)
+        current_telemetry['request-retries'] = response.extensions.get('retries')
+        current_telemetry['status-code'] = response.status_code
+        current_telemetry['date'] = datetime.now().strftime("%d/%m/%Y")
+        current_telemetry['time'] = datetime.now().strftime("%H:%M:%S")
+        print(module_name, module_type, response.status_code, 
+              f"{current_telemetry['request-duration'] or 0:.3f}s", f"{current_telemetry['response-bytes']}B")
+        return current_telemetry
+
+
+    def _get_error_telemetry(self, error: Exception, module_name: str, module_type: str, 
+                             request_duration: float = None) -> dict:
+        """Function creates module telemetry with error message if request failed.
+
+        Args:
+            error (Exception): request exception.
+            module_name (str): requested module (for example brocade-fru)
+            module_type (str): requested sub-module in a module tree (for example fan or power-supply)
+            request_duration (float, optional): duration (sec) till request failure. Defaults to None.
+
+        Returns:
+            dict: switch telemetry with error message.
+        """
+
+        current_telemetry ={'errors': {'error': [{'error-message': str(error)}]}}
+        current_telemetry['request-duration'] = request_duration
+        current_telemetry['status-code'] = None
+        current_telemetry['date'] = datetime.now().strftime("%d/%m/%Y")
+        current_telemetry['time'] = datetime.now().strftime("%H:%M:%S")
+        print(module_name, module_type, str(error))
+        return current_telemetry
         
 
     def _create_restapi_url(self, module_name: str, module_type: str) -> str:
@@ -228,9 +707,8 @@ class SwitchTelemetryRequest:
             str: REST API url to request module data.
         """
         
-        login_protocol = ('https' if self.secure_access else 'http') + r'://'
-        url = login_protocol + self.sw_ipaddress + '/rest/running/' + module_name + '/' + module_type
-        return url
+        url = SwitchSession.get_rest_url(self.sw_ipaddress, self.secure_access, self.rest_port)
+        return url + 'running/' + module_name + '/' + module_type
     
 
     
@@ -305,6 +783,21 @@ class SwitchTelemetryRequest:
         return self._secure_access    
 
 
+    @property
+    def rest_port(self):
+        return self._rest_port
+
+
+    @property
+    def async_mode(self):
+        return self._async_mode
+
+
+    @property
+    def max_concurrent_requests(self):
+        return self._max_concurrent_requests
+
+
     @property
     def corrupted_request(self):
         return self._corrupted_request
@@ -314,6 +807,36 @@ class SwitchTelemetryRequest:
         self._corrupted_request = value
 
 
+    def is_valid_container(self, container_name: str) -> bool:
+        """Function checks if module container (all vf_id containers for the VF dependent module) has valid data
+        (fresh or stale response with valid status code).
+
+        Args:
+            container_name (str): container attribute name (for example fru_fan or fc_statistics).
+
+        Returns:
+            bool: True if container has valid data.
+        """
+
+        container = getattr(self, container_name)
+        if not container:
+            return False
+        # VF independent module container
+        if 'status-code' in container:
+            return container['status-code'] in SwitchTelemetryRequest.VALID_STATUS_CODES
+        # VF dependent module container
+        return all(vf_container.get('status-code') in SwitchTelemetryRequest.VALID_STATUS_CODES 
+                   for vf_container in container.values())
+
+
+    @property
+    def switch_unreachable(self):
+        # chassis is requested first in each cycle, no http response means switch is not reachable
+        # (stale chassis is filled with the last good response, status code of the failed request is checked)
+        return (SwitchTelemetryRequest._get_request_status_code(self.chassis) is None 
+                and not self.chassis.get('cancelled'))
+
+
 
     @property
     def chassis(self):
@@ -1,2 +1,4 @@
 from .switch_access import SWITCH_ACCESS
-from .http_ports import HTTP_SERVER_PORT
\ No newline at end of file
+from .http_ports import HTTP_SERVER_PORT
+from .switch_names import SWITCH_NAME
+from .module_intervals import DEFAULT_MODULE_INTERVAL, MAX_STALE_INTERVALS, MODULE_INTERVAL
\ No newline at end of file
@@ -0,0 +1,27 @@
+# polling interval (sec) of the switch modules (module name, module type)
+# switch polling cycle interval is the minimum module interval
+# last good response is reused by the switch telemetry between module refreshes
+# modules missing in the list are polled with the DEFAULT_MODULE_INTERVAL
+# per switch intervals are overridden by the "module_interval" key in SWITCH_ACCESS
+# example: {**LOGIN_SCENARIO["http_ldap"], "module_interval": {("brocade-interface", "fibrechannel-statistics"): 20}}
+
+DEFAULT_MODULE_INTERVAL = 60
+
+# failed module is served from the last good response (stale) till the response age exceeds 
+# the number of module polling intervals, then module container is marked as failed
+# per switch value is overridden by the "max_stale_intervals" key in SWITCH_ACCESS
+MAX_STALE_INTERVALS = 3
+
+MODULE_INTERVAL = {
+    # chassis is polled each cycle since it contains switch date and time and vf mode
+    ("brocade-chassis", "chassis"): 60,
+    ("brocade-fibrechannel-logical-switch", "fibrechannel-logical-switch"): 300,
+    ("brocade-time", "time-zone"): 3600,
+    ("brocade-time", "clock-server"): 3600,
+    ("brocade-fru", "power-supply"): 300,
+    ("brocade-fru", "fan"): 300,
+    ("brocade-license", "license"): 3600,
+    ("brocade-maps", "maps-policy"): 900,
+    ("brocade-maps", "maps-config"): 900,
+    ("brocade-interface", "fibrechannel-statistics"): 60
+}
@@ -2,9 +2,33 @@ LOGIN_SCENARIO = {
     "https_ldap": {"authentication": "ldap", "secure_access": True},
     "http_ldap": {"authentication": "ldap", "secure_access": False},
     "https_local": {"authentication": "local", "secure_access": True},
-    "http_local": {"authentication": "local", "secure_access": False}
+    "http_local": {"authentication": "local", "secure_access": False},
+    # session auth mode: login once through /rest/login and reuse session token 
+    # instead of sending credentials (and ldap bind on the switch) with each request
+    "https_ldap_session": {"authentication": "ldap", "secure_access": True, "auth_mode": "session"},
+    "http_ldap_session": {"authentication": "ldap", "secure_access": False, "auth_mode": "session"},
+    "https_local_session": {"authentication": "local", "secure_access": True, "auth_mode": "session"},
+    "http_local_session": {"authentication": "local", "secure_access": False, "auth_mode": "session"}
 }
 
+# optional switch access keys:
+# "async_mode": True - switch modules are requested concurrently
+# "rest_port": int - switch REST API port (default port of the protocol, 80 for http and 443 for https)
+# "max_concurrent_requests": int - maximum number of simultaneous requests to the switch in async mode
+# "overrun_policy": "skip" | "catch_up" - next cycle start if cycle duration exceeds polling interval (default "skip")
+# "cycle_jitter": float - maximum random delay (sec) of the polling cycle start (default 0)
+# "parse_process": True - brocade parser is built in the worker process (parsing does not share GIL with http server)
+# "cycle_timeout": float - switch requests timeout (sec) of the polling cycle (default 0.9 of the cycle interval)
+# "max_stale_intervals": int - number of module polling intervals the last good response of the failed module 
+#       is served for (default MAX_STALE_INTERVALS in module_intervals.py)
+# "release_telemetry": True - parsers drop raw switch telemetry once parsed (raw telemetry is passed to the archive only)
+# "export_mode": "gauge" | "collector" - dashboard metrics are prometheus Gauges filled each cycle or 
+#       rendered from the published parsers at scrape time by the custom collector as atomically swapped generations (default "gauge")
+# "stale_grace_periods": dict - number of toolbar fills label set (series) of the dashboard family (gauge name) is kept for 
+#       after it's not refreshed, "default" key for all families (default 0 - evicted after the first fill it's not refreshed in),
+#       None - label sets of the family are never evicted. Example: {"default": 2, "sfp_power_on_time": 10}
+# example: {**LOGIN_SCENARIO["http_ldap"], "async_mode": True, "max_concurrent_requests": 4}
+
 SWITCH_ACCESS = {
     "10.213.164.101": LOGIN_SCENARIO["http_ldap"],
     "10.213.164.102": LOGIN_SCENARIO["http_ldap"]
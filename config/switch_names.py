@@ -0,0 +1,7 @@
+# switch name of each switch polled by the single process collector (bin/inventory_collector.py)
+# switch name is used as initiator filename for the archive and switch log files
+# ip address is used as switch name if switch is not in the list
+SWITCH_NAME = {
+    "10.213.164.101": "n3-b6510-009-stg-f1",
+    "10.213.164.102": "n3-b6510-010-stg-f2"
+}
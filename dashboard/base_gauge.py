@@ -1,6 +1,40 @@
-from typing import Dict, List, Union
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Union
 
-from prometheus_client import Gauge
+from prometheus_client import REGISTRY, CollectorRegistry, Gauge
+from prometheus_client.core import GaugeMetricFamily
+
+from parser.port_record import PortRecord
+
+from .dashboard_collector import DashboardCollector
+
+
+class GaugeSeries:
+    """
+    Class of the gauge label set (series).
+    Series is created once for the label values and reused by all the fills it's refreshed in.
+    Prometheus Gauge child is bound to the series in the 'gauge' export mode 
+    so label values are not converted and child is not looked up (with Gauge lock) each time metric value is set.
+
+    Attributes:
+        label_values (tuple): str label values in the gauge label_keys order.
+        fill_id (int): number of the gauge fill series is refreshed in last.
+        child: prometheus Gauge child of the label values. None in the 'collector' export mode.
+        evicted (bool): series is evicted from the gauge (series must be requested from the gauge again).
+    """
+
+    __slots__ = ('label_values', 'fill_id', 'child', 'evicted')
+
+
+    def __init__(self, label_values: tuple, fill_id: int, child=None):
+        self.label_values = label_values
+        self.fill_id = fill_id
+        self.child = child
+        self.evicted = False
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.label_values}, fill_id={self.fill_id}, evicted={self.evicted})"
 
 
 class BaseGauge:
@@ -15,6 +49,13 @@ class BaseGauge:
         parameter_key (str, optional): Gauge parameter key contains string type value or value converted to string (added to gauge labels). 
         metric_key (str, optional): Gauge metric key contains numeric type value (used as metric value in set method).
         reverse_filling (bool, optional): Gauge reverse filling flag. Applied if switch parsed data presented as list.
+        registry (CollectorRegistry, optional): prometheus registry gauge is registered in.
+            If registry is DashboardCollector ('collector' export mode) prometheus Gauge is not created
+            and gauge keeps label values and metric value table (samples) the collector publishes once the cycle is filled.
+        grace_period (int, optional): number of fills label set which is not refreshed is kept for before it's evicted.
+            None if label sets are never evicted.
+        series_number (int): number of the gauge label sets.
+        evicted_total (int): number of the label sets evicted since the gauge creation.
     """
 
     chassis_wwn_key = ['chassis-wwn']
@@ -24,7 +65,9 @@ class BaseGauge:
     def __init__(self, 
                  name: str, description: str, unit_keys: List[str], 
                  parameter_key: str = None, metric_key: str = None, 
-                 reverse_filling: bool = False):
+                 reverse_filling: bool = False, 
+                 registry: CollectorRegistry = REGISTRY, 
+                 grace_period: Optional[int] = 0):
         """
         Class constructor.
 
@@ -35,9 +78,13 @@ class BaseGauge:
             parameter_key (str, optional): Gauge parameter key contains string type value or value converted to string (added to gauge labels). 
             metric_key (str, optional): Gauge metric key contains numeric type value (used as metric value in set method).
             reverse_filling (bool, optional): Gauge reverse filling flag. Applied if switch parsed data presented as list.
+            registry (CollectorRegistry, optional): prometheus registry gauge is registered in. 
+                Separate registry is used for each switch in the single process collector. Defaults to REGISTRY.
+            grace_period (int, optional): number of fills label set which is not refreshed is kept for before it's evicted.
+                None if label sets are never evicted. Defaults to 0 (label set is evicted after the first fill it's not refreshed in).
         """
 
-        # self._registry = CollectorRegistry()
+        self._registry = registry
         self._name = name
         self._description  = description
         self._unit_keys = unit_keys
@@ -46,7 +93,22 @@ class BaseGauge:
         self.validate_gauge_parameters()
         self._reverse_filling = reverse_filling
         self._label_keys = self._unit_keys + [self._parameter_key] if self._parameter_key else self._unit_keys
-        self._gauge = Gauge(self.name, self.description, BaseGauge.replace_underscore(self._label_keys))
+        # label values tuple and metric value pairs of the 'collector' export mode
+        self._samples = None
+        # samples table is published (read by the scrape) and is copied before it's changed
+        self._samples_published = False
+        self.grace_period = grace_period
+        # number of the current fill and label set series (label values and the fill series was refreshed in last)
+        self._fill_id = 0
+        self._series: Dict[tuple, GaugeSeries] = {}
+        self._evicted_total = 0
+        if isinstance(self.registry, DashboardCollector):
+            self._gauge = None
+            self._samples = {}
+            self.registry.add_gauge(self)
+        else:
+            self._gauge = Gauge(self.name, self.description, BaseGauge.replace_underscore(self._label_keys), 
+                                registry=self.registry)
 
 
     def validate_gauge_parameters(self) -> None:
@@ -151,8 +213,8 @@ class BaseGauge:
                 
                 if not gauge_data_port:
                     continue
-                # gauge_data_port is a port level dictionary
-                if isinstance(gauge_data_port, dict):
+                # gauge_data_port is a port level dictionary or port record
+                if isinstance(gauge_data_port, Mapping):
                     # check if dictionary contains required keys
                     if not BaseGauge.check_prerequisite_keys(gauge_data_port, prerequisite_keys_all, prerequisite_keys_any):
                         continue
@@ -202,9 +264,12 @@ class BaseGauge:
             add_dict (dict, optional): Key is a key name, value is a new value for the key.
 
         Returns:
-            dict: modified dictionary.
+            dict: modified dictionary (original dictionary if there is nothing to change).
         """
 
+        # gauge only reads values so original dictionary is not copied
+        if not renamed_keys and not add_dict:
+            return original_dict
         modified_dict = original_dict.copy()
         # rename keys
         if renamed_keys:
@@ -240,7 +305,134 @@ class BaseGauge:
                 metric_value = 1
         # add non empty metric to the gauge
         if metric_value is not None:
-            self.gauge.labels(*label_values).set(metric_value)
+            # label values are converted to str as Gauge does
+            self.set_labels_metric(tuple(map(str, label_values)), metric_value)
+
+
+    def set_labels_metric(self, label_values: tuple, metric_value: Union[int, float]) -> None:
+        """Method sets metric value of the label set and refreshes the label set in the current fill.
+
+        Args:
+            label_values (tuple): str label values in the label_keys order.
+            metric_value (Union[int, float]): metric value.
+        """
+
+        self.set_series_metric(self.get_series(label_values), metric_value)
+
+
+    def get_series(self, label_values: tuple) -> GaugeSeries:
+        """Method returns series of the label set. Series (and Gauge child) is created if label set is new.
+        Series may be kept by the caller and passed to set_series_metric method until it's evicted.
+
+        Args:
+            label_values (tuple): str label values in the label_keys order.
+
+        Returns:
+            GaugeSeries: label set series.
+        """
+
+        series = self._series.get(label_values)
+        if series is None:
+            child = self.gauge.labels(*label_values) if self._samples is None else None
+            series = GaugeSeries(label_values, self._fill_id, child)
+            self._series[label_values] = series
+        return series
+
+
+    def set_series_metric(self, series: GaugeSeries, metric_value: Union[int, float]) -> None:
+        """Method sets metric value of the series and refreshes the series in the current fill.
+
+        Args:
+            series (GaugeSeries): label set series returned by get_series method (not evicted).
+            metric_value (Union[int, float]): metric value.
+        """
+
+        # label set is refreshed in the current fill
+        series.fill_id = self._fill_id
+        # collector export mode (value is converted to float as Gauge does)
+        if self._samples is not None:
+            if self._samples_published:
+                self._unpublish_samples()
+            self._samples[series.label_values] = float(metric_value)
+        else:
+            series.child.set(metric_value)
+
+
+    def start_fill(self) -> None:
+        """Method starts the next fill of the gauge. 
+        Label sets which are not added within the fill are stale and evicted by evict_stale_labels method."""
+
+        self._fill_id += 1
+
+
+    def evict_stale_labels(self) -> int:
+        """Method removes label sets which are not refreshed within the last grace_period + 1 fills
+        (renamed ports, swapped sfps, changed status strings, log entries removed from the switch log).
+
+        Returns:
+            int: number of the evicted label sets.
+        """
+
+        if self.grace_period is None:
+            return 0
+
+        stale_series = [series for series in self._series.values() 
+                        if self._fill_id - series.fill_id > self.grace_period]
+        if not stale_series:
+            return 0
+        
+        if self._samples is not None:
+            self._unpublish_samples()
+        for series in stale_series:
+            del self._series[series.label_values]
+            # series kept by the caller is not used anymore
+            series.evicted = True
+            if self._samples is not None:
+                self._samples.pop(series.label_values, None)
+            else:
+                self.gauge.remove(*series.label_values)
+        self._evicted_total += len(stale_series)
+        return len(stale_series)
+
+
+    def _unpublish_samples(self) -> None:
+        """Method copies published samples table of the 'collector' export mode before it's changed."""
+
+        if self._samples_published:
+            self._samples = dict(self._samples)
+            self._samples_published = False
+
+
+    def publish_samples(self) -> Dict[tuple, float]:
+        """Method returns label values and metric value pairs of the 'collector' export mode to publish.
+        Published table is not changed anymore (next fill changes its copy or the new table).
+
+        Returns:
+            Dict[tuple, float]: label values tuple and metric value pairs.
+        """
+
+        self._samples_published = True
+        return self._samples
+
+
+    def get_metric_family(self, samples: Dict[tuple, float] = None) -> GaugeMetricFamily:
+        """Method creates gauge metric family with the same name and labels as prometheus Gauge
+        from the label values and metric value pairs of the 'collector' export mode.
+
+        Args:
+            samples (Dict[tuple, float], optional): published label values and metric value pairs. 
+                Defaults to None (current gauge samples).
+
+        Returns:
+            GaugeMetricFamily: gauge metric family.
+        """
+
+        if samples is None:
+            samples = self._samples
+        metric_family = GaugeMetricFamily(self.name, self.description, labels=BaseGauge.replace_underscore(self.label_keys))
+        for label_values, metric_value in samples.items():
+            metric_family.add_metric(label_values, metric_value)
+        return metric_family
 
 
     @staticmethod
@@ -257,7 +449,11 @@ class BaseGauge:
             list: ordered values.
         """
 
-        values_lst = [values_dct.get(key) for key in keys]
+        # port record gets all values in a single call
+        if isinstance(values_dct, PortRecord):
+            values_lst = values_dct.get_values(keys)
+        else:
+            values_lst = [values_dct.get(key) for key in keys]
         if fillna is not None:
             values_lst = [value if value is not None else fillna for value in values_lst]
         return values_lst
@@ -316,3 +512,35 @@ class BaseGauge:
     @property
     def gauge(self):
         return self._gauge
+
+
+    @property
+    def grace_period(self):
+        return self._grace_period
+
+
+    @grace_period.setter
+    def grace_period(self, grace_period: Optional[int]):
+        if grace_period is not None and (not isinstance(grace_period, int) or grace_period < 0):
+            raise ValueError(f"{self.name} gauge grace period {grace_period} is not a non-negative integer or None.")
+        self._grace_period = grace_period
+
+
+    @property
+    def series_number(self):
+        return len(self._series)
+
+
+    @property
+    def evicted_total(self):
+        return self._evicted_total
+
+
+    @property
+    def samples(self):
+        return self._samples
+
+
+    @property
+    def registry(self):
+        return self._registry
@@ -0,0 +1,110 @@
+from typing import Dict, List, Union
+
+from prometheus_client import REGISTRY, CollectorRegistry, Histogram
+
+from .base_gauge import BaseGauge
+
+
+class BaseHistogram:
+    """
+    Class to create a prometheus histogram for Brocade switch.
+    Histogram observes metric_key value of each element (for example http request duration of the module container).
+
+    Attributes:
+        name (str): Histogram unique name.
+        description (str): Histogram help.
+        unit_keys (List[str]): Histogram labels.
+        metric_key (str): Histogram metric key contains numeric type value (used as observed value).
+        buckets (List[float]): Histogram buckets upper bounds.
+        registry (CollectorRegistry, optional): prometheus registry histogram is registered in.
+    """
+
+
+    def __init__(self,
+                 name: str, description: str, unit_keys: List[str], metric_key: str, buckets: List[float],
+                 registry: CollectorRegistry = REGISTRY):
+        """
+        Class constructor.
+
+        Args:
+            name (str): Histogram unique name.
+            description (str): Histogram help.
+            unit_keys (List[str]): Histogram labels.
+            metric_key (str): Histogram metric key contains numeric type value (used as observed value).
+            buckets (List[float]): Histogram buckets upper bounds.
+            registry (CollectorRegistry, optional): prometheus registry histogram is registered in.
+                Separate registry is used for each switch in the single process collector. Defaults to REGISTRY.
+        """
+
+        self._registry = registry
+        self._name = name
+        self._description  = description
+        self._unit_keys = unit_keys
+        self._metric_key = metric_key
+        self._buckets = buckets
+        self._histogram = Histogram(self.name, self.description, BaseGauge.replace_underscore(self.unit_keys),
+                                    buckets=self.buckets, registry=self.registry)
+
+
+    def fill_chassis_histogram_metrics(self, histogram_data: List[Dict]) -> None:
+        """
+        Method to observe metric values of the chassis level dictionaries.
+
+        Args:
+            histogram_data (List[Dict]): List of dictionaries. Each dictionary contains chassis level element parameters.
+        """
+
+        if not histogram_data:
+            return
+
+        for histogram_data_current in histogram_data:
+            self.add_histogram_metric(histogram_data_current)
+
+
+    def add_histogram_metric(self, histogram_data: Dict[str, Union[str, int]]) -> None:
+        """Method to observe metric value for the corresponding histogram labels.
+        Empty metric value is not observed.
+
+        Args:
+            histogram_data (dict): dictionary contains values to observe metric for the corresponding histogram labels.
+        """
+
+        metric_value = histogram_data.get(self.metric_key)
+        if metric_value is not None:
+            label_values = BaseGauge.get_ordered_values(histogram_data, self.unit_keys)
+            self.histogram.labels(*label_values).observe(metric_value)
+
+
+    @property
+    def name(self):
+        return self._name
+
+
+    @property
+    def description(self):
+        return self._description
+
+
+    @property
+    def unit_keys(self):
+        return self._unit_keys
+
+
+    @property
+    def metric_key(self):
+        return self._metric_key
+
+
+    @property
+    def buckets(self):
+        return self._buckets
+
+
+    @property
+    def histogram(self):
+        return self._histogram
+
+
+    @property
+    def registry(self):
+        return self._registry
@@ -1,5 +1,12 @@
+from typing import List
+
 from parser.switch_parser import SwitchParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from .base_gauge import BaseGauge
+from .port_metric_engine import MetricSpec
+
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
 
@@ -9,6 +16,7 @@ class BaseToolbar:
 
     Attributes:
         sw_telemetry: set of switch telemetry retrieved from the switch.
+        registry (CollectorRegistry): prometheus registry toolbar gauges are registered in.
     """
 
     chassis_wwn_key = ['chassis-wwn']
@@ -40,13 +48,42 @@ class BaseToolbar:
 
     STATUS_ID = {1: 'OK', 2: 'Unknown', 3: 'Warning', 4: 'Critical'}
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest) -> None:
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY) -> None:
         """  
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
         self._sw_telemetry: SwitchTelemetryRequest = sw_telemetry
+        self._sw_ipaddress = sw_telemetry.sw_ipaddress
+        self._registry: CollectorRegistry = registry
+
+
+    def release_telemetry(self) -> None:
+        """Method drops the switch telemetry reference (toolbar needs switch ip address only)."""
+
+        self._sw_telemetry = None
+
+
+    def create_spec_gauges(self, metric_specs: List[MetricSpec]) -> List[BaseGauge]:
+        """Method creates toolbar gauges from the metric specs table.
+        Gauge is stored in the '_' + attr_name toolbar attribute (returned by the toolbar gauge property).
+
+        Args:
+            metric_specs (List[MetricSpec]): metric specs of the toolbar gauges.
+
+        Returns:
+            List[BaseGauge]: created gauges in the metric specs order.
+        """
+
+        gauges = []
+        for metric_spec in metric_specs:
+            gauge = BaseGauge(name=metric_spec.name, description=metric_spec.description, unit_keys=metric_spec.unit_keys, 
+                              parameter_key=metric_spec.parameter_key, metric_key=metric_spec.metric_key, registry=self.registry)
+            setattr(self, '_' + metric_spec.attr_name, gauge)
+            gauges.append(gauge)
+        return gauges
 
 
     @staticmethod
@@ -111,4 +148,20 @@ class BaseToolbar:
 
     @property
     def sw_telemetry(self):
-        return self._sw_telemetry
\ No newline at end of file
+        return self._sw_telemetry
+
+
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
+    @property
+    def registry(self):
+        return self._registry
+
+
+    @property
+    def gauges(self) -> List[BaseGauge]:
+        # all gauges of the toolbar
+        return [value for value in vars(self).values() if isinstance(value, BaseGauge)]
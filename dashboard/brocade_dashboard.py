@@ -1,7 +1,14 @@
+from typing import Dict, List, Optional, Tuple
+
 from parser.brocade_parser import BrocadeParser
 from parser.request_status_parser import RequestStatusParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from .base_gauge import BaseGauge
+from .base_toolbar import BaseToolbar
 from .chassis_toolbar import ChassisToolbar
+from .dashboard_collector import DashboardCollector
 from .fabricshow_toolbar import FabricShowToolbar
 from .fcport_params_toolbar import FCPortParamsToolbar
 from .fcport_stats_toolbar import FCPortStatsToolbar
@@ -22,99 +29,291 @@ class BrocadeDashboard:
     Class to create a dashboard. Dashboard is a set of toolbars 
     which in turn are a set of prometheus gauges groups for Brocade switch.
 
+    Dashboard is exported in one of the EXPORT_MODES:
+    'gauge' - toolbars fill prometheus Gauges registered in the registry each cycle.
+    'collector' - toolbars are added to the DashboardCollector registered in the registry.
+    Each cycle parsers are published to the collector and dashboard is rendered from the published parsers 
+    at scrape time. Rendered cycle is published as the next collector generation scrape is served from.
+
+    Label sets (series) of the toolbar gauges which are not refreshed within the toolbar fill 
+    are evicted once the grace period of the gauge family is over (in both export modes). 
+    Toolbar which is not filled (sub-parser is not built) keeps its label sets. 
+    Number of the label sets and evicted label sets of each family are exported.
+
     Attributes:
         sw_telemetry: set of switch telemetry retrieved from the switch.
         initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+        registry (CollectorRegistry): prometheus registry dashboard gauges are registered in.
+        export_mode (str): dashboard export mode ('gauge' or 'collector').
+        collector (DashboardCollector): dashboard collector of the 'collector' export mode. None in 'gauge' export mode.
+        toolbars (List): all toolbars of the dashboard.
     """
 
+    EXPORT_MODES = ['gauge', 'collector']
+    # grace_periods key of the grace period applied to the families not listed in grace_periods
+    DEFAULT_GRACE_PERIOD_KEY = 'default'
+
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest, initiator_filename: str) -> None:
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, initiator_filename: str, 
+                 registry: CollectorRegistry = REGISTRY, export_mode: str = 'gauge', 
+                 grace_periods: Dict[str, Optional[int]] = None) -> None:
         """  
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
             initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+            registry (CollectorRegistry): prometheus registry dashboard gauges are registered in. 
+                Each switch has its own registry in the single process collector. Defaults to REGISTRY.
+            export_mode (str): dashboard export mode ('gauge' or 'collector'). Defaults to 'gauge'.
+            grace_periods (Dict[str, Optional[int]], optional): number of fills stale label sets of the family (gauge name) 
+                are kept for before eviction. 'default' key is applied to the families not listed. 
+                None value - label sets are never evicted. Defaults to None (stale label sets are evicted in the next fill).
         """
 
+        if export_mode not in BrocadeDashboard.EXPORT_MODES:
+            raise ValueError(f"Unknown dashboard export mode {export_mode}. Export mode is one of {BrocadeDashboard.EXPORT_MODES}.")
+
         self._sw_telemetry: SwitchTelemetryRequest = sw_telemetry
+        self._sw_ipaddress = sw_telemetry.sw_ipaddress
         self._initiator_filename: str = initiator_filename
-
-        self._request_status_tb = RequestStatusToolbar(self.sw_telemetry)
-        self._chassis_tb = ChassisToolbar(self.sw_telemetry)
-        self._fru_tb = FRUToolbar(self.sw_telemetry)
-        self._maps_system_tb = MAPSSystemToolbar(self.sw_telemetry)
-        self._maps_dashboard_tb = MAPSDashboardToolbar(self.sw_telemetry)
-        self._switch_tb = SwitchToolbar(self.sw_telemetry)
-        self._fabricshow_tb = FabricShowToolbar(self.sw_telemetry)
-        self._fcport_params_tb = FCPortParamsToolbar(self.sw_telemetry)
-        self._sfp_media_tb = SFPMediaToolbar(self.sw_telemetry)
-        self._fcport_stats_tb = FCPortStatsToolbar(self.sw_telemetry)
-        self._log_tb = LogToolbar(self.sw_telemetry, self.initiator_filename)
+        self._registry: CollectorRegistry = registry
+        self._export_mode = export_mode
+
+        # toolbars gauges are added to the collector instead of the registry in the collector export mode
+        self._collector = None
+        toolbar_registry = self.registry
+        if self.export_mode == 'collector':
+            self._collector = DashboardCollector(self._render_parsers)
+            toolbar_registry = self.collector
+
+        self._request_status_tb = RequestStatusToolbar(self.sw_telemetry, toolbar_registry)
+        self._chassis_tb = ChassisToolbar(self.sw_telemetry, toolbar_registry)
+        self._fru_tb = FRUToolbar(self.sw_telemetry, toolbar_registry)
+        self._maps_system_tb = MAPSSystemToolbar(self.sw_telemetry, toolbar_registry)
+        self._maps_dashboard_tb = MAPSDashboardToolbar(self.sw_telemetry, toolbar_registry)
+        self._switch_tb = SwitchToolbar(self.sw_telemetry, toolbar_registry)
+        self._fabricshow_tb = FabricShowToolbar(self.sw_telemetry, toolbar_registry)
+        self._fcport_params_tb = FCPortParamsToolbar(self.sw_telemetry, toolbar_registry)
+        self._sfp_media_tb = SFPMediaToolbar(self.sw_telemetry, toolbar_registry)
+        self._fcport_stats_tb = FCPortStatsToolbar(self.sw_telemetry, toolbar_registry)
+        self._log_tb = LogToolbar(self.sw_telemetry, self.initiator_filename, toolbar_registry)
+        self._set_grace_periods(grace_periods)
+
+        # number of the label sets and evicted label sets of each dashboard family
+        self._gauge_family_series = BaseGauge(name='collector_dashboard_family_series', 
+                                              description='Number of the label sets (series) of the dashboard family.',
+                                              unit_keys=['family'], metric_key='series', 
+                                              registry=toolbar_registry, grace_period=None)
+        self._gauge_family_evicted = BaseGauge(name='collector_dashboard_family_evicted_series', 
+                                               description='Number of the stale label sets evicted from the dashboard family since the collector start.',
+                                               unit_keys=['family'], metric_key='evicted-series', 
+                                               registry=toolbar_registry, grace_period=None)
+        self._fill_family_gauge_metrics()
+
+        # collector is registered when all toolbars gauges are added
+        # first generation contains imported switch log
+        if self.collector is not None:
+            self.collector.publish()
+            self.registry.register(self.collector)
 
 
     def fill_dashboard_gauge_metrics(self, 
                                      brocade_parser: BrocadeParser, 
                                      request_status_parser: RequestStatusParser) -> None:
         """Method to fill the gauge metrics for the dashboard.
+        In the collector export mode parsers are published to the collector 
+        and dashboard is rendered from them at scrape time.
 
         Args:
             brocade_parser (BrocadeParser): object contains required data to fill the gauge metrics.
+                Toolbar is skipped if its sub-parser is not built (no valid telemetry) 
+                so fresh data of the other toolbars is still exported.
             
         """
         
+        if self.collector is not None:
+            self.collector.publish_parsers(brocade_parser, request_status_parser)
+            return
+        self._render_parsers(brocade_parser, request_status_parser)
+
+
+    def _render_parsers(self, brocade_parser: BrocadeParser, request_status_parser: RequestStatusParser) -> None:
+        """Method fills the toolbars and the dashboard families gauges with the parsers of the polling cycle.
+        Method is called from the export stage (gauge export mode) or from the collector (collector export mode).
+
+        Args:
+            brocade_parser (BrocadeParser): object contains required data to fill the gauge metrics.
+            request_status_parser (RequestStatusParser): object contains required data to fill the gauge metrics.
+        """
+
         print('\n----Dashboard----')
+        self._fill_toolbars(brocade_parser, request_status_parser)
+        self._fill_family_gauge_metrics()
+        print('\n')
+
+
+    def _fill_toolbars(self, brocade_parser: BrocadeParser, request_status_parser: RequestStatusParser) -> None:
+        """Method fills the request status, parser and log toolbars. 
+        Parser toolbar is skipped if its sub-parser is not built (toolbar keeps the previous metrics).
+
+        Args:
+            brocade_parser (BrocadeParser): object contains required data to fill the gauge metrics.
+            request_status_parser (RequestStatusParser): object contains required data to fill the gauge metrics.
+        """
+
         print('request_status')
-        self.request_status_tb.fill_toolbar_gauge_metrics(request_status_parser)
+        self._fill_toolbar(self.request_status_tb, request_status_parser)
         
         if brocade_parser is None:
             return
         
-        print('chassis')
-        self.chassis_tb.fill_toolbar_gauge_metrics(brocade_parser.ch_parser, brocade_parser.sw_parser)
+        for toolbar_names, toolbar, parsers in self._get_parser_toolbar_fills(brocade_parser):
+            print(*toolbar_names)
+            self._fill_toolbar(toolbar, *parsers)
 
-        print('fru')
-        self.fru_tb.fill_toolbar_gauge_metrics(brocade_parser.fru_parser, brocade_parser.sw_parser)
+        # log toolbar requires switch parser
+        if brocade_parser.sw_parser:
+            print('log')
+            self._fill_toolbar(self.log_tb, brocade_parser.sw_parser, brocade_parser.fcport_params_parser, 
+                               brocade_parser.sfp_media_parser, brocade_parser.fcport_stats_parser, 
+                               brocade_parser.fru_parser, brocade_parser.maps_parser)
 
-        print('maps system resources', 'maps system health')
-        self.maps_system_tb.fill_toolbar_gauge_metrics(brocade_parser.maps_parser, brocade_parser.sw_parser)
 
-        print('maps policy, actions','maps dashboard')
-        self.maps_dashboard_tb.fill_toolbar_gauge_metrics(brocade_parser.maps_parser)
+    @staticmethod
+    def _fill_toolbar(toolbar, *parsers) -> None:
+        """Method fills the toolbar gauges with the parsers 
+        and evicts label sets of the toolbar gauges which are not refreshed within the grace period.
 
-        print('switch')
-        self.switch_tb.fill_toolbar_gauge_metrics(brocade_parser.sw_parser)
-        
-        print('fabrichsow')
-        self.fabricshow_tb.fill_toolbar_gauge_metrics(brocade_parser.sw_parser)
+        Args:
+            toolbar: dashboard toolbar.
+            parsers: parsers toolbar fill_toolbar_gauge_metrics method is called with.
+        """
 
-        print('fcport parameters')
-        self.fcport_params_tb.fill_toolbar_gauge_metrics(brocade_parser.fcport_params_parser)
+        for gauge in toolbar.gauges:
+            gauge.start_fill()
+        toolbar.fill_toolbar_gauge_metrics(*parsers)
+        evicted_number = sum(gauge.evict_stale_labels() for gauge in toolbar.gauges)
+        if evicted_number:
+            print(f'{evicted_number} stale series evicted')
 
-        print('sfp media')
-        self.sfp_media_tb.fill_toolbar_gauge_metrics(brocade_parser.sfp_media_parser)
 
-        print('fcport_stats')
-        self.fcport_stats_tb.fill_toolbar_gauge_metrics(brocade_parser.fcport_stats_parser)
+    def _fill_family_gauge_metrics(self) -> None:
+        """Method fills the number of the label sets and evicted label sets of each toolbar gauge family."""
 
-        print('log')
-        self.log_tb.fill_toolbar_gauge_metrics(brocade_parser.sw_parser, brocade_parser.fcport_params_parser, 
-                                               brocade_parser.sfp_media_parser, brocade_parser.fcport_stats_parser, 
-                                               brocade_parser.fru_parser, brocade_parser.maps_parser)
+        family_stats = [{'family': gauge.name, 'series': gauge.series_number, 'evicted-series': gauge.evicted_total} 
+                        for toolbar in self.toolbars for gauge in toolbar.gauges]
+        self._gauge_family_series.fill_chassis_gauge_metrics(family_stats)
+        self._gauge_family_evicted.fill_chassis_gauge_metrics(family_stats)
+
+
+    def _set_grace_periods(self, grace_periods: Dict[str, Optional[int]]) -> None:
+        """Method sets grace period of the toolbars gauges.
+
+        Args:
+            grace_periods (Dict[str, Optional[int]]): number of fills stale label sets of the family (gauge name) 
+                are kept for before eviction. 'default' key is applied to the families not listed.
+        """
+
+        if not grace_periods:
+            return
         
-        print('\n')
+        gauges = {gauge.name: gauge for toolbar in self.toolbars for gauge in toolbar.gauges}
+        unknown_families = set(grace_periods) - set(gauges) - {BrocadeDashboard.DEFAULT_GRACE_PERIOD_KEY}
+        if unknown_families:
+            print(f'Grace period of the unknown dashboard families {sorted(unknown_families)} is skipped')
+        for gauge_name, gauge in gauges.items():
+            if gauge_name in grace_periods:
+                gauge.grace_period = grace_periods[gauge_name]
+            elif BrocadeDashboard.DEFAULT_GRACE_PERIOD_KEY in grace_periods:
+                gauge.grace_period = grace_periods[BrocadeDashboard.DEFAULT_GRACE_PERIOD_KEY]
+
+
+    def _get_parser_toolbar_fills(self, brocade_parser: BrocadeParser) -> List[Tuple[tuple, BaseToolbar, tuple]]:
+        """Method returns toolbars of the parsers which are built and parsers each toolbar is filled with.
+
+        Args:
+            brocade_parser (BrocadeParser): object contains required data to fill the gauge metrics.
+
+        Returns:
+            List[Tuple[tuple, BaseToolbar, tuple]]: toolbar names, toolbar and fill_toolbar_gauge_metrics parsers.
+        """
+
+        toolbar_fills = []
+
+        if brocade_parser.ch_parser and brocade_parser.sw_parser:
+            toolbar_fills.append((('chassis',), self.chassis_tb, (brocade_parser.ch_parser, brocade_parser.sw_parser)))
+
+        if brocade_parser.fru_parser and brocade_parser.sw_parser:
+            toolbar_fills.append((('fru',), self.fru_tb, (brocade_parser.fru_parser, brocade_parser.sw_parser)))
+
+        if brocade_parser.maps_parser:
+            toolbar_fills.append((('maps system resources', 'maps system health'), self.maps_system_tb, 
+                                  (brocade_parser.maps_parser, brocade_parser.sw_parser)))
+            toolbar_fills.append((('maps policy, actions','maps dashboard'), self.maps_dashboard_tb, (brocade_parser.maps_parser,)))
+
+        if brocade_parser.sw_parser:
+            toolbar_fills.append((('switch',), self.switch_tb, (brocade_parser.sw_parser,)))
+            toolbar_fills.append((('fabrichsow',), self.fabricshow_tb, (brocade_parser.sw_parser,)))
+
+        if brocade_parser.fcport_params_parser:
+            toolbar_fills.append((('fcport parameters',), self.fcport_params_tb, (brocade_parser.fcport_params_parser,)))
+
+        if brocade_parser.sfp_media_parser:
+            toolbar_fills.append((('sfp media',), self.sfp_media_tb, (brocade_parser.sfp_media_parser,)))
+
+        if brocade_parser.fcport_stats_parser:
+            toolbar_fills.append((('fcport_stats',), self.fcport_stats_tb, (brocade_parser.fcport_stats_parser,)))
+        return toolbar_fills
+
+
+    def release_telemetry(self) -> None:
+        """Method drops the switch telemetry reference of the dashboard and all toolbars
+        so telemetry the dashboard is created with is not kept in memory.
+        """
+
+        self._sw_telemetry = None
+        for toolbar in self.toolbars:
+            toolbar.release_telemetry()
 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
     def sw_telemetry(self):
         return self._sw_telemetry
+
+
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
     
 
     @property
     def initiator_filename(self):
         return self._initiator_filename
+
+
+    @property
+    def registry(self):
+        return self._registry
+
+
+    @property
+    def export_mode(self):
+        return self._export_mode
+
+
+    @property
+    def collector(self):
+        return self._collector
+
+
+    @property
+    def toolbars(self) -> List:
+        return [self.request_status_tb, self.chassis_tb, self.fru_tb, self.maps_system_tb, self.maps_dashboard_tb, 
+                self.switch_tb, self.fabricshow_tb, self.fcport_params_tb, self.sfp_media_tb, 
+                self.fcport_stats_tb, self.log_tb]
     
     
     @property    
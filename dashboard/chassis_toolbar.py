@@ -1,6 +1,8 @@
 from parser.chassis_parser import ChassisParser
 from parser.switch_parser import SwitchParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -27,80 +29,81 @@ class ChassisToolbar(BaseToolbar):
                          3: 'Expired'}
 
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
 
         # chassis name gauge
         self._gauge_chname = BaseGauge(name='chassis_name', description='Chassis name', 
-                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='chassis-user-friendly-name')
+                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='chassis-user-friendly-name', registry=self.registry)
         # switch serial numbaer gauge
         self._gauge_sn = BaseGauge(name='chassis_sn', description='Chassis serial number', 
-                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='switch-serial-number')
+                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='switch-serial-number', registry=self.registry)
         # switct type gauge
         self._gauge_model = BaseGauge(name='switch_type', description='Switch type', 
-                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='model')
+                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='model', registry=self.registry)
         # switch product name gauge
         self._gauge_product_name = BaseGauge(name='switch_product_name', description='Switch product name', 
-                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='product-name')
+                                          unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='product-name', registry=self.registry)
         # switch name
         self._gauge_swname = BaseGauge(name='chassis_swname', description='Chassis switch name', 
-                                                    unit_keys=ChassisToolbar.switch_wwn_key, parameter_key='switch-name')
+                                                    unit_keys=ChassisToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         # fabric name
         self._gauge_fabricname = BaseGauge(name='chassis_fabric_name', description='Chassis fabric name', 
-                                                    unit_keys=ChassisToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                                    unit_keys=ChassisToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # vf id
         self._gauge_vfid = BaseGauge(name='chassis_vfid', description='Chassis VF ids', 
-                                                    unit_keys=ChassisToolbar.switch_wwn_key, parameter_key='vf-id')
+                                                    unit_keys=ChassisToolbar.switch_wwn_key, parameter_key='vf-id', registry=self.registry)
         # fos version gauge
         self._gauge_fos =  BaseGauge(name='chassis_fos', description='Chassis firmware version', 
-                                        unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='firmware-version')
+                                        unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='firmware-version', registry=self.registry)
         # date gauge
         self._gauge_datetime =  BaseGauge(name='chassis_datetime', description='Chassis datetime', 
-                                         unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='datetime')
+                                         unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='datetime', registry=self.registry)
         # date gauge
         self._gauge_date =  BaseGauge(name='chassis_date', description='Chassis date', 
-                                         unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='date')
+                                         unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='date', registry=self.registry)
         # time gauge
         self._gauge_time =  BaseGauge(name='chassis_time', description='Chassis time', 
-                                         unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='time')
+                                         unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='time', registry=self.registry)
         
         # timezone gauge
         self._gauge_tz =  BaseGauge(name='chassis_tz', description='Chassis timezone', 
-                                       unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='time-zone')
+                                       unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='time-zone', registry=self.registry)
 
         # vf mode gauge
         # -1 - 'Not Applicable',  1 - 'Enabled', 0 - 'Disabled'
         vf_mode_description = f'Chassis virtual fabrics mode {ChassisToolbar.VF_MODE_STATUS_ID}.'
         self._gauge_vf_mode =  BaseGauge(name='chassis_vf_mode', description=vf_mode_description, 
-                                            unit_keys=ChassisToolbar.chassis_switch_wwn_keys, metric_key='virtual-fabrics-mode-id')
+                                            unit_keys=ChassisToolbar.chassis_switch_wwn_keys, metric_key='virtual-fabrics-mode-id', registry=self.registry)
         # ls quantity gauge
         self._gauge_ls_number =  BaseGauge(name='chassis_ls_number', description='Chassis logical switch qunatity', 
-                                              unit_keys=ChassisToolbar.chassis_switch_wwn_keys, metric_key='ls-number')
+                                              unit_keys=ChassisToolbar.chassis_switch_wwn_keys, metric_key='ls-number', registry=self.registry)
         
         # active ntp
         self._gauge_ntp_active = BaseGauge(name='ntp_server', description='Active NTP Address', 
-                                              unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='active-server')
+                                              unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='active-server', registry=self.registry)
         # configured ntp
         self._gauge_ntp_configured = BaseGauge(name='ntp_list', description='Configured NTP Address(es)', 
-                                                  unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='ntp-server-address')
+                                                  unit_keys=ChassisToolbar.chassis_switch_wwn_keys, parameter_key='ntp-server-address', registry=self.registry)
         # license status gauge
         # 1 - No expiration date
         # 2 - Expiration date has not arrived
         # 3 - Expiration date has arrived
         license_status_description = f'Switch licenses status {ChassisToolbar.LICENSE_STATUS_ID}.'
         self._gauge_license_status = BaseGauge(name='license_status', description=license_status_description, 
-                                            unit_keys=ChassisToolbar.license_keys, metric_key='license-status-id')
+                                            unit_keys=ChassisToolbar.license_keys, metric_key='license-status-id', registry=self.registry)
         # license capacity gauge
         self._gauge_license_capacity = BaseGauge(name='license_capacity', description='POD license capacity', 
-                                            unit_keys=ChassisToolbar.license_keys, metric_key='capacity')        
+                                            unit_keys=ChassisToolbar.license_keys, metric_key='capacity', registry=self.registry)        
         # license exp date gauge
         self._gauge_license_exp_date = BaseGauge(name='license_exp_date', description='License expiration date', 
-                                            unit_keys=ChassisToolbar.license_keys, parameter_key='expiration-date')
+                                            unit_keys=ChassisToolbar.license_keys, parameter_key='expiration-date', registry=self.registry)
 
 
     def fill_toolbar_gauge_metrics(self, ch_parser: ChassisParser , sw_parser: SwitchParser) -> None:
@@ -131,7 +134,7 @@ class ChassisToolbar(BaseToolbar):
 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
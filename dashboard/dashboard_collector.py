@@ -0,0 +1,183 @@
+import collections
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from prometheus_client import CollectorRegistry
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.metrics_core import Metric
+
+
+class DashboardGeneration(NamedTuple):
+    """Published dashboard metrics of the rendered polling cycle (never changed once published)."""
+
+    # generation number (number of the rendered polling cycles, 0 - no polling cycle is rendered yet)
+    generation_id: int
+    # unix time the generation is published
+    timestamp: float
+    # gauge and its published label values and metric value pairs
+    gauge_samples: List[Tuple[object, Dict[tuple, float]]]
+    # histogram metric families collected at the generation publishing
+    histogram_families: List[Metric]
+
+
+class DashboardCollector(CollectorRegistry):
+    """
+    Class of the custom prometheus collector of the dashboard in the 'collector' export mode.
+    Collector is passed to the toolbars instead of the registry. Dashboard gauges (BaseGauge) added
+    to the collector don't create prometheus Gauge children (lock and labels lookup for each set call)
+    but keep plain label values and metric value tables. Histograms are registered in the collector
+    as in the prometheus registry. Collector itself is registered in the switch registry exposed by the http server.
+
+    Export stage only publishes the parsers of the polling cycle (parsers are not changed once published).
+    Dashboard is rendered from the published parsers at scrape time. Scrape renders all polling cycles 
+    published since the previous render in the publishing order (switch log and stale label sets eviction 
+    get each polling cycle) and publishes the filled gauges tables as the next generation. 
+    Scrapes till the next polling cycle is published are served from the same generation (no render).
+    If collector is not scraped for MAX_PENDING_CYCLES polling cycles, published parsers are rendered 
+    in the export stage so parsers are not piled up in memory.
+
+    Metrics are double buffered. Gauges tables are filled off to the side and the generation is swapped in 
+    atomically (single reference assignment). Scrape never waits for the render in the other thread 
+    and is served from the previous generation till then. Scrape always sees metrics of the single polling cycle.
+    Scrape yields metric families with the same names and labels as prometheus Gauges from the published generation
+    and generation id and timestamp metrics (consistency check).
+
+    Attributes:
+        gauges (List[BaseGauge]): gauges added to the collector.
+        generation (DashboardGeneration): published generation scrape is served from.
+        pending_cycles (int): number of the published polling cycles which are not rendered yet.
+    """
+
+    GENERATION_METRIC = 'collector_dashboard_generation'
+    GENERATION_TIMESTAMP_METRIC = 'collector_dashboard_generation_timestamp_seconds'
+    # number of the published polling cycles kept till the scrape
+    MAX_PENDING_CYCLES = 3
+
+
+    def __init__(self, render_parsers: Callable):
+        """
+        Args:
+            render_parsers (Callable): function fills the dashboard gauges with the published 
+                brocade parser and request status parser of the polling cycle.
+        """
+
+        super().__init__(auto_describe=False)
+        self._render_parsers = render_parsers
+        self._gauges = []
+        self._generation = DashboardGeneration(0, 0, [], [])
+        # published parsers of the polling cycles which are not rendered yet (deque append and popleft are thread safe)
+        self._pending_parsers = collections.deque()
+        # single thread renders the dashboard
+        self._render_lock = threading.Lock()
+
+
+    def add_gauge(self, gauge) -> None:
+        """Method adds dashboard gauge to the collector.
+
+        Args:
+            gauge (BaseGauge): dashboard gauge.
+        """
+
+        self._gauges.append(gauge)
+
+
+    def publish_parsers(self, brocade_parser, request_status_parser) -> None:
+        """Method publishes the parsers of the polling cycle the dashboard is rendered from at scrape time.
+        Method is called from the export stage. Pending polling cycles are rendered 
+        if collector is not scraped for MAX_PENDING_CYCLES polling cycles.
+
+        Args:
+            brocade_parser (BrocadeParser): brocade parser. None if switch telemetry is corrupted.
+            request_status_parser (RequestStatusParser): request status parser.
+        """
+
+        self._pending_parsers.append((brocade_parser, request_status_parser))
+        if len(self._pending_parsers) > DashboardCollector.MAX_PENDING_CYCLES:
+            print(f'Dashboard is not scraped for {len(self._pending_parsers)} polling cycles. Rendering dashboard')
+            with self._render_lock:
+                self._render_pending_parsers()
+
+
+    def publish(self) -> DashboardGeneration:
+        """Method publishes the gauges tables and histograms of the filled dashboard as the next generation.
+        Method is called from the thread filling the dashboard only.
+
+        Returns:
+            DashboardGeneration: published generation.
+        """
+
+        return self._publish_generation(0)
+
+
+    def _publish_generation(self, rendered_cycles: int) -> DashboardGeneration:
+        """Method publishes the gauges tables and histograms of the filled dashboard as the next generation.
+
+        Args:
+            rendered_cycles (int): number of the polling cycles rendered since the previous generation.
+
+        Returns:
+            DashboardGeneration: published generation.
+        """
+
+        gauge_samples = [(gauge, gauge.publish_samples()) for gauge in self._gauges]
+        # histograms are observed in the same thread so they are not changed while collected
+        histogram_families = list(super().collect())
+        generation = DashboardGeneration(self.generation.generation_id + rendered_cycles, time.time(), 
+                                         gauge_samples, histogram_families)
+        # scrape threads read the generation reference only
+        self._generation = generation
+        return generation
+
+
+    def _render_pending_parsers(self) -> None:
+        """Method renders the pending polling cycles in the publishing order 
+        and publishes the rendered dashboard as the next generation. Render lock is acquired by the caller."""
+
+        rendered_cycles = 0
+        while self._pending_parsers:
+            self._render_parsers(*self._pending_parsers.popleft())
+            rendered_cycles += 1
+        if rendered_cycles:
+            self._publish_generation(rendered_cycles)
+
+
+    def collect(self) -> Iterable[Metric]:
+        """Method renders pending polling cycles and yields metric families of the published generation 
+        and generation metrics. Scrape is served from the published generation without the render 
+        if the dashboard is rendered by the other thread."""
+
+        if self._pending_parsers and self._render_lock.acquire(blocking=False):
+            try:
+                self._render_pending_parsers()
+            finally:
+                self._render_lock.release()
+
+        generation = self._generation
+        for gauge, samples in generation.gauge_samples:
+            yield gauge.get_metric_family(samples)
+        yield from generation.histogram_families
+        yield GaugeMetricFamily(DashboardCollector.GENERATION_METRIC,
+                                'Number of the dashboard generation (rendered polling cycles) the scrape is served from.',
+                                value=generation.generation_id)
+        yield GaugeMetricFamily(DashboardCollector.GENERATION_TIMESTAMP_METRIC,
+                                'Unix time the dashboard generation is published.', value=generation.timestamp)
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} gauges: {len(self.gauges)} generation: {self.generation.generation_id}"
+
+
+    @property
+    def gauges(self) -> List:
+        return self._gauges
+
+
+    @property
+    def generation(self):
+        return self._generation
+
+
+    @property
+    def pending_cycles(self):
+        return len(self._pending_parsers)
@@ -1,5 +1,7 @@
 from parser.switch_parser import SwitchParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -20,42 +22,43 @@ class FabricShowToolbar(BaseToolbar):
     # local and fabric switch wwn keys
     switch_wwn_pair_keys = ['switch-wwn', 'fabric-switch-wwn']
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
 
         # fabricshow remote switch name gauge
         self._gauge_fabric_swname = BaseGauge(name='fabricshow_remote_switchname', description='Switch name in the fabricshow output', 
-                                          unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='fabric-switch-name')
+                                          unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='fabric-switch-name', registry=self.registry)
         # fabricshow local switch name gauge
         self._gauge_local_swname = BaseGauge(name='fabricshow_local_switchname', description='Local switch name', 
-                                          unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='switch-name')        
+                                          unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='switch-name', registry=self.registry)        
         # fabricshow fabric name gauge
         self._gauge_fabricname = BaseGauge(name='fabricshow_fabricname', description='Fabric name in the fabricshow output', 
-                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='fabric-user-friendly-name')
+                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # fabricshow ip-address gauge
         self._gauge_switch_ip = BaseGauge(name='fabricshow_ip', description='Switch ip-address in the fabricshow output', 
-                                             unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='ip-address')
+                                             unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='ip-address', registry=self.registry)
         # fabricshow fos gauge
         self._gauge_switch_fos = BaseGauge(name='fabricshow_fos', description='Firmware version in the fabricshow output', 
-                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='firmware-version')        
+                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, parameter_key='firmware-version', registry=self.registry)        
         # fabricshow principal label gauge
         # 1 - ">", 0 - "_"  
         self._gauge_principal_label = BaseGauge(name='fabricshow_principal_label', description='Fabricshow principal switch label. {0: "_",  1: ">"}', 
-                                                   unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='principal')
+                                                   unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='principal', registry=self.registry)
         # fabricshow switch did gauge
         self._gauge_switch_did = BaseGauge(name='fabricshow_switch_did', description='The switch Domain_ID and embedded port D_ID.', 
-                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='domain-id')
+                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='domain-id', registry=self.registry)
         # fabricshow switch fid gauge
         self._gauge_switch_fid = BaseGauge(name='fabricshow_switch_fid', description='Fabricshow fabric ID', 
-                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='fabric-id')
+                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='fabric-id', registry=self.registry)
         # fabricshow path-count gauge
         self._gauge_path_count = BaseGauge(name='fabricshow_path_count', description='The number of currently available paths to the remote domain.', 
-                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='path-count')
+                                              unit_keys=FabricShowToolbar.switch_wwn_pair_keys, metric_key='path-count', registry=self.registry)
 
 
     def fill_toolbar_gauge_metrics(self, sw_parser: SwitchParser) -> None:
@@ -74,7 +77,7 @@ class FabricShowToolbar(BaseToolbar):
 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
     
 
     @property
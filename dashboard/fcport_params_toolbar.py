@@ -1,7 +1,9 @@
 from parser.fcport_params_parser import FCPortParametersParser
 
-from .base_gauge import BaseGauge
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_toolbar import BaseToolbar
+from .port_metric_engine import MetricSpec, PortMetricEngine
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
@@ -44,40 +46,32 @@ class FCPortParamsToolbar(BaseToolbar):
 
     POD_LICENSE_STATUS_ID = {0: 'POD Released', 1: 'POD Reserved', 2: 'POD Disabled', 3: 'POD Enabled', 4: 'POD Unknown'}
 
-
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
-        """
-        Args:
-            sw_telemetry: set of switch telemetry retrieved from the switch
-        """
-
-        super().__init__(sw_telemetry)
-
+    # metric specs of the toolbar gauges (gauge is stored in the '_' + attr_name toolbar attribute)
+    METRIC_SPECS = [
         # fcport params switch name gauge
-        self._gauge_swname = BaseGauge(name='fcport_params_switchname', description='Switch name in the FC port parameters output.', 
-                                          unit_keys=FCPortParamsToolbar.switch_wwn_key, parameter_key='switch-name')
+        MetricSpec(attr_name='gauge_swname', name='fcport_params_switchname', description='Switch name in the FC port parameters output.', 
+                   unit_keys=BaseToolbar.switch_wwn_key, parameter_key='switch-name'),
         # fcport params fabric name gauge
-        self._gauge_fabricname = BaseGauge(name='fcport_params_fabricname', description='Fabric name in the FC port parameters output.', 
-                                              unit_keys=FCPortParamsToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
-        
+        MetricSpec(attr_name='gauge_fabricname', name='fcport_params_fabricname', description='Fabric name in the FC port parameters output.', 
+                   unit_keys=BaseToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name'),
+
         # # fcport params port name gauge
         # self._gauge_portname = BaseGauge(name='fcport_params_portname', description='Port name in the FC port parameters output.',
         #                                      unit_keys=FCPortParamsToolbar.switch_port_extended_keys, parameter_key='port-name')
-        
+
         # fcport params neighbor wwpn gauge
-        self._gauge_neighbor_wwpn = BaseGauge(name='fcport_params_neighbor_wwpn', description='The Fibre Channel WWN of the neighbor port.',
-                                                unit_keys=FCPortParamsToolbar.switch_port_extended_keys, parameter_key='neighbor-port-wwn-str')        
+        MetricSpec(attr_name='gauge_neighbor_wwpn', name='fcport_params_neighbor_wwpn', description='The Fibre Channel WWN of the neighbor port.', 
+                   unit_keys=switch_port_extended_keys, parameter_key='neighbor-port-wwn-str'),
         # fcport params switch VF ID gauge
-        self._gauge_switch_vfid = BaseGauge(name='fcport_params_switch_vfid', description='Switch virtual fabric ID in the FC port parameters output.', 
-                                               unit_keys=FCPortParamsToolbar.switch_wwn_key, metric_key='vf-id')
+        MetricSpec(attr_name='gauge_switch_vfid', name='fcport_params_switch_vfid', description='Switch virtual fabric ID in the FC port parameters output.', 
+                   unit_keys=BaseToolbar.switch_wwn_key, metric_key='vf-id'),
         # fcport params port speed gbps gauge
-        self._gauge_port_speed_value = BaseGauge(name='fcport_params_port_speed_value', description='The speed for of the port.', 
-                                               unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='port-speed-gbps')
+        MetricSpec(attr_name='gauge_port_speed_value', name='fcport_params_port_speed_value', description='The speed for of the port.', 
+                   unit_keys=switch_port_extended_keys, metric_key='port-speed-gbps'),
         # fcport params port speed mode gauge
         # 0 - 'G', 1 - 'N'
-        speed_mode_description = f'Whether the port speed is auto-negotiated on the specified port {FCPortParamsToolbar.SPEED_MODE_ID}.'
-        self._gauge_port_speed_mode = BaseGauge(name='fcport_params_port_speed_mode', description=speed_mode_description, 
-                                               unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='auto-negotiate')
+        MetricSpec(attr_name='gauge_port_speed_mode', name='fcport_params_port_speed_mode', description=f'Whether the port speed is auto-negotiated on the specified port {SPEED_MODE_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='auto-negotiate'),
         # fcport params long distance mode gauge
         # 0 - Long-distance is disabled for this port.
         # 1 - L0 configures the port as a regular port.
@@ -87,54 +81,59 @@ class FCPortParamsToolbar(BaseToolbar):
         # 5 - L0.5 configures the value as medium long (<= 25 km) .
         # 6 - LD configures the value as automatic long distance.
         # 7 - LS mode configures the value as a static long-distance link with a fixed buffer allocation greater than 10 km.'
-        ld_mode_description = f'The long-distance level {FCPortParamsToolbar.LONG_DISTANCE_LEVEL_ID}.'
-        self._gauge_port_ld_mode = BaseGauge(name='fcport_params_long_distace_mode', description=ld_mode_description, 
-                                               unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='long-distance')
+        MetricSpec(attr_name='gauge_port_ld_mode', name='fcport_params_long_distace_mode', description=f'The long-distance level {LONG_DISTANCE_LEVEL_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='long-distance'),
         # fcport params physical state gauge
-        # 0 - 'Offline', 1 - 'Online', 2 - 'Testing', 3 - 'Faulty', 4 - 'E_port', 5 - 'F_port', 
+        # 0 - 'Offline', 1 - 'Online', 2 - 'Testing', 3 - 'Faulty', 4 - 'E_port', 5 - 'F_port',
         # 6 - 'Segmented', 7 - 'Unknown', 8 - 'No_port', 9 - 'No_module', 10 - 'Laser_flt',
         # 11 - 'No_light', 12 - 'No_sync', 13 - 'In_sync', 14 - 'Port_flt', 15 - 'Hard_flt',
         # 16 - 'Diag_flt', 17 - 'Lock_ref', 18 - 'Mod_inv', 19 - 'Mod_val', 20 - 'No_sigdet'
         # 100 - 'Unknown_ID'
-        port_physical_state_description = f'The physical state of a port {FCPortParamsToolbar.PORT_PHYSICAL_STATE_ID}.'
-        self._gauge_port_physical_state = BaseGauge(name='fcport_params_physical_state', description=port_physical_state_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='physical-state-id')
+        MetricSpec(attr_name='gauge_port_physical_state', name='fcport_params_physical_state', description=f'The physical state of a port {PORT_PHYSICAL_STATE_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='physical-state-id'),
         # port physical state status gauge
-        port_physical_state_status_description = f'Port physical state status depending on port enable state {FCPortParamsToolbar.STATUS_ID}.'
-        self._gauge_port_physical_state_status = BaseGauge(name='fcport_params_port_physical_state_status', description=port_physical_state_status_description,
-                                                              unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='physical-state-status-id')
+        MetricSpec(attr_name='gauge_port_physical_state_status', name='fcport_params_port_physical_state_status', description=f'Port physical state status depending on port enable state {BaseToolbar.STATUS_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='physical-state-status-id'),
         # fcport params port type gauge
         # 0 - 'Unknown', 7 - 'E_Port', 10 - 'G_Port', 11 - 'U_Port', 15 - 'F_Port',
         # 16 - 'L_Port', 17 - 'FCoE Port', 19 - 'EX_Port', 20 - 'D_Port', 21 - 'SIM Port',
         # 22 - 'AF_Port', 23 - 'AE_Port', 25 - 'VE_Port', 26 - 'Ethernet Flex Port',
         # 29 - 'Flex Port', 30 - 'N_Port', 32768 - 'LB_Port'
-        port_type_description = f'The port type currently enabled for the specified port {FCPortParamsToolbar.PORT_TYPE_ID}.'
-        self._gauge_port_type = BaseGauge(name='fcport_params_port_type', description=port_type_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='port-type-id')
+        MetricSpec(attr_name='gauge_port_type', name='fcport_params_port_type', description=f'The port type currently enabled for the specified port {PORT_TYPE_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='port-type-id'),
         # fcport params port type for enabled ports gauge
-        enabled_port_type_description = f'The port type for the specified port if its port status is "Enabled" {FCPortParamsToolbar.PORT_TYPE_ID}.'
-        self._gauge_enabled_port_type = BaseGauge(name='fcport_params_enabled_port_type', description=enabled_port_type_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='enabled-port-type-id')
+        MetricSpec(attr_name='gauge_enabled_port_type', name='fcport_params_enabled_port_type', description=f'The port type for the specified port if its port status is "Enabled" {PORT_TYPE_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='enabled-port-type-id'),
         # fcport params port status gauge
         # -1 - 'Disabled (Persistent)', 0 - 'Disabled', 1 - 'Enabled'
-        port_status_description = f'The physical state of a port {FCPortParamsToolbar.PORT_STATUS_ID}.'
-        self._gauge_port_status = BaseGauge(name='fcport_params_port_status', description=port_status_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='port-enable-status-id')
+        MetricSpec(attr_name='gauge_port_status', name='fcport_params_port_status', description=f'The physical state of a port {PORT_STATUS_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='port-enable-status-id'),
         # fcport params enabled port wo device connected gauge
         # 0 - '_', 1 - 'Enabled'
-        nodevice_enabled_port_description = f'Enabled port with no device connected flag {FCPortParamsToolbar.NO_DEVICE_ENABLED_PORT_ID}.'
-        self._gauge_nodevice_enabled_port = BaseGauge(name='fcport_params_nodevice_enabled_port', description=nodevice_enabled_port_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='nodevice-enabled-port')
+        MetricSpec(attr_name='gauge_nodevice_enabled_port', name='fcport_params_nodevice_enabled_port', description=f'Enabled port with no device connected flag {NO_DEVICE_ENABLED_PORT_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='nodevice-enabled-port'),
         # fcport params enabled port with U-Port or G-Port type gauge
         # 0 - '_', 1 - 'Enabled U-Port ', 'Enabled G-Port'
-        uport_gport_enabled_description = f'Enabled port with U-Port or G-Port type {FCPortParamsToolbar.UPORT_GPORT_ENABLED_ID}.'
-        self._gauge_uport_gport_enabled_port = BaseGauge(name='fcport_params_uport_gport_enabled_port', description=uport_gport_enabled_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='uport-gport-enabled')
+        MetricSpec(attr_name='gauge_uport_gport_enabled_port', name='fcport_params_uport_gport_enabled_port', description=f'Enabled port with U-Port or G-Port type {UPORT_GPORT_ENABLED_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='uport-gport-enabled'),
         # fcport params pod license status gauge
         # 0 - 'POD Released', 1 - 'POD Reserved', 2 - 'POD Disabled', 3 - 'POD Enabled', 4 - 'POD Unknown'
-        pod_license_state_description = f'The POD license status for a port. {FCPortParamsToolbar.POD_LICENSE_STATUS_ID}.'
-        self._gauge_pod_license_state = BaseGauge(name='fcport_params_pod_license_state', description=pod_license_state_description,
-                                                       unit_keys=FCPortParamsToolbar.switch_port_extended_keys, metric_key='pod-license-status-id') 
+        MetricSpec(attr_name='gauge_pod_license_state', name='fcport_params_pod_license_state', description=f'The POD license status for a port. {POD_LICENSE_STATUS_ID}.', 
+                   unit_keys=switch_port_extended_keys, metric_key='pod-license-status-id'),
+    ]
+
+
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
+        """
+        Args:
+            sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
+        """
+
+        super().__init__(sw_telemetry, registry)
+
+        # toolbar gauges are created from the metric specs and filled by the single pass port engine
+        self._port_engine = PortMetricEngine(self.create_spec_gauges(FCPortParamsToolbar.METRIC_SPECS))
 
 
     def fill_toolbar_gauge_metrics(self, fcport_params_parser: FCPortParametersParser) -> None:
@@ -144,26 +143,17 @@ class FCPortParamsToolbar(BaseToolbar):
             fcport_params_parser (BrocadeFCPortParametersParser): object contains required data to fill the gauge metrics.
         """
 
-        # gauge_lst = [self.gauge_swname, self.gauge_fabricname, self.gauge_portname, self.gauge_neighbor_wwpn, 
-        #              self.gauge_switch_vfid, self.gauge_port_speed_value, self.gauge_port_speed_mode, 
-        #              self.gauge_port_ld_mode, self.gauge_port_physical_state, self.gauge_port_physical_state_status, 
-        #              self.gauge_port_type, self.gauge_enabled_port_type, self.gauge_port_status, 
-        #              self.gauge_nodevice_enabled_port, self.gauge_uport_gport_enabled_port, self.gauge_pod_license_state,]
-        
+        # each port is walked once and all toolbar gauges are set from it
+        self.port_engine.fill_port_gauge_metrics(fcport_params_parser.fcport_params)
 
-        gauge_lst = [self.gauge_swname, self.gauge_fabricname, self.gauge_neighbor_wwpn, 
-                     self.gauge_switch_vfid, self.gauge_port_speed_value, self.gauge_port_speed_mode, 
-                     self.gauge_port_ld_mode, self.gauge_port_physical_state, self.gauge_port_physical_state_status, 
-                     self.gauge_port_type, self.gauge_enabled_port_type, self.gauge_port_status, 
-                     self.gauge_nodevice_enabled_port, self.gauge_uport_gport_enabled_port, self.gauge_pod_license_state,]
 
-
-        for gauge in gauge_lst:
-            gauge.fill_port_gauge_metrics(fcport_params_parser.fcport_params)
+    def __repr__(self):
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
-    def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+    @property
+    def port_engine(self):
+        return self._port_engine
 
 
     @property
@@ -243,6 +233,3 @@ class FCPortParamsToolbar(BaseToolbar):
     @property
     def gauge_pod_license_state(self):
         return self._gauge_pod_license_state
-
-
-    
\ No newline at end of file
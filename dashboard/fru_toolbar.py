@@ -1,3 +1,5 @@
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -32,66 +34,67 @@ class FRUToolbar(BaseToolbar):
     SENSOR_STATE_ID = {0: 'absent', 1: 'ok'}
 
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
         
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
 
         # fan chassis name
         self._gauge_fan_chname = BaseGauge(name='fan_chname', description='FAN chassis name', 
-                                                    unit_keys=FRUToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name')
+                                                    unit_keys=FRUToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name', registry=self.registry)
         
         self._gauge_fan_swname = BaseGauge(name='fan_swname', description='FAN switch name', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='switch-name')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         self._gauge_fan_fabricname = BaseGauge(name='fan_fabric_name', description='FAN fabric name', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # vf id
         self._gauge_fan_vfid = BaseGauge(name='fan_vfid', description='FAN VF ids', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, metric_key='vf-id')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # fan state gauge
         # 0 - 'absent', 1 - 'ok', 2 - 'below minimum', 3 - 'above maximum', 4- 'unknown', 5 -'not ok', 6 - 'faulty'
         fan_state_description = f'Status of each fan in the system {FRUToolbar.FAN_STATE_ID}'
         self._gauge_fan_state = BaseGauge(name='fan_state', description=fan_state_description, 
-                                             unit_keys=FRUToolbar.fan_id_keys, metric_key='operational-state-id')
+                                             unit_keys=FRUToolbar.fan_id_keys, metric_key='operational-state-id', registry=self.registry)
         # fan speed gauge
         self._gauge_fan_speed = BaseGauge(name='fan_speed', description='Speed of each fan in the system', 
-                                             unit_keys=FRUToolbar.fan_id_keys, metric_key='speed')
+                                             unit_keys=FRUToolbar.fan_id_keys, metric_key='speed', registry=self.registry)
         # ps chassis name
         self._gauge_ps_chname = BaseGauge(name='ps_chname', description='PS chassis name', 
-                                                    unit_keys=FRUToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name')
+                                                    unit_keys=FRUToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name', registry=self.registry)
         self._gauge_ps_swname = BaseGauge(name='ps_swname', description='PS switch name', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='switch-name')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         self._gauge_ps_fabricname = BaseGauge(name='ps_fabric_name', description='PS fabric name', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # vf id
         self._gauge_ps_vfid = BaseGauge(name='ps_vfid', description='PS VF ids', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, metric_key='vf-id')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # ps state gauge
         # 0 - 'absent', 1 - 'ok', 2 - 'predicting failure', 3 - 'unknown', 4 - 'try reseating unit', 5 - 'faulty'
         ps_state_description = f'Status of the switch power supplies {FRUToolbar.PS_STATE_ID}'
         self._gauge_ps_state = BaseGauge(name='ps_state', description=ps_state_description, 
-                                             unit_keys=FRUToolbar.fru_id_keys, metric_key='operational-state-id')
+                                             unit_keys=FRUToolbar.fru_id_keys, metric_key='operational-state-id', registry=self.registry)
         # sensor chassis name
         self._gauge_sensor_chname = BaseGauge(name='sensor_chname', description='Sensor chassis name', 
-                                                    unit_keys=FRUToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name')
+                                                    unit_keys=FRUToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name', registry=self.registry)
         self._gauge_sensor_swname = BaseGauge(name='sensor_swname', description='Sensor switch name', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='switch-name')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         self._gauge_sensor_fabricname = BaseGauge(name='sensor_fabric_name', description='Sensor fabric name', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # vf id
         self._gauge_sensor_vfid = BaseGauge(name='sensor_vfid', description='Sensor VF ids', 
-                                                    unit_keys=FRUToolbar.switch_wwn_key, metric_key='vf-id')
+                                                    unit_keys=FRUToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # sensor state gauge
         # 0 - 'absent', 1 - 'ok'
         sensor_state_description = f'The current operational state of the sensor {FRUToolbar.SENSOR_STATE_ID}'
         self._gauge_sensor_state = BaseGauge(name='sensor_state', description=sensor_state_description, 
-                                             unit_keys=FRUToolbar.sensor_keys, metric_key='operational-state-id')
+                                             unit_keys=FRUToolbar.sensor_keys, metric_key='operational-state-id', registry=self.registry)
         # sensor temperature gauge
         self._gauge_sensor_temp = BaseGauge(name='sensor_temp', description='Sensor temperature', 
-                                             unit_keys=FRUToolbar.sensor_keys, metric_key='temperature')
+                                             unit_keys=FRUToolbar.sensor_keys, metric_key='temperature', registry=self.registry)
 
 
     def fill_toolbar_gauge_metrics(self, fru_parser: FRUParser, sw_parser: SwitchParser) -> None:
@@ -128,7 +131,7 @@ class FRUToolbar(BaseToolbar):
 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
@@ -1,3 +1,5 @@
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -35,49 +37,51 @@ class LogToolbar(BaseToolbar):
 
     # log_unit_keys = BaseToolbar.switch_port_keys + [modified_parameter_key, 'time-generated-hrf']
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest, initiator_filename: str):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, initiator_filename: str, 
+                 registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
             initiator_filename (str): filename where collect_switch_metrics function is executed (switchname by default).
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
         self._initiator_filename: str = initiator_filename
         # import switch log from the file if exists or create empty log
         self._switch_log = SwitchLog(self.initiator_filename)
 
         # log switch name gauge
         self._gauge_swname = BaseGauge(name='log_switchname', description='Switch name in the log output.', 
-                                          unit_keys=LogToolbar.switch_wwn_key, parameter_key='switch-name')
+                                          unit_keys=LogToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         # log fabric name gauge
         self._gauge_fabricname = BaseGauge(name='log_fabricname', description='Fabric name in the log output.', 
-                                              unit_keys=LogToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                              unit_keys=LogToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # log port name gauge
         # self._gauge_portname = BaseGauge(name='log_portname', description='Port name in the log output.',
         #                                      unit_keys=LogToolbar.switch_port_keys, parameter_key='port-name')
         
         self._gauge_portname = BaseGauge(name='log_portname', description='Port name in the log output.',
-                                             unit_keys=LogToolbar.log_unit_keys, parameter_key='port-name')
+                                             unit_keys=LogToolbar.log_unit_keys, parameter_key='port-name', registry=self.registry)
         # log switch VF ID gauge
         self._gauge_switch_vfid = BaseGauge(name='log_switch_vfid', description='Switch virtual fabric ID in the log output.', 
-                                               unit_keys=LogToolbar.switch_wwn_key, metric_key='vf-id')
+                                               unit_keys=LogToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # log current value gauge
         self._gauge_current_value_str = BaseGauge(name='log_current_value_str', description='The current value of the parameter.',
-                                                     unit_keys=LogToolbar.log_unit_keys, parameter_key='current-value')
+                                                     unit_keys=LogToolbar.log_unit_keys, parameter_key='current-value', registry=self.registry)
         # log previous value gauge
         self._gauge_previous_value_str = BaseGauge(name='log_previous_value_str', description='The previous value of the parameter.',
-                                                     unit_keys=LogToolbar.log_unit_keys, parameter_key='previous-value')
+                                                     unit_keys=LogToolbar.log_unit_keys, parameter_key='previous-value', registry=self.registry)
         # number of each log entry
         self._gauge_log_id = BaseGauge(name='log_id', description='Switch log messages id.',
-                                                     unit_keys=LogToolbar.log_unit_keys, metric_key='log-id')
+                                                     unit_keys=LogToolbar.log_unit_keys, metric_key='log-id', registry=self.registry)
         
         # import saved log sections to the corresponding log toolbar gauges
         self.import_saved_log()
 
 
     def import_saved_log(self) -> None:
-        """Method adds saved log sections to the log toolbar gauges.
+        """Method adds (refreshes) saved log sections to the log toolbar gauges.
         'port-name' -> gauge_portname, 
         'current-value' -> gauge_current_value_str, 
         'previous-value'-> gauge_previous_value_str.
@@ -152,23 +156,34 @@ class LogToolbar(BaseToolbar):
         # previous-value current log section
         previous_value_log = self.switch_log.current_log['previous-value']
 
+        # switch parser is required for all log sections
+        if sw_parser is None:
+            return
+
         # fill switch related values
         self.gauge_swname.fill_switch_gauge_metrics(sw_parser.fc_switch)
         self.gauge_fabricname.fill_switch_gauge_metrics(sw_parser.fc_switch)
         self.gauge_switch_vfid.fill_switch_gauge_metrics(sw_parser.fc_switch)
 
+        # log sections of the not built parsers (no valid telemetry) are skipped
         # fill fc port statistics changed values 
-        self._fill_fcport_stats_log(fcport_stats_parser, portname_log, current_value_log, previous_value_log)
+        if fcport_stats_parser:
+            self._fill_fcport_stats_log(fcport_stats_parser, portname_log, current_value_log, previous_value_log)
         # fill sfp media changed values 
-        self._fill_sfp_media_log(sfp_media_parser, portname_log, current_value_log, previous_value_log)
+        if sfp_media_parser:
+            self._fill_sfp_media_log(sfp_media_parser, portname_log, current_value_log, previous_value_log)
         # fill fc port parameters changed values
-        self._fill_fc_port_params_log(fcport_params_parser, portname_log, current_value_log, previous_value_log)
+        if fcport_params_parser:
+            self._fill_fc_port_params_log(fcport_params_parser, portname_log, current_value_log, previous_value_log)
         # fill fru parameters changed values
-        self._fill_fru_log(fru_parser, sw_parser, current_value_log, previous_value_log)
+        if fru_parser:
+            self._fill_fru_log(fru_parser, sw_parser, current_value_log, previous_value_log)
         # fill system resources changed values
-        self._fill_system_resources_log(maps_parser, sw_parser, current_value_log, previous_value_log)
+        if maps_parser:
+            self._fill_system_resources_log(maps_parser, sw_parser, current_value_log, previous_value_log)
         # fill ssp report changed log
-        self._fill_ssp_report_log(maps_parser, sw_parser, current_value_log, previous_value_log)
+        if maps_parser:
+            self._fill_ssp_report_log(maps_parser, sw_parser, current_value_log, previous_value_log)
         # # number the entries in the log
         # self._fill_log_id(current_value_log)
         # number the entries in the log and import current log iteration to the switch log
@@ -177,6 +192,9 @@ class LogToolbar(BaseToolbar):
         self.gauge_log_id.fill_chassis_gauge_metrics(self.switch_log.current_log['log-id'])
         # currrent log sections are reset to empty lists and empty flag is set to True
         self.switch_log._reset_current_log()
+        # switch log entries are refreshed in the gauges so entries removed from the log (log size threshold, ghost units)
+        # are not refreshed and evicted from the gauges as stale label sets
+        self.import_saved_log()
 
 
 
@@ -485,7 +503,7 @@ class LogToolbar(BaseToolbar):
 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
     
     
     @property
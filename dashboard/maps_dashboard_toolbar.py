@@ -1,5 +1,7 @@
 from parser.maps_parser import MAPSParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -27,52 +29,53 @@ class MAPSDashboardToolbar(BaseToolbar):
                                  2: 'warning that event condition detected'}
 
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
         
         # maps config switch name gauge
         self._gauge_mapsconfig_swname  = BaseGauge(name='mapsconfig_swname', description='MAPS config switchanme', 
-                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='switch-name')
+                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         # maps config fabric name gauge
         self._gauge_mapsconfig_fabricname  = BaseGauge(name='mapsconfig_fabric_name', description='MAPS config fabric name', 
-                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # mapsconfig switch vf-id gauge
         self._gauge_mapsconfig_vfid  = BaseGauge(name='mapsconfig_vfid', description='MAPS config switch VF ID', 
-                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, metric_key='vf-id')
+                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # maps config switch name gauge
         self._gauge_maps_policy  = BaseGauge(name='maps_policy', description='MAPS policy name', 
-                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='maps-policy')
+                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='maps-policy', registry=self.registry)
         # maps config switch name gauge
         self._gauge_maps_actions  = BaseGauge(name='maps_actions', description='MAPS actions list', 
-                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='maps-actions')
+                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='maps-actions', registry=self.registry)
 
         # dashboard rules switch name gauge
         self._gauge_db_swname = BaseGauge(name='dashboard_rule_swname', description='Dashboard rules affecting health switchname.',
-                                             unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='switch-name')
+                                             unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         # dashboard rules fabric name gauge
         self._gauge_db_fabricname  = BaseGauge(name='dashboard_rule_fabric_name', description='Dashboard rules affecting health fabric name', 
-                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                         unit_keys=MAPSDashboardToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # dashboard rules vfid gauge
         self._gauge_db_vfid = BaseGauge(name='dashboard_rule_vfid', description='Dashboard rules affecting health switch VF ID.',
-                                             unit_keys=MAPSDashboardToolbar.switch_wwn_key, metric_key='vf-id')
+                                             unit_keys=MAPSDashboardToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # dashboard rules repetition count gauge
         self._gauge_db_repetition_count = BaseGauge(name='dashboard_rule_repetition_count', description='The number of times a rule was triggered.',
-                                             unit_keys=MAPSDashboardToolbar.db_rule_keys, metric_key='repetition-count')
+                                             unit_keys=MAPSDashboardToolbar.db_rule_keys, metric_key='repetition-count', registry=self.registry)
         # dashboard rules triggered count gauge
         self._gauge_db_triggered_count = BaseGauge(name='dashboard_rule_triggered_count', description='The number of times the rule was triggered for the category.',
-                                                        unit_keys=MAPSDashboardToolbar.db_rule_keys, metric_key='triggered-count')
+                                                        unit_keys=MAPSDashboardToolbar.db_rule_keys, metric_key='triggered-count', registry=self.registry)
         # dashboard rules severity gauge
         # 0 - no event triggired or retrieved
         # 1 - information that event condition is cleared 
         # 2 - warning that event condition detected
         db_severity_description = f'Dashboard rules affecting health severity {MAPSDashboardToolbar.DB_SEVERITY_RULE_ID}.'
         self._gauge_db_severity = BaseGauge(name='dashboard_rule_severiry', description=db_severity_description,
-                                                unit_keys=MAPSDashboardToolbar.db_rule_keys, metric_key='severity')
+                                                unit_keys=MAPSDashboardToolbar.db_rule_keys, metric_key='severity', registry=self.registry)
         
      
     def fill_toolbar_gauge_metrics(self, maps_parser: MAPSParser) -> None:
@@ -96,7 +99,7 @@ class MAPSDashboardToolbar(BaseToolbar):
 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
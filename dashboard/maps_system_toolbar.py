@@ -1,6 +1,8 @@
 from parser.maps_parser import MAPSParser
 from parser.switch_parser import SwitchParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -25,60 +27,61 @@ class MAPSSystemToolbar(BaseToolbar):
     SSP_REPORT_STATUS_ID = {1: 'healthy', 2: 'unknown', 3: 'marginal', 4: 'down'}
 
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
 
         # system resource chassis name gauge
         self._gauge_sys_resource_chname = BaseGauge(name='system_resource_chname', description='System resource chassis name',
-                                                       unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name')
+                                                       unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, parameter_key='chassis-name', registry=self.registry)
         # switch name
         self._gauge_sys_resource_swname = BaseGauge(name='system_resource_swname', description='System resource switch name', 
-                                                    unit_keys=MAPSSystemToolbar.switch_wwn_key, parameter_key='switch-name')
+                                                    unit_keys=MAPSSystemToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         # fabric name
         self._gauge_sys_resource_fabricname = BaseGauge(name='system_resource_fabric_name', description='System resource fabric name', 
-                                                    unit_keys=MAPSSystemToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                                    unit_keys=MAPSSystemToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # vf id
         self._gauge_sys_resource_vfid = BaseGauge(name='ssystem_resource_vfid', description='System resource VF id', 
-                                                    unit_keys=MAPSSystemToolbar.switch_wwn_key, metric_key='vf-id')
+                                                    unit_keys=MAPSSystemToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
 
         # cpu usage gauge
         self._gauge_cpu_usage = BaseGauge(name='cpu_usage', description='CPU usage', 
-                                            unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='cpu-usage')
+                                            unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='cpu-usage', registry=self.registry)
         self._gauge_cpu_usage_status = BaseGauge(name='cpu_usage_status', description=f'CPU usage status {MAPSSystemToolbar.STATUS_ID}',
-                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='cpu-usage-status-id')
+                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='cpu-usage-status-id', registry=self.registry)
         # flash usage gauge
         self._gauge_flash_usage = BaseGauge(name='flash_usage', description='Flash usage', 
-                                            unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='flash-usage')
+                                            unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='flash-usage', registry=self.registry)
         self._gauge_flash_usage_status = BaseGauge(name='flash_usage_status', description=f'Flash usage status {MAPSSystemToolbar.STATUS_ID}',
-                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='flash-usage-status-id')
+                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='flash-usage-status-id', registry=self.registry)
         # memory usage gauge
         self._gauge_memory_usage = BaseGauge(name='memory_usage', description='Memory usage', 
-                                                unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='memory-usage')
+                                                unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='memory-usage', registry=self.registry)
         self._gauge_memory_usage_status = BaseGauge(name='memory_usage_status', description=f'Memory usage status {MAPSSystemToolbar.STATUS_ID}',
-                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='memory-usage-status-id')
+                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='memory-usage-status-id', registry=self.registry)
         
         # ssp report chname gauge
         self._gauge_ssp_report_chname = BaseGauge(name='ssp_report_chname', description='SSP report chassis name',
-                                                    unit_keys=MAPSSystemToolbar.chassis_wwn_key, parameter_key='chassis-name')
+                                                    unit_keys=MAPSSystemToolbar.chassis_wwn_key, parameter_key='chassis-name', registry=self.registry)
         # switch name
         self._gauge_ssp_report_swname = BaseGauge(name='ssp_report_swname', description='SSP report switch name', 
-                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, parameter_key='switch-name')
+                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, parameter_key='switch-name', registry=self.registry)
         # fabric name
         self._gauge_ssp_report_fabricname = BaseGauge(name='ssp_report_fabric_name', description='SSP report fabric name', 
-                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, parameter_key='fabric-user-friendly-name')
+                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # vf id
         self._gauge_ssp_report_vfid = BaseGauge(name='ssp_report_vfid', description='SSP report VF id', 
-                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='vf-id')
+                                                    unit_keys=MAPSSystemToolbar.chassis_switch_wwn_keys, metric_key='vf-id', registry=self.registry)
         # ssp report gauge
         # 1 - 'healthy', 2 - 'unknown', 3 - 'marginal', 4 - 'down'
         ssp_report_description = f'The switch status policy report state {MAPSSystemToolbar.SSP_REPORT_STATUS_ID}'
         self._gauge_ssp_report_state  = BaseGauge(name='ssp_report_state', description=ssp_report_description, 
-                                                unit_keys=MAPSSystemToolbar.ssp_report_keys, metric_key='status-id')
+                                                unit_keys=MAPSSystemToolbar.ssp_report_keys, metric_key='status-id', registry=self.registry)
 
 
     def fill_toolbar_gauge_metrics(self, maps_parser: MAPSParser, sw_parser: SwitchParser) -> None:
@@ -118,7 +121,7 @@ class MAPSSystemToolbar(BaseToolbar):
                 
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
@@ -0,0 +1,209 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from .base_gauge import BaseGauge, GaugeSeries
+
+
+class MetricSpec(NamedTuple):
+    """
+    Declarative specification of the toolbar port gauge.
+    Each spec must have either parameter_key or metric_key but not both (see BaseGauge).
+
+    Attributes:
+        attr_name (str): toolbar attribute name of the gauge (gauge is stored in the '_' + attr_name attribute).
+        name (str): Gauge unique name.
+        description (str): Gauge help.
+        unit_keys (List[str]): Gauge labels.
+        parameter_key (str, optional): Gauge parameter key contains string type value (added to gauge labels).
+        metric_key (str, optional): Gauge metric key contains numeric type value.
+    """
+
+    attr_name: str
+    name: str
+    description: str
+    unit_keys: List[str]
+    parameter_key: str = None
+    metric_key: str = None
+
+
+class PortLabels:
+    """
+    Class of the port label cache entry of the PortMetricEngine.
+    Entry keeps unit label values tuples of the port for each label schema and the gauges series of the port 
+    so label values are not converted to str and series are not looked up while port identity is not changed.
+
+    Attributes:
+        identity (tuple): port unit label values (identity fields) the entry is built for.
+        unit_labels (List[tuple]): interned str unit label values tuple of each label schema.
+        series (List[GaugeSeries]): port series of each engine gauge. None if series is not requested yet.
+        parameters (list): parameter value of the parameter gauges series.
+    """
+
+    __slots__ = ('identity', 'unit_labels', 'series', 'parameters')
+
+
+    def __init__(self, identity: tuple, unit_labels: List[tuple], gauges_number: int):
+        self.identity = identity
+        self.unit_labels = unit_labels
+        self.series: List[GaugeSeries] = [None] * gauges_number
+        self.parameters: list = [None] * gauges_number
+
+
+class PortMetricEngine:
+    """
+    Class of the single pass port fill engine of the port toolbars.
+    BaseGauge.fill_port_gauge_metrics walks all ports and builds label values for a single gauge
+    so the toolbar with N gauges walks each port N times.
+    Engine walks each port once, reads all the keys gauges require in a single call,
+    converts label values to str once and builds unit label values once for each label schema (gauge unit keys).
+    Each gauge is set from the port values with the index lookups.
+
+    Unit label values (switch-wwn, port-index, name, slot, port, port-name) rarely change so engine keeps 
+    label cache keyed by port identity (vf_id and port key of the gauge data). Cache entry keeps interned 
+    unit label values tuples and gauges series (bound Gauge children) of the port. Entry is rebuilt 
+    if any port identity field (unit label value) changed, parameter gauge series is requested again 
+    if parameter value changed or series is evicted. Entries of the ports which are not filled are dropped.
+
+    Attributes:
+        gauges (List[BaseGauge]): gauges filled by the engine.
+        keys (List[str]): port keys read by the engine (unit keys are followed by the parameter and metric keys).
+    """
+
+    def __init__(self, gauges: List[BaseGauge]):
+        """
+        Args:
+            gauges (List[BaseGauge]): toolbar gauges filled with the port level dictionaries (port records).
+        """
+
+        self._gauges = gauges
+        # unit keys (port identity) are placed first and followed by the parameter and metric keys
+        unit_keys = []
+        for gauge in self.gauges:
+            unit_keys.extend(key for key in gauge.unit_keys if key not in unit_keys)
+        value_keys = []
+        for gauge in self.gauges:
+            value_key = gauge.parameter_key or gauge.metric_key
+            if value_key not in unit_keys + value_keys:
+                value_keys.append(value_key)
+        self._keys = unit_keys + value_keys
+        self._unit_keys_number = len(unit_keys)
+
+        key_positions = {key: position for position, key in enumerate(self.keys)}
+        # label schemas (unit keys positions) and gauge schema position, value position and parameter gauge flag
+        self._schemas: List[tuple] = []
+        self._gauge_fills: List[Tuple[BaseGauge, int, int, bool]] = []
+        for gauge in self.gauges:
+            unit_positions = tuple(key_positions[key] for key in gauge.unit_keys)
+            if unit_positions not in self._schemas:
+                self._schemas.append(unit_positions)
+            self._gauge_fills.append((gauge, self._schemas.index(unit_positions), 
+                                      key_positions[gauge.parameter_key or gauge.metric_key], gauge.parameter_key is not None))
+        # (vf_id, port key) and port label cache entry pairs
+        self._port_labels_cache: Dict[tuple, PortLabels] = {}
+
+
+    def fill_port_gauge_metrics(self, gauge_data: Dict[int, Dict[str, Mapping]]) -> None:
+        """Method to unpack gauge_data to get port level dictionaries and set all gauges from each port.
+        Labels and metric values are the same as filled by BaseGauge.fill_port_gauge_metrics for each gauge
+        (None label value is replaced with 'no data', empty metric value is not added,
+        parameter gauge metric value is 0 if parameter value is None otherwise 1).
+
+        Args:
+            gauge_data (Dict[int, Dict[str, Mapping]]): Nested dictionaries. Each dictionary contains port level element parameters.
+        """
+
+        if not gauge_data:
+            return
+
+        unit_keys_number = self._unit_keys_number
+        gauge_fills = self._gauge_fills
+        # ports which are not filled are dropped from the cache
+        port_labels_cache = {}
+        # port data which is not a dictionary is skipped and logged once per fill (first skipped port)
+        skipped_ports = []
+        # gauge_data_switch for the current vfid
+        for vf_id, gauge_data_switch in gauge_data.items():
+
+            if not gauge_data_switch:
+                continue
+
+            # gauge_data_port for the current port
+            for port_key, gauge_data_port in gauge_data_switch.items():
+
+                if not gauge_data_port:
+                    continue
+                if not isinstance(gauge_data_port, Mapping):
+                    skipped_ports.append((vf_id, port_key))
+                    continue
+
+                # all port values are read in a single call
+                port_values = BaseGauge.get_ordered_values(gauge_data_port, self.keys, fillna=None)
+                identity = tuple(port_values[:unit_keys_number])
+                port_labels = self._port_labels_cache.get((vf_id, port_key))
+                # unit label values and series are built again if port identity changed
+                if port_labels is None or port_labels.identity != identity:
+                    port_labels = PortLabels(identity, self._get_unit_labels(identity), len(gauge_fills))
+                port_labels_cache[(vf_id, port_key)] = port_labels
+                unit_labels, port_series, parameters = port_labels.unit_labels, port_labels.series, port_labels.parameters
+
+                for gauge_position, (gauge, schema_position, value_position, parameter_gauge) in enumerate(gauge_fills):
+                    metric_value = port_values[value_position]
+                    series = port_series[gauge_position]
+                    # parameter value is added to the labels and metric value is 0 or 1
+                    if parameter_gauge:
+                        if series is None or series.evicted or not PortMetricEngine.same_value(parameters[gauge_position], metric_value):
+                            label_values = unit_labels[schema_position] + (PortMetricEngine.get_label(metric_value),)
+                            series = port_series[gauge_position] = gauge.get_series(label_values)
+                            parameters[gauge_position] = metric_value
+                        gauge.set_series_metric(series, 0 if metric_value is None else 1)
+                    elif metric_value is not None:
+                        if series is None or series.evicted:
+                            series = port_series[gauge_position] = gauge.get_series(unit_labels[schema_position])
+                        gauge.set_series_metric(series, metric_value)
+        self._port_labels_cache = port_labels_cache
+        if skipped_ports:
+            vf_id, port_key = skipped_ports[0]
+            print(f"{len(skipped_ports)} port(s) skipped, port data is not a dictionary (vf_id: {vf_id}, port: {port_key})")
+
+
+    def _get_unit_labels(self, identity: tuple) -> List[tuple]:
+        """Method builds interned str unit label values tuple of each label schema from the port identity.
+
+        Args:
+            identity (tuple): port unit label values.
+
+        Returns:
+            List[tuple]: unit label values tuple of each label schema.
+        """
+
+        labels = [PortMetricEngine.get_label(value) for value in identity]
+        return [tuple([labels[position] for position in unit_positions]) for unit_positions in self._schemas]
+
+
+    @staticmethod
+    def get_label(value: Any, fillna: str = 'no data') -> str:
+        """Method converts value to the interned str label value (None is replaced with fillna)."""
+
+        return sys.intern(fillna if value is None else str(value))
+
+
+    @staticmethod
+    def same_value(cached_value: Any, value: Any) -> bool:
+        """Method checks if value is the same as cached value (same type so str label value is the same)."""
+
+        return cached_value is value or (type(cached_value) is type(value) and cached_value == value)
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} gauges: {len(self.gauges)} keys: {len(self.keys)} ports: {len(self._port_labels_cache)}"
+
+
+    @property
+    def gauges(self):
+        return self._gauges
+
+
+    @property
+    def keys(self):
+        return self._keys
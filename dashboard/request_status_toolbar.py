@@ -1,6 +1,11 @@
+from typing import List
+
 from parser.request_status_parser import RequestStatusParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
+from .base_histogram import BaseHistogram
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
@@ -8,11 +13,16 @@ from collection.switch_telemetry_request import SwitchTelemetryRequest
 class RequestStatusToolbar:
     """
     Class to create HTTP request status toolbar for each container.
-    Toolbar is a set of prometheus gauges: rs_id, rs_code, rs_error, rs_date, rs_time.
+    Toolbar is a set of prometheus gauges: rs_id, rs_code, rs_error, rs_date, rs_time, rs_module_retries,
+    rs_stale, rs_telemetry_age and request statistics histograms: request duration, response size, 
+    json decode duration, number of retries.
+    Histograms observe requests performed in the current cycle only (cached module responses are skipped,
+    failed requests served from the last good response are observed).
     Each container is identifed by switch ip address, vf-id, module name, container name
 
     Attributes:
         sw_telemetry: set of switch telemetry retrieved from the switch
+        registry (CollectorRegistry): prometheus registry toolbar gauges are registered in.
     """
 
 
@@ -20,37 +30,70 @@ class RequestStatusToolbar:
     
     REQUEST_STATUS_ID = {1: 'OK',  2: 'Warnig', 3: 'Fail'}
 
+    # histograms buckets
+    REQUEST_DURATION_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30]
+    RESPONSE_BYTES_BUCKETS = [1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216]
+    DECODE_DURATION_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1]
+    REQUEST_RETRIES_BUCKETS = [0, 1, 2, 3]
+
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
         self._sw_telemetry: SwitchTelemetryRequest = sw_telemetry
+        self._sw_ipaddress = sw_telemetry.sw_ipaddress
+        self._registry: CollectorRegistry = registry
 
         # request status chassis name gauge
         self._gauge_rs_chname = BaseGauge(name='request_status_chassis_name', description='Chassis name corresponding to the IP address loaded from db',
-                                          unit_keys=['ip-address'], parameter_key='chassis-name')
+                                          unit_keys=['ip-address'], parameter_key='chassis-name', registry=self.registry)
         # request status_id gauge
         # 1 - 'Ok',  2 - 'Warnig', 3 - 'Fail'
         rs_id_description = f'HTTP request status ID {RequestStatusToolbar.REQUEST_STATUS_ID}.'
         self._gauge_rs_id =  BaseGauge(name='request_status_id', description=rs_id_description,
-                                          unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='status-id')
+                                          unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='status-id', registry=self.registry)
         # request status_code gauge
         # HTTP Status Code, 200-OK, 400-Bad Request etc
         self._gauge_rs_code =  BaseGauge(name='request_status_code', description='HTTP request status code', 
-                                            unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='status-code')
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='status-code', registry=self.registry)
         # request status error message guage
         self._gauge_rs_error =  BaseGauge(name='request_status_error', description='HTTP request status error message', 
-                                            unit_keys=RequestStatusToolbar.rs_container_keys, parameter_key='error-message')
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, parameter_key='error-message', registry=self.registry)
         # request status date guage
         self._gauge_rs_date =  BaseGauge(name='request_status_date', description='HTTP request status date', 
-                                            unit_keys=RequestStatusToolbar.rs_container_keys, parameter_key='date')
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, parameter_key='date', registry=self.registry)
         # request status time guage
         self._gauge_rs_time =  BaseGauge(name='request_status_time', description='HTTP request status time', 
-                                            unit_keys=RequestStatusToolbar.rs_container_keys, parameter_key='time')
-
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, parameter_key='time', registry=self.registry)
+        # number of module request retries within the polling cycle gauge
+        self._gauge_rs_module_retries =  BaseGauge(name='request_status_module_retries', description='HTTP request number of retries within the polling cycle', 
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='module-retries', registry=self.registry)
+        # failed request served from the last good response gauge (1 - stale, 0 - fresh)
+        self._gauge_rs_stale =  BaseGauge(name='request_status_stale', description='HTTP request failed and container is filled with the last good response', 
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='stale', registry=self.registry)
+        # last good response age gauge (0 for fresh response)
+        self._gauge_rs_telemetry_age =  BaseGauge(name='request_status_telemetry_age_seconds', description='Age of the last good response the stale container is filled with', 
+                                            unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='telemetry-age', registry=self.registry)
+        # request duration histogram (including retries)
+        self._histogram_rs_duration = BaseHistogram(name='request_duration_seconds', description='HTTP request duration',
+                                                    unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='request-duration', 
+                                                    buckets=RequestStatusToolbar.REQUEST_DURATION_BUCKETS, registry=self.registry)
+        # response size histogram
+        self._histogram_rs_bytes = BaseHistogram(name='request_response_bytes', description='HTTP response size',
+                                                 unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='response-bytes', 
+                                                 buckets=RequestStatusToolbar.RESPONSE_BYTES_BUCKETS, registry=self.registry)
+        # response json decode duration histogram
+        self._histogram_rs_decode = BaseHistogram(name='request_decode_seconds', description='HTTP response json decode duration',
+                                                  unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='decode-duration', 
+                                                  buckets=RequestStatusToolbar.DECODE_DURATION_BUCKETS, registry=self.registry)
+        # number of retries histogram (stale connection and session token rejection)
+        self._histogram_rs_retries = BaseHistogram(name='request_retries', description='HTTP request number of retries',
+                                                   unit_keys=RequestStatusToolbar.rs_container_keys, metric_key='request-retries', 
+                                                   buckets=RequestStatusToolbar.REQUEST_RETRIES_BUCKETS, registry=self.registry)
 
 
     def fill_toolbar_gauge_metrics(self, request_status_parser: RequestStatusParser) -> None:
@@ -61,14 +104,31 @@ class RequestStatusToolbar:
         """
 
         gauge_lst = [self.gauge_rs_chname, self.gauge_rs_id, self.gauge_rs_code, 
-                     self.gauge_rs_error, self.gauge_rs_date, self.gauge_rs_time]
+                     self.gauge_rs_error, self.gauge_rs_date, self.gauge_rs_time, self.gauge_rs_module_retries,
+                     self.gauge_rs_stale, self.gauge_rs_telemetry_age]
         
         for gauge in gauge_lst:
             gauge.fill_chassis_gauge_metrics(request_status_parser.request_status)
 
+        # cached module responses were not requested in the current cycle
+        # stale module responses are cached but failed request was performed in the current cycle
+        requested_status = [request_status for request_status in request_status_parser.request_status 
+                            if not request_status.get('cached') or request_status.get('stale')]
+        histogram_lst = [self.histogram_rs_duration, self.histogram_rs_bytes, 
+                         self.histogram_rs_decode, self.histogram_rs_retries]
+
+        for histogram in histogram_lst:
+            histogram.fill_chassis_histogram_metrics(requested_status)
+
+
+    def release_telemetry(self) -> None:
+        """Method drops the switch telemetry reference (toolbar needs switch ip address only)."""
+
+        self._sw_telemetry = None
+
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
@@ -76,6 +136,16 @@ class RequestStatusToolbar:
         return self._sw_telemetry
 
 
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
+    @property
+    def registry(self):
+        return self._registry
+
+
     @property
     def gauge_rs_chname(self):
         return self._gauge_rs_chname
@@ -104,3 +174,44 @@ class RequestStatusToolbar:
     @property
     def gauge_rs_time(self):
         return self._gauge_rs_time
+
+
+    @property
+    def gauge_rs_module_retries(self):
+        return self._gauge_rs_module_retries
+
+
+    @property
+    def gauge_rs_stale(self):
+        return self._gauge_rs_stale
+
+
+    @property
+    def gauge_rs_telemetry_age(self):
+        return self._gauge_rs_telemetry_age
+
+
+    @property
+    def histogram_rs_duration(self):
+        return self._histogram_rs_duration
+
+
+    @property
+    def histogram_rs_bytes(self):
+        return self._histogram_rs_bytes
+
+
+    @property
+    def histogram_rs_decode(self):
+        return self._histogram_rs_decode
+
+
+    @property
+    def histogram_rs_retries(self):
+        return self._histogram_rs_retries
+
+
+    @property
+    def gauges(self) -> List[BaseGauge]:
+        # all gauges of the toolbar
+        return [value for value in vars(self).values() if isinstance(value, BaseGauge)]
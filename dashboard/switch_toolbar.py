@@ -1,5 +1,7 @@
 from parser.switch_parser import SwitchParser
 
+from prometheus_client import REGISTRY, CollectorRegistry
+
 from .base_gauge import BaseGauge
 from .base_toolbar import BaseToolbar
 
@@ -25,143 +27,144 @@ class SwitchToolbar(BaseToolbar):
     MODE_STATUS_ID = {0: 'Disabled', 1: 'Enabled'}
 
 
-    def __init__(self, sw_telemetry: SwitchTelemetryRequest):
+    def __init__(self, sw_telemetry: SwitchTelemetryRequest, registry: CollectorRegistry = REGISTRY):
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch
+            registry (CollectorRegistry): prometheus registry toolbar gauges are registered in. Defaults to REGISTRY.
         """
 
-        super().__init__(sw_telemetry)
+        super().__init__(sw_telemetry, registry)
 
         # switch name gauge
         self._gauge_swname = BaseGauge(name='switch_name', description='Switch name', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='switch-name')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='switch-name', registry=self.registry)
         # switch ip address gauge
         self._gauge_switch_ip = BaseGauge(name='switch_ip_address', description='Switch IP address', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='ip-address')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='ip-address', registry=self.registry)
         # switch fabric name gauge
         self._gauge_switch_fabricname = BaseGauge(name='switch_fabric_name', description='Switch fabric name', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='fabric-user-friendly-name', registry=self.registry)
         # switch uptime gauge
         self._gauge_switch_uptime = BaseGauge(name='switch_uptime', description='Switch uptime', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='up-time-hrf')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, parameter_key='up-time-hrf', registry=self.registry)
         # switch uptime days gauge
         self._gauge_switch_uptime_days = BaseGauge(name='switch_uptime_days', description='Switch uptime_days', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-d')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-d', registry=self.registry)
         # switch uptime hours gauge
         self._gauge_switch_uptime_hours = BaseGauge(name='switch_uptime_hours', description='Switch uptime_hours', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-hr')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-hr', registry=self.registry)
         # switch uptime mins gauge
         self._gauge_switch_uptime_mins = BaseGauge(name='switch_uptime_minutes', description='Switch uptime_minutes', 
-                                           unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-min')
+                                           unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-min', registry=self.registry)
         # switch uptime status gauge
         # 1 - 'OK', 2 - 'Unknown', 3 - 'Warning', 4 - 'Critical'
         switch_uptime_status_description  = f'Switch uptime status id {SwitchToolbar.STATUS_ID}.'
         self._gauge_switch_uptime_status = BaseGauge(name='switch_uptime_status', 
                                                      description=switch_uptime_status_description, 
-                                                     unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-status-id')        
+                                                     unit_keys=SwitchToolbar.switch_wwn_key, metric_key='up-time-status-id', registry=self.registry)        
         # switch state gauge
         #  0 - Undefined, 2 - Online. 3 = Offline, 7 - Testing
         switch_state_description = f'The current state of the switch {SwitchToolbar.SWITCH_STATE_ID}.'
         self._gauge_switch_state = BaseGauge(name='switch_state', description=switch_state_description, 
-                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='operational-status')
+                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='operational-status', registry=self.registry)
         # switch role gauge
         # -1 - Disabled, 0 - Subordinate, 1 - Principal
         switch_role_description = f'Switch role: Principal, Subordinate, or Disabled {SwitchToolbar.SWITCH_ROLE_ID}.'
         self._gauge_switch_role = BaseGauge(name='switch_role', description=switch_role_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='switch-role-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='switch-role-id', registry=self.registry)
         # switch mode gauge
         # 0, 1 - Native, 2 - 'Access Gateway'
         switch_mode_description = f'Switch operation mode: Access Gateway (if AG is enabled) {SwitchToolbar.SWITCH_MODE_ID}.'
         self._gauge_switch_mode = BaseGauge(name='switch_mode', description=switch_mode_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='ag-mode')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='ag-mode', registry=self.registry)
         # switch domain id gauge
         self._gauge_switch_did = BaseGauge(name='switch_did', description='Switch domain ID', 
-                                              unit_keys=SwitchToolbar.switch_wwn_key, metric_key='domain-id')
+                                              unit_keys=SwitchToolbar.switch_wwn_key, metric_key='domain-id', registry=self.registry)
         # switch fabric id gauge
         self._gauge_switch_fid = BaseGauge(name='switch_fid', description='Switch fabric ID', 
-                                              unit_keys=SwitchToolbar.switch_wwn_key, metric_key='fabric-id')
+                                              unit_keys=SwitchToolbar.switch_wwn_key, metric_key='fabric-id', registry=self.registry)
         # switch VF ID gauge
         self._gauge_switch_vfid = BaseGauge(name='switch_vfid', description='Switch virtual fabric ID', 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='vf-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='vf-id', registry=self.registry)
         # switch port quantity gauge
         self._gauge_switch_port_quantity = BaseGauge(name='switch_port_quantity', description='', 
-                                                        unit_keys=SwitchToolbar.switch_wwn_key, metric_key='port-member-quantity')
+                                                        unit_keys=SwitchToolbar.switch_wwn_key, metric_key='port-member-quantity', registry=self.registry)
         # online port quantity gauge
         self._gauge_online_port_quantity = BaseGauge(name='online_port_quantity', description='Number of online ports', 
-                                                        unit_keys=SwitchToolbar.switch_wwn_key, metric_key='online-port-quantity')
+                                                        unit_keys=SwitchToolbar.switch_wwn_key, metric_key='online-port-quantity', registry=self.registry)
         # uport-gport-enabled-quantity gauge
         self._gauge_uport_gport_enabled_quantity = BaseGauge(name='uport_gport_enabled_quantity', 
                                                                 description='Number of enabled ports with no device connected to', 
-                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='uport-gport-enabled-quantity')
+                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='uport-gport-enabled-quantity', registry=self.registry)
         # port-physical-state-status-id
         # 1 - 'OK', 2 - 'Unknown', 3 - 'Warning', 4 - 'Critical'
         port_physical_state_status_description = f'Switch port physical state status depending on port enable state {SwitchToolbar.STATUS_ID}.'
         self._gauge_switch_port_physical_state_status = BaseGauge(name='switch_port_physical_state_status', 
                                                                 description=port_physical_state_status_description, 
-                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='port-physical-state-status-id')
+                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='port-physical-state-status-id', registry=self.registry)
         # base switch status gauge
         # 0 - Disabled, 1 - Enabled
         base_switch_status_description = f'Base switch status {SwitchToolbar.MODE_STATUS_ID}.'
         self._gauge_base_switch_status = BaseGauge(name='base_switch_status', description=base_switch_status_description, 
-                                                      unit_keys=SwitchToolbar.switch_wwn_key, metric_key='base-switch-enabled')
+                                                      unit_keys=SwitchToolbar.switch_wwn_key, metric_key='base-switch-enabled', registry=self.registry)
         # default switch status
         # 0 - Disabled, 1 - Enabled
         default_switch_status_description = f'Default switch status {SwitchToolbar.MODE_STATUS_ID}.'
         self._gauge_default_switch_status = BaseGauge(name='default_switch_status', description=default_switch_status_description, 
-                                                         unit_keys=SwitchToolbar.switch_wwn_key, metric_key='default-switch-status')
+                                                         unit_keys=SwitchToolbar.switch_wwn_key, metric_key='default-switch-status', registry=self.registry)
         # logical isl status
         # 0 - Disabled, 1 - Enabled
         logiacal_isl_status_description = f'Logical isl status {SwitchToolbar.MODE_STATUS_ID}.'
         self._gauge_logical_isl_status = BaseGauge(name='logical_isl_status', description=logiacal_isl_status_description, 
-                                                      unit_keys=SwitchToolbar.switch_wwn_key, metric_key='logical-isl-enabled')
+                                                      unit_keys=SwitchToolbar.switch_wwn_key, metric_key='logical-isl-enabled', registry=self.registry)
         # 1 - 'OK', 2 - 'Unknown', 3 - 'Warning', 4 - 'Critical'
         # port in-throughput-status-id
         description_in_throughput_status_id = f"Switch port receive throughput status id {SwitchToolbar.STATUS_ID}."
         self._gauge_switch_in_throughput_status_id = BaseGauge(name='switch_port_in_throughput_status', 
                                                                 description=description_in_throughput_status_id, 
-                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='in-throughput-status-id')
+                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='in-throughput-status-id', registry=self.registry)
         # port out-throughput-status-id
         description_out_throughput_status_id = f"Switch port transmit throughput status id {SwitchToolbar.STATUS_ID}."
         self._gauge_switch_out_throughput_status_id = BaseGauge(name='switch_port_out_throughput_status', 
                                                                 description=description_out_throughput_status_id, 
-                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='out-throughput-status-id')
+                                                                unit_keys=SwitchToolbar.switch_wwn_key, metric_key='out-throughput-status-id', registry=self.registry)
         # low severiry errors port status id
         description_low_severity_errors_status_id = f"Switch port error status ID {SwitchToolbar.STATUS_ID} for the LOW severity errors {FCPortStatisticsParser.LOW_SEVERITY_ERROR_LEAFS}."
         self._gauge_low_severity_errors_status_id = BaseGauge(name="switch_low_severity_errors_port_status_id", description=description_low_severity_errors_status_id, 
-                                                                      unit_keys=SwitchToolbar.switch_wwn_key, metric_key="low-severity-errors_port-status-id")
+                                                                      unit_keys=SwitchToolbar.switch_wwn_key, metric_key="low-severity-errors_port-status-id", registry=self.registry)
         # medium severiry errors port status id
         description_medium_severity_errors_status_id = f"Switch port error status ID {SwitchToolbar.STATUS_ID} for the MEDIUM severity errors {FCPortStatisticsParser.MEDIUM_SEVERITY_ERROR_LEAFS}."
         self._gauge_medium_severity_errors_status_id = BaseGauge(name="switch_medium_severity_errors_port_status_id", description=description_medium_severity_errors_status_id, 
-                                                                         unit_keys=SwitchToolbar.switch_wwn_key, metric_key="medium-severity-errors_port-status-id")
+                                                                         unit_keys=SwitchToolbar.switch_wwn_key, metric_key="medium-severity-errors_port-status-id", registry=self.registry)
         # high severiry errors port status id
         description_high_severity_errors_status_id = f"Switch port error status ID {SwitchToolbar.STATUS_ID} for the HIGH severity errors {FCPortStatisticsParser.HIGH_SEVERITY_ERROR_LEAFS}."
         self._gauge_high_severity_errors_status_id = BaseGauge(name="switch_high_severity_errors_port_status_id", description=description_high_severity_errors_status_id, 
-                                    unit_keys=SwitchToolbar.switch_wwn_key, metric_key="high-severity-errors_port-status-id")
+                                    unit_keys=SwitchToolbar.switch_wwn_key, metric_key="high-severity-errors_port-status-id", registry=self.registry)
         # sfp media temperature status id gauge
         temperature_status_description = f'Switch SFP temperature status {SwitchToolbar.STATUS_ID}.'
         self._gauge_sfp_temperature_status = BaseGauge(name='switch_sfp_temperature_status', description=temperature_status_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='temperature-status-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='temperature-status-id', registry=self.registry)
         # remote sfp media temperature status id gauge
         temperature_remote_status_description = f'Switch remote SFP temperature status {SwitchToolbar.STATUS_ID}.'
         self._gauge_sfp_remote_temperature_status = BaseGauge(name='switch_remote_sfp_temperature_status', description=temperature_remote_status_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='remote-media-temperature-status-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='remote-media-temperature-status-id', registry=self.registry)
         # sfp media rx-power status id gauge
         rx_power_status_description = f'Switch SFP rx power status {SwitchToolbar.STATUS_ID}.'
         self._gauge_sfp_rx_power_status = BaseGauge(name='switch_sfp_rx_power_status', description=rx_power_status_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='rx-power-status-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='rx-power-status-id', registry=self.registry)
         # sfp media tx-power status id gauge
         tx_power_status_description = f'Switch SFP tx power status {SwitchToolbar.STATUS_ID}.'
         self._gauge_sfp_tx_power_status = BaseGauge(name='switch_sfp_tx_power_status', description=tx_power_status_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='tx-power-status-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='tx-power-status-id', registry=self.registry)
         # remote sfp media rx-power status id gauge
         rx_power_remote_status_description = f'Switch remote SFP rx power status {SwitchToolbar.STATUS_ID}.'
         self._gauge_sfp_remote_rx_power_status = BaseGauge(name='switch_remote_sfp_rx_power_status', description=rx_power_remote_status_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='remote-media-rx-power-status-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='remote-media-rx-power-status-id', registry=self.registry)
         # remote sfp media tx-power status id gauge
         tx_power_remote_status_description = f'Switch remote SFP tx power status {SwitchToolbar.STATUS_ID}.'
         self._gauge_sfp_remote_tx_power_status = BaseGauge(name='switch_remote_sfp_tx_power_status', description=tx_power_remote_status_description, 
-                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='remote-media-tx-power-status-id')
+                                               unit_keys=SwitchToolbar.switch_wwn_key, metric_key='remote-media-tx-power-status-id', registry=self.registry)
         
     
     def fill_toolbar_gauge_metrics(self, sw_parser: SwitchParser) -> None:
@@ -188,7 +191,7 @@ class SwitchToolbar(BaseToolbar):
         
 
     def __repr__(self):
-        return f"{self.__class__.__name__} ip_address: {self.sw_telemetry.sw_ipaddress}"
+        return f"{self.__class__.__name__} ip_address: {self.sw_ipaddress}"
 
 
     @property
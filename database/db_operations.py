@@ -1,5 +1,6 @@
 import os
 import pickle
+import threading
 from typing import Any
 from parser.chassis_parser import ChassisParser
 
@@ -11,6 +12,9 @@ SWITCH_LOG_DIR = os.path.join(DATABASE_DIR, 'switch_log')
 MAX_SWITCH_LOG_LINES = 103
 SWITCH_LOG_FILENAME_EXT = '_swlog.pickle'
 
+# nameserver file is shared by all switches polled in the single process collector
+NS_LOCK = threading.RLock()
+
 
 
 def file_exist(dirname: str, filename: str) -> bool:
@@ -74,9 +78,10 @@ def create_nameserver(ns_dir=DATABASE_DIR, ns_filename=NS_FILENAME):
     ns_empty_dct = {}
     ns_filepath = os.path.join(ns_dir, ns_filename)
 
-    if not os.path.exists(ns_filepath):
-        print('Creating chname_ip_db derfault file')
-        save_object(ns_empty_dct, ns_dir, ns_filename)
+    with NS_LOCK:
+        if not os.path.exists(ns_filepath):
+            print('Creating chname_ip_db derfault file')
+            save_object(ns_empty_dct, ns_dir, ns_filename)
 
 
 def update_nameserver(ch_parser: ChassisParser, ns_dir=DATABASE_DIR, ns_filename=NS_FILENAME) -> None:
@@ -93,13 +98,14 @@ def update_nameserver(ch_parser: ChassisParser, ns_dir=DATABASE_DIR, ns_filename
 
     if not ch_parser.ch_name:
         return
-    sw_ipaddress = ch_parser.sw_telemetry.sw_ipaddress
-
-    # load current nameserver from the database
-    nameserver_dct = load_object(ns_dir, ns_filename)
-    if not nameserver_dct.get(sw_ipaddress) or nameserver_dct[sw_ipaddress] != ch_parser.ch_name:
-        nameserver_dct[sw_ipaddress] = ch_parser.ch_name
-        save_object(nameserver_dct, ns_dir, ns_filename)
+    sw_ipaddress = ch_parser.sw_ipaddress
+
+    with NS_LOCK:
+        # load current nameserver from the database
+        nameserver_dct = load_object(ns_dir, ns_filename)
+        if not nameserver_dct.get(sw_ipaddress) or nameserver_dct[sw_ipaddress] != ch_parser.ch_name:
+            nameserver_dct[sw_ipaddress] = ch_parser.ch_name
+            save_object(nameserver_dct, ns_dir, ns_filename)
 
 
 def create_directory_if_not_exists(directory_path: str) -> None:
@@ -1,7 +1,24 @@
-from typing import Dict, List, Literal, Optional, Tuple, Union
+import copy
+from typing import Dict, List, Literal, Optional, Self, Tuple, Union
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
+from .parser_snapshot import ParserSnapshot
+from .port_record import PortRecord
+
+
+class _MissingValue:
+    """Class of the missing key marker in the values fingerprint (single instance after unpickling)."""
+
+    def __reduce__(self):
+        return '_MISSING_VALUE'
+
+    def __repr__(self):
+        return 'MISSING_VALUE'
+
+
+_MISSING_VALUE = _MissingValue()
+
 
 class BaseParser:
     """
@@ -36,6 +53,7 @@ class BaseParser:
         """
 
         self._sw_telemetry: SwitchTelemetryRequest = sw_telemetry
+        self._sw_ipaddress = sw_telemetry.sw_ipaddress
         self._ch_wwn = self._get_chassis_wwn()
         self._ch_name = self._get_chassis_name()
         self._telemetry_date = self._get_telemetry_datetime('date')
@@ -88,10 +106,86 @@ class BaseParser:
         """
 
         return self.ch_wwn == other.ch_wwn
+
+
+    def same_parser_type(self, other: Union['BaseParser', ParserSnapshot]) -> bool:
+        """Method detects if other is the parser of the same class or the snapshot of the parser of the same class.
+
+        Args:
+            other (BaseParser, ParserSnapshot): parser or parser snapshot retrieved from the previous sw_telemetry.
+
+        Returns:
+            bool: same parser class or not.
+        """
+
+        if isinstance(other, ParserSnapshot):
+            return other.parser_name == self.__class__.__name__
+        return str(type(self)) == str(type(other))
+
+
+    def release_telemetry(self) -> None:
+        """Method drops the raw switch telemetry reference after the parser values are extracted.
+        All telemetry values are extracted in the constructor so parser is fully functional 
+        (except sw_telemetry attribute which is None).
+        """
+
+        self._sw_telemetry = None
+
+
+    def get_reused(self, sw_telemetry: SwitchTelemetryRequest) -> Self:
+        """Method creates the current cycle parser from the previous cycle parser 
+        if parser telemetry containers are not changed (parsed values are the same).
+        Parser values are shared with the previous parser, telemetry date and time are taken 
+        from the current telemetry and changed values are cleared (nothing is changed since the previous cycle).
+
+        Args:
+            sw_telemetry: set of switch telemetry retrieved from the switch in the current cycle.
+
+        Returns:
+            BaseParser: parser of the current cycle.
+        """
+
+        parser = copy.copy(self)
+        parser._sw_telemetry = sw_telemetry
+        parser._telemetry_date = parser._get_telemetry_datetime('date')
+        parser._telemetry_time = parser._get_telemetry_datetime('time')
+        parser._telemetry_datetime = parser.telemetry_date + " " + parser.telemetry_time
+        parser._clear_changed_values()
+        return parser
+
+
+    def _clear_changed_values(self) -> None:
+        """Method clears values changed since the previous cycle (parsers which find changed values)."""
+
+        pass
+
+
+    def get_snapshot(self) -> ParserSnapshot:
+        """Method creates previous state snapshot of the parser for the next cycle parser
+        to be used instead of the parser copy.
+
+        Returns:
+            ParserSnapshot: parser snapshot.
+        """
+
+        return ParserSnapshot(self.__class__.__name__, self.ch_wwn, self.telemetry_date, self.telemetry_time, 
+                              self._get_snapshot_state())
+
+
+    def _get_snapshot_state(self) -> Dict[str, Union[dict, None]]:
+        """Method returns parser values the next cycle parser compares with.
+        Parser which finds changed values overrides this method.
+
+        Returns:
+            dict: parser attribute name and copied attribute value pairs.
+        """
+
+        return {}
     
 
     @staticmethod
-    def get_changed_vfid_ports(ports_vfid_now_dct, ports_vfid_prev_dct, changed_keys, const_keys, time_now, time_prev):
+    def get_changed_vfid_ports(ports_vfid_now_dct, ports_vfid_prev_dct, changed_keys, const_keys, time_now, time_prev, 
+                               fingerprints_now=None, fingerprints_prev=None):
         """
         Method filters ports where values for changed_keys are differs in ports_vfid_now_dct and ports_vfid_prev_dct.
         If value is changed then current and previous values are added to the port dictionary. 
@@ -105,6 +199,10 @@ class BaseParser:
             const_keys {list}: keys which are added to the non-empty port dictionary with changed values.
             time_now (str): timestamp for the current sw_telemetry.
             time_prev (str): timestamp for the previous sw_telemetry.
+            fingerprints_now {dict}: slot_port and changed_keys values fingerprint pairs of the current sw_telemetry 
+                (see get_vfid_ports_fingerprints). Fingerprint of the port missing in the dictionary is created. Defaults to None.
+            fingerprints_prev {dict}: slot_port and changed_keys values fingerprint pairs of the previous sw_telemetry
+                (kept in the previous parser snapshot). Fingerprint of the port missing in the dictionary is created. Defaults to None.
         
         Returns:
             dict: ports of the certain switch vfid with changed values.
@@ -119,6 +217,10 @@ class BaseParser:
             
             # slot_port port values from the previous
             port_prev_dct = ports_vfid_prev_dct[slot_port]
+            # skip port if none of the changed_keys values is changed (most of the ports)
+            if (BaseParser._get_port_fingerprint(fingerprints_now, slot_port, port_now_dct, changed_keys) 
+                    == BaseParser._get_port_fingerprint(fingerprints_prev, slot_port, port_prev_dct, changed_keys)):
+                continue
             # find changed values for the changed_keys
             port_changed_dct = BaseParser.get_changed_values(port_now_dct, port_prev_dct, changed_keys)
             # add slot_port constant values to the non-empty port dictionary
@@ -153,6 +255,9 @@ class BaseParser:
             dict: ports of the certain switch vfid with changed values.
         """
 
+        # skip if none of the changed_keys values is changed
+        if BaseParser.get_fingerprint(now_dct, changed_keys) == BaseParser.get_fingerprint(prev_dct, changed_keys):
+            return {}
         # find changed values for the changed_keys
         chassis_changed_dct = BaseParser.get_changed_values(now_dct, prev_dct, changed_keys)
         # add constant values to the non-empty port dictionary
@@ -166,6 +271,57 @@ class BaseParser:
         return chassis_changed_dct
 
 
+    @staticmethod
+    def get_fingerprint(values_dct: dict, keys: List[str]) -> tuple:
+        """
+        Method creates fingerprint of the dictionary values of the keys to detect if any of the values is changed.
+        Fingerprints of two dictionaries are equal if each key is missing in both dictionaries 
+        or has equal values in both dictionaries (get_changed_values finds no changed values).
+        
+        Args:
+            values_dct {dict}: dictionary to create fingerprint of.
+            keys {list}: keys which values are checked for changes.
+        
+        Returns:
+            tuple: values of the keys (missing key marker if key is not in the dictionary).
+        """
+
+        # port record gets all values in a single call
+        if isinstance(values_dct, PortRecord):
+            return tuple(values_dct.get_values(keys, default=_MISSING_VALUE))
+        return tuple([values_dct.get(key, _MISSING_VALUE) for key in keys])
+
+
+    @staticmethod
+    def get_vfid_ports_fingerprints(ports_dct: Optional[Dict[int, Dict[str, dict]]], keys: List[str]) -> Dict[int, Dict[str, tuple]]:
+        """
+        Method creates fingerprint of the keys values of each port of each vf_id switch (see get_fingerprint).
+        Fingerprints are created once per cycle and kept in the parser snapshot so the next cycle parser 
+        compares port fingerprints with the previous cycle fingerprints without creating them again.
+        
+        Args:
+            ports_dct {dict}: vf_id and (slot_port and port parameters dictionary pairs) pairs.
+            keys {list}: keys which values are checked for changes.
+        
+        Returns:
+            dict: vf_id and (slot_port and fingerprint pairs) pairs.
+        """
+
+        if not ports_dct:
+            return {}
+        return {vf_id: {slot_port: BaseParser.get_fingerprint(port_dct, keys) for slot_port, port_dct in ports_vfid_dct.items()}
+                for vf_id, ports_vfid_dct in ports_dct.items()}
+
+
+    @staticmethod
+    def _get_port_fingerprint(fingerprints: Optional[Dict[str, tuple]], slot_port: str, port_dct: dict, keys: List[str]) -> tuple:
+        """Method returns created fingerprint of the port or creates it if it's missing in the fingerprints."""
+
+        if fingerprints and slot_port in fingerprints:
+            return fingerprints[slot_port]
+        return BaseParser.get_fingerprint(port_dct, keys)
+
+
     @staticmethod
     def get_changed_values(now_dct: dict, prev_dct: dict, keys: List[str], tag: str='-prev') -> dict:
         """
@@ -185,8 +341,7 @@ class BaseParser:
         changed_values_dct = {}
         
         for key in keys:
-            if not key in set(now_dct).intersection(prev_dct):
-            # if not key in prev_dct or not key in now_dct:
+            if not key in prev_dct or not key in now_dct:
                 continue                                                
             if prev_dct[key] != now_dct[key]:
                 changed_values_dct[key] = now_dct[key]
@@ -224,7 +379,7 @@ class BaseParser:
 
     def __repr__(self):
         return (f"{self.__class__.__name__} " 
-                f"ip_address: {self.sw_telemetry.sw_ipaddress}, "
+                f"ip_address: {self.sw_ipaddress}, "
                 f"date: {self.telemetry_date if self.telemetry_date else 'None'}, "
                 f"time: {self.telemetry_time if self.telemetry_time else 'None'}")
 
@@ -234,6 +389,11 @@ class BaseParser:
         return self._sw_telemetry
 
 
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
     @property
     def ch_wwn(self):
         return self._ch_wwn
@@ -1,3 +1,4 @@
+import copy
 from typing import Dict, List, Self, Union
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
@@ -7,6 +8,7 @@ from .fcport_params_parser import FCPortParametersParser
 from .fcport_stats_parser import FCPortStatisticsParser
 from .fru_parser import FRUParser
 from .maps_parser import MAPSParser
+from .parser_snapshot import ParserSnapshot
 from .request_status_parser import RequestStatusParser
 from .sfp_media_parser import SFPMediaParser
 from .switch_parser import SwitchParser
@@ -16,71 +18,308 @@ class BrocadeParser:
     """
     Class to create a parser. Parser is a set of dedicated parsers  
     for group if switch parameters.
+    Sub-parsers are built on demand. Sub-parser is built on the first access (with its prerequisite sub-parsers) 
+    and memoized so each sub-parser is built once per cycle. Use build_all method to build all sub-parsers.
+    Reusable sub-parser of the previous cycle (kept in the parser snapshot) is reused instead of the build 
+    if its telemetry containers are not changed (cached module responses or the same responses).
 
     Attributes:
         sw_telemetry: set of switch telemetry retrieved from the switch.
         nameserver_dct (Dict[str, str]): dictionary key as ip address and chassis name as value. 
-        brocade_parser_prev (BrocadeParser): previous parser.
+        brocade_parser_prev (ParserSnapshot): previous parser snapshot.
     """
     # nameserver_dct: Dict[str, str]
 
+    # telemetry containers each sub-parser is built from
+    # chassis and switch parsers require chassis and switch containers (other containers are optional)
+    PARSER_CONTAINERS = {
+        'ch_parser': ['chassis'],
+        'sw_parser': ['fc_switch'],
+        'fru_parser': ['fru_ps', 'fru_fan', 'fru_sensor'],
+        'maps_parser': ['maps_policy', 'maps_config', 'ssp_report', 'system_resources', 'dashboard_rule'],
+        'fcport_params_parser': ['fc_interface'],
+        'sfp_media_parser': ['media_rdp'],
+        'fcport_stats_parser': ['fc_statistics'],
+        }
+    
+    # sub-parsers which find changed values (previous state snapshot is taken)
+    SNAPSHOT_PARSERS = ['fru_parser', 'maps_parser', 'fcport_params_parser', 'sfp_media_parser', 'fcport_stats_parser']
+
+    # sub-parser classes in the build order
+    PARSER_CLASSES = {
+        'ch_parser': ChassisParser,
+        'sw_parser': SwitchParser,
+        'fru_parser': FRUParser,
+        'maps_parser': MAPSParser,
+        'fcport_params_parser': FCPortParametersParser,
+        'sfp_media_parser': SFPMediaParser,
+        'fcport_stats_parser': FCPortStatisticsParser,
+        }
+
+    # sub-parsers passed to the sub-parser constructor (sub-parser inputs)
+    PARSER_PREREQUISITES = {
+        'maps_parser': ['sw_parser'],
+        'fcport_params_parser': ['sw_parser'],
+        'sfp_media_parser': ['sw_parser', 'fcport_params_parser'],
+        'fcport_stats_parser': ['sw_parser', 'fcport_params_parser'],
+        }
+    
+    # sub-parsers reused from the previous cycle if the telemetry containers sub-parser reads are not changed
+    # sub-parsers with prerequisite sub-parsers (rebuilt each cycle) and chassis parser 
+    # (chassis response contains switch date and time) are built each cycle
+    REUSABLE_PARSERS = {
+        'fru_parser': ['fru_ps', 'fru_fan', 'fru_sensor'],
+        }
+
+    # sub-parsers which update the sub-parser values (port quantities and global port statuses of the switch parser)
+    # sub-parser is returned after its updaters are built
+    PARSER_UPDATERS = {
+        'sw_parser': ['fcport_params_parser', 'sfp_media_parser', 'fcport_stats_parser'],
+        }
+
     def __init__(self, 
                  sw_telemetry: SwitchTelemetryRequest, 
-                 brocade_parser_prev: Self = None) -> None:
+                 brocade_parser_prev: Union[ParserSnapshot, Self] = None) -> None:
         """  
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
             nameserver_dct (Dict[str, str]): dictionary key as ip address and chassis name as value. 
-            brocade_parser_prev (BrocadeParser): previous parser.
+            brocade_parser_prev (ParserSnapshot): previous parser snapshot (see get_snapshot method).
+                Previous BrocadeParser is accepted as well.
         """
 
         self._sw_telemetry: SwitchTelemetryRequest = sw_telemetry
+        self._sw_ipaddress = sw_telemetry.sw_ipaddress
         # self._nameserver: Dict[str, str] = nameserver_dct
-        self._brocade_parser_prev: 'BrocadeParser' = brocade_parser_prev
+        self._brocade_parser_prev: ParserSnapshot = brocade_parser_prev
         # delete brocade_parser_prev of the brocade_parser_prev attribute 
-        # to aviod infinit brocade_parser_prev increase
-        if self.brocade_parser_prev:
+        # to aviod infinit brocade_parser_prev increase (snapshot has no previous parser)
+        # previous parser sub-parsers are built before (sub-parsers need the previous parser of the previous parser)
+        if isinstance(self.brocade_parser_prev, BrocadeParser):
+            self._brocade_parser_prev.build_all()
             self._brocade_parser_prev._brocade_parser_prev = None
 
         # # http request status parser
         # self._request_status_parser = RequestStatusParser(self.sw_telemetry, self.nameserver)
         
-        # chassis parameters parser
-        self._ch_parser = ChassisParser(self.sw_telemetry)
-        # switch parameters parser
-        self._sw_parser = SwitchParser(self.sw_telemetry)
+        # built sub-parsers (sub-parser name and sub-parser or None if sub-parser is not built pairs)
+        # each sub-parser is built independently if its telemetry containers have valid (fresh or stale) data
+        # and its prerequisite sub-parsers are built. Otherwise sub-parser is None (toolbar is not filled)
+        self._sub_parsers = {}
+        # reusable sub-parsers of the current cycle for the next cycle parser (taken when telemetry is released)
+        self._reusable_parsers = {}
+
+
+    def get_sub_parser(self, parser_name: str):
+        """Method returns sub-parser (sub-parser is built on the first access). 
+        Sub-parsers updating the sub-parser values (BrocadeParser.PARSER_UPDATERS) are built first
+        so the returned sub-parser values are complete.
+
+        Args:
+            parser_name (str): sub-parser attribute name (for example fru_parser).
+
+        Returns:
+            sub-parser or None if sub-parser is not built.
+        """
+
+        for updater_name in BrocadeParser.PARSER_UPDATERS.get(parser_name, []):
+            self._build_sub_parser(updater_name)
+        return self._build_sub_parser(parser_name)
+
+
+    def build_all(self) -> None:
+        """Method builds all sub-parsers which are not built yet (in the PARSER_CLASSES order)."""
+
+        for parser_name in BrocadeParser.PARSER_CLASSES:
+            self._build_sub_parser(parser_name)
+
+
+    def _build_sub_parser(self, parser_name: str):
+        """Method builds sub-parser with its prerequisite sub-parsers (BrocadeParser.PARSER_PREREQUISITES) 
+        and memoizes it. Memoized sub-parser is returned if sub-parser is already built.
+
+        Args:
+            parser_name (str): sub-parser attribute name (for example fru_parser).
+
+        Returns:
+            sub-parser or None if sub-parser is not built.
+        """
+
+        if parser_name not in self._sub_parsers:
+            prerequisite_parsers = [self._build_sub_parser(prerequisite_name) 
+                                    for prerequisite_name in BrocadeParser.PARSER_PREREQUISITES.get(parser_name, [])]
+            self._sub_parsers[parser_name] = self._get_sub_parser(parser_name, BrocadeParser.PARSER_CLASSES[parser_name], 
+                                                                  *prerequisite_parsers)
+        return self._sub_parsers[parser_name]
+
+
+    def _get_sub_parser(self, parser_name: str, parser_class: type, *prerequisite_parsers):
+        """Method builds sub-parser from the telemetry containers independently of the other sub-parsers.
+        Sub-parser is built if at least one of its telemetry containers (BrocadeParser.PARSER_CONTAINERS) 
+        has valid data (fresh or last good response) and all prerequisite sub-parsers are built.
+        Sub-parser is not built (None) if it fails so the rest of the sub-parsers are not affected.
+        Sub-parser of the previous parser (if exists) is passed to the sub-parser to find changed values.
+
+        Args:
+            parser_name (str): sub-parser attribute name (for example fru_parser).
+            parser_class (type): sub-parser class (for example FRUParser).
+            *prerequisite_parsers: sub-parsers required to build the sub-parser (for example switch parser).
+
+        Returns:
+            sub-parser or None if sub-parser is not built.
+        """
+
+        if self.sw_telemetry is None:
+            print(parser_name, 'skipped, telemetry is released')
+            return
+
+        if any(prerequisite_parser is None for prerequisite_parser in prerequisite_parsers):
+            print(parser_name, 'skipped, prerequisite parser is not available')
+            return
         
-        if self._brocade_parser_prev is None:
-            # fan, ps, sensor parser
-            self._fru_parser = FRUParser(self.sw_telemetry)
-            # maps parser
-            self._maps_parser = MAPSParser(self.sw_telemetry, self.sw_parser)
-            # fc port parameters parser
-            self._fcport_params_parser = FCPortParametersParser(self.sw_telemetry, self.sw_parser)
-            # sfp media parser
-            self._sfp_media_parser = SFPMediaParser(self.sw_telemetry, self.sw_parser, self.fcport_params_parser)
-            # fc port statistics parser
-            self._fcport_stats_parser = FCPortStatisticsParser(self.sw_telemetry, self.sw_parser, self.fcport_params_parser)
+        if not any(self.sw_telemetry.is_valid_container(container_name) 
+                   for container_name in BrocadeParser.PARSER_CONTAINERS[parser_name]):
+            print(parser_name, 'skipped, no valid telemetry')
+            return
+        
+        # sub-parser of the previous cycle is reused if its telemetry containers are not changed
+        if parser_name in BrocadeParser.REUSABLE_PARSERS:
+            sub_parser = self._get_reused_sub_parser(parser_name)
+            if sub_parser is not None:
+                print(parser_name, 'reused, telemetry is not changed')
+                return sub_parser
+
+        # previous sub-parser snapshot is used by the sub-parsers which find changed values
+        if parser_name in BrocadeParser.SNAPSHOT_PARSERS:
+            parser_args = (*prerequisite_parsers, getattr(self.brocade_parser_prev, parser_name, None))
         else:
-            # fan, ps, sensor parser
-            self._fru_parser = FRUParser(self.sw_telemetry, self.brocade_parser_prev.fru_parser)
-            # maps parser
-            self._maps_parser = MAPSParser(self.sw_telemetry, self.sw_parser, 
-                                                  self.brocade_parser_prev.maps_parser)
-            # fc port parameters parser
-            self._fcport_params_parser = FCPortParametersParser(self.sw_telemetry, self.sw_parser, 
-                                                                self.brocade_parser_prev.fcport_params_parser)
-            # sfp media parser
-            self._sfp_media_parser = SFPMediaParser(self.sw_telemetry, self.sw_parser, 
-                                                    self.fcport_params_parser, self.brocade_parser_prev.sfp_media_parser)
-            # fc port statistics parser
-            self._fcport_stats_parser = FCPortStatisticsParser(self.sw_telemetry, self.sw_parser, 
-                                                               self.fcport_params_parser, self.brocade_parser_prev.fcport_stats_parser)            
+            parser_args = prerequisite_parsers
+        
+        try:
+            return parser_class(self.sw_telemetry, *parser_args)
+        except Exception as error:
+            print(parser_name, 'failed', repr(error))
+            return
 
     
+    def _get_reused_sub_parser(self, parser_name: str):
+        """Method returns the previous cycle sub-parser for the current telemetry 
+        if the sub-parser containers (BrocadeParser.REUSABLE_PARSERS) are the same as the previous cycle containers
+        of the same chassis. Previous sub-parser and its containers are kept in the previous parser snapshot.
+
+        Args:
+            parser_name (str): reusable sub-parser attribute name (for example fru_parser).
+
+        Returns:
+            sub-parser or None if sub-parser can't be reused.
+        """
+
+        # previous parser snapshot has no reusable sub-parsers if it's the first cycle 
+        # or previous BrocadeParser is passed instead of the snapshot
+        reusable_parsers_prev = getattr(self.brocade_parser_prev, 'reusable_parsers', None)
+        if not reusable_parsers_prev or parser_name not in reusable_parsers_prev:
+            return
+        sub_parser_prev, containers_prev = reusable_parsers_prev[parser_name]
+        chassis_response = self.sw_telemetry.chassis.get('Response')
+        if not chassis_response or sub_parser_prev.ch_wwn != chassis_response['chassis']['chassis-wwn']:
+            return
+        if self._get_reusable_containers(parser_name) != containers_prev:
+            return
+        return sub_parser_prev.get_reused(self.sw_telemetry)
+
+
+    def _get_reusable_containers(self, parser_name: str) -> tuple:
+        """Method returns status code and module response of each telemetry container the reusable sub-parser reads.
+        Responses are not copied (module responses are not changed after the containers are filled).
+
+        Args:
+            parser_name (str): reusable sub-parser attribute name (for example fru_parser).
+
+        Returns:
+            tuple: (status code, response) pair of the VF independent container and
+                vf_id and (status code, response) pairs of the VF dependent container in the containers order.
+        """
+
+        containers = []
+        for container_name in BrocadeParser.REUSABLE_PARSERS[parser_name]:
+            container = getattr(self.sw_telemetry, container_name)
+            # VF independent module container
+            if 'status-code' in container:
+                containers.append((container.get('status-code'), container.get('Response')))
+            # VF dependent module container
+            else:
+                containers.append({vf_id: (vf_container.get('status-code'), vf_container.get('Response')) 
+                                   for vf_id, vf_container in container.items()})
+        return tuple(containers)
+
+
+    def _get_reusable_parsers_state(self) -> Dict[str, tuple]:
+        """Method returns reusable sub-parsers of the current cycle for the next cycle parser.
+        Sub-parser is kept without the raw telemetry reference along with its telemetry containers.
+
+        Returns:
+            dict: sub-parser name and (sub-parser, containers) pairs of the built reusable sub-parsers.
+        """
+
+        # reusable sub-parsers of the released parser are taken before the telemetry is released
+        if self.sw_telemetry is None:
+            return self._reusable_parsers
+        reusable_parsers = {}
+        for parser_name in BrocadeParser.REUSABLE_PARSERS:
+            sub_parser = self._build_sub_parser(parser_name)
+            if sub_parser:
+                sub_parser_released = copy.copy(sub_parser)
+                sub_parser_released.release_telemetry()
+                reusable_parsers[parser_name] = (sub_parser_released, self._get_reusable_containers(parser_name))
+        return reusable_parsers
+
+
+    def release_telemetry(self) -> None:
+        """Method drops the raw switch telemetry reference of the parser and all sub-parsers 
+        after the sub-parsers values are extracted so only the parsed values are kept in memory.
+        Sub-parsers which are not built yet are built before the telemetry is released.
+        """
+
+        self.build_all()
+        # reusable sub-parsers containers are kept for the snapshot before the telemetry is released
+        self._reusable_parsers = self._get_reusable_parsers_state()
+        self._sw_telemetry = None
+        for sub_parser in self._sub_parsers.values():
+            if sub_parser:
+                sub_parser.release_telemetry()
+
+
+    def get_snapshot(self) -> ParserSnapshot:
+        """Method creates previous state snapshot of the parser for the next cycle parser.
+        Snapshot contains snapshots of the sub-parsers which find changed values 
+        (sub-parsers which are not accessed yet are built).
+        If sub-parser is not built in the current cycle its previous snapshot is kept.
+        Reusable sub-parsers with their telemetry containers are kept under 'reusable_parsers' key.
+
+        Returns:
+            ParserSnapshot: brocade parser snapshot.
+        """
+
+        state = {}
+        for parser_name in BrocadeParser.SNAPSHOT_PARSERS:
+            sub_parser = self._build_sub_parser(parser_name)
+            if sub_parser:
+                state[parser_name] = sub_parser.get_snapshot()
+            elif isinstance(self.brocade_parser_prev, ParserSnapshot):
+                state[parser_name] = getattr(self.brocade_parser_prev, parser_name, None)
+            else:
+                state[parser_name] = None
+        state['reusable_parsers'] = self._get_reusable_parsers_state()
+        return ParserSnapshot(self.__class__.__name__, 
+                              self.ch_parser.ch_wwn if self.ch_parser else None, 
+                              self.ch_parser.telemetry_date if self.ch_parser else None, 
+                              self.ch_parser.telemetry_time if self.ch_parser else None, 
+                              state)
+
+
     def __repr__(self):
         return (f"{self.__class__.__name__} " 
-                f"ip_address: {self.sw_telemetry.sw_ipaddress}, "
+                f"ip_address: {self.sw_ipaddress}, "
                 f"date: {self.telemetry_date if self.telemetry_date else 'None'}, "
                 f"time: {self.telemetry_time if self.telemetry_time else 'None'}")
 
@@ -90,6 +329,11 @@ class BrocadeParser:
         return self._sw_telemetry
     
     
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
     @property
     def nameserver(self):
         return self._nameserver
@@ -107,34 +351,34 @@ class BrocadeParser:
     
     @property
     def ch_parser(self):
-        return self._ch_parser
+        return self.get_sub_parser('ch_parser')
     
     
     @property
     def sw_parser(self):
-        return self._sw_parser
+        return self.get_sub_parser('sw_parser')
     
     
     @property
     def fru_parser(self):
-        return self._fru_parser
+        return self.get_sub_parser('fru_parser')
     
     
     @property
     def maps_parser(self):
-        return self._maps_parser
+        return self.get_sub_parser('maps_parser')
     
     
     @property
     def fcport_params_parser(self):
-        return self._fcport_params_parser
+        return self.get_sub_parser('fcport_params_parser')
     
     
     @property
     def sfp_media_parser(self):
-        return self._sfp_media_parser
+        return self.get_sub_parser('sfp_media_parser')
     
     
     @property
     def fcport_stats_parser(self):
-        return self._fcport_stats_parser
\ No newline at end of file
+        return self.get_sub_parser('fcport_stats_parser')
\ No newline at end of file
@@ -167,7 +167,7 @@ class ChassisParser(BaseParser):
             None. 
         """
         
-        if self.sw_telemetry.ts_timezone['Response']:
+        if self.sw_telemetry.ts_timezone.get('Response'):
             container = self.sw_telemetry.ts_timezone['Response']['time-zone']
             if container.get('name'):
                 # timezone as timezone
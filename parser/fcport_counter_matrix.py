@@ -0,0 +1,276 @@
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # counter matrix engine is optional, fc port statistics parser falls back to the per port counters loop
+    np = None
+
+
+# maximum value of the int64 matrix element
+INT64_MAX = 2**63 - 1
+
+
+class FCPortCounterMatrix:
+    """
+    Class to keep fc port counters of the vf_id switch as ports x counters integer array.
+    Matrix is built only if numpy is installed and all counter values are integers fitting int64
+    (None values are allowed and marked in the missing values mask).
+
+    Attributes:
+        counter_leafs (tuple): counter names (matrix columns).
+        slot_ports (list): port slot_port numbers (matrix rows).
+        port_index (dict): slot_port and matrix row pairs.
+        counters (np.ndarray): ports x counters int64 array (missing values are 0).
+        missing (np.ndarray): ports x counters bool array of the missing values. None if all values are present.
+    """
+
+
+    def __init__(self, counter_leafs: Tuple[str], slot_ports: List[str], counters, missing):
+        """
+        Args:
+            counter_leafs (tuple): counter names (matrix columns).
+            slot_ports (list): port slot_port numbers (matrix rows).
+            counters (np.ndarray): ports x counters int64 array.
+            missing (np.ndarray): ports x counters bool array of the missing values. None if all values are present.
+        """
+
+        self._counter_leafs = counter_leafs
+        self._slot_ports = slot_ports
+        self._port_index = {slot_port: row for row, slot_port in enumerate(slot_ports)}
+        self._counters = counters
+        self._missing = missing
+
+
+    @staticmethod
+    def is_available() -> bool:
+        """Method checks if numpy is installed."""
+
+        return np is not None
+
+
+    @classmethod
+    def from_ports(cls, ports_vfid_dct: Dict[str, dict], counter_leafs: Tuple[str]) -> Optional['FCPortCounterMatrix']:
+        """Method builds counters matrix from the port statistics dictionaries of the vf_id switch.
+
+        Args:
+            ports_vfid_dct (dict): slot_port and port statistics dictionary pairs.
+            counter_leafs (tuple): counter names (matrix columns).
+
+        Returns:
+            FCPortCounterMatrix: counters matrix. None if numpy is not installed or counter value is not integer.
+        """
+
+        if np is None or not ports_vfid_dct:
+            return
+
+        values = [[port_dct.get(counter) for counter in counter_leafs] for port_dct in ports_vfid_dct.values()]
+        missing = None
+        for row in values:
+            for value in row:
+                if value is None:
+                    missing = True
+                # bool is int subclass but it's not a counter value
+                elif type(value) is not int or not -INT64_MAX <= value <= INT64_MAX:
+                    return
+        if missing:
+            missing = np.array([[value is None for value in row] for row in values], dtype=bool)
+            values = [[0 if value is None else value for value in row] for row in values]
+        return cls(tuple(counter_leafs), list(ports_vfid_dct), np.array(values, dtype=np.int64), missing)
+
+
+    def get_rows(self, slot_ports: List[str]) -> Tuple['np.ndarray', Optional['np.ndarray']]:
+        """Method returns counters and missing values mask of the ports.
+
+        Args:
+            slot_ports (list): port slot_port numbers. All ports must be in the matrix.
+
+        Returns:
+            tuple: ports x counters counters array and missing values mask (None if all values are present).
+        """
+
+        rows = [self.port_index[slot_port] for slot_port in slot_ports]
+        if len(rows) == len(self.slot_ports) and rows == list(range(len(rows))):
+            return self.counters, self.missing
+        missing = self.missing[rows] if self.missing is not None else None
+        return self.counters[rows], missing
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ports: {len(self.slot_ports)}, counters: {len(self.counter_leafs)}"
+
+
+    @property
+    def counter_leafs(self):
+        return self._counter_leafs
+
+
+    @property
+    def slot_ports(self):
+        return self._slot_ports
+
+
+    @property
+    def port_index(self):
+        return self._port_index
+
+
+    @property
+    def counters(self):
+        return self._counters
+
+
+    @property
+    def missing(self):
+        return self._missing
+
+
+class FCPortCountersDelta:
+    """
+    Class to calculate counters delta of the vf_id switch ports present in the current and previous matrices
+    and to classify error counters deltas with array operations.
+
+    Classified columns are error counters (counter name, severity, thresholds) and
+    link reset and offline sequence deltas difference columns (leaf name, link reset counter, offline sequence counter,
+    severity, thresholds). Counter status ids: 1 - 'ok', 2 - 'unknown', 3 - 'warning', 4 - 'critical',
+    0 - counter is not classified (delta is missing).
+
+    Attributes:
+        slot_ports (list): port slot_port numbers (rows).
+        deltas (list): counters deltas of each port (lists of ints, None if delta is missing).
+        classified_names (list): classified columns names.
+        classified_values (list): classified columns values of each port (lists of ints, None if value is missing).
+        status_ids (np.ndarray): ports x classified columns status ids array.
+    """
+
+
+    def __init__(self, matrix_now: FCPortCounterMatrix, matrix_prev: FCPortCounterMatrix, slot_ports: List[str],
+                 error_columns: List[Tuple[str, str, dict]], lr_ols_columns: List[Tuple[str, str, str, str, dict]]):
+        """
+        Args:
+            matrix_now (FCPortCounterMatrix): counters matrix of the current statistics.
+            matrix_prev (FCPortCounterMatrix): counters matrix of the previous statistics.
+            slot_ports (list): port slot_port numbers present in both matrices.
+            error_columns (list): classified error counters (counter name, severity, thresholds).
+            lr_ols_columns (list): classified link reset and offline sequence deltas differences
+                (leaf name, link reset counter, offline sequence counter, severity, thresholds).
+        """
+
+        self._slot_ports = slot_ports
+        counter_leafs = matrix_now.counter_leafs
+        counters_now, missing_now = matrix_now.get_rows(slot_ports)
+        counters_prev, missing_prev = matrix_prev.get_rows(slot_ports)
+
+        # delta is missing if any of the counters is missing
+        if missing_now is None:
+            missing = missing_prev
+        elif missing_prev is None:
+            missing = missing_now
+        else:
+            missing = missing_now | missing_prev
+
+        delta = counters_now - counters_prev
+
+        # error counters columns
+        error_idx = [counter_leafs.index(counter) for counter, *_ in error_columns]
+        classified = [delta[:, error_idx]]
+        classified_missing = [missing[:, error_idx]] if missing is not None else []
+        # link reset and offline sequence deltas difference columns
+        for _, lr_counter, ols_counter, *_ in lr_ols_columns:
+            lr_idx, ols_idx = counter_leafs.index(lr_counter), counter_leafs.index(ols_counter)
+            classified.append(np.abs(delta[:, lr_idx] - delta[:, ols_idx])[:, None])
+            if missing is not None:
+                classified_missing.append((missing[:, lr_idx] | missing[:, ols_idx])[:, None])
+        classified = np.hstack(classified)
+
+        # per column thresholds
+        thresholds = [column[-1] for column in error_columns + lr_ols_columns]
+        warning = np.array([threshold['warning'] for threshold in thresholds], dtype=np.int64)
+        critical = np.array([threshold['critical'] for threshold in thresholds], dtype=np.int64)
+        # 'unknown' for negative delta, 'ok' below warning, 'warning' below critical and 'critical' otherwise
+        status_ids = np.select([classified < 0, classified < warning, classified < critical], [2, 1, 3], default=4)
+
+        self._deltas = delta.tolist()
+        self._classified_values = classified.tolist()
+        if missing is not None:
+            classified_missing = np.hstack(classified_missing)
+            status_ids[classified_missing] = 0
+            FCPortCountersDelta._set_missing_values(self._deltas, missing)
+            FCPortCountersDelta._set_missing_values(self._classified_values, classified_missing)
+
+        self._classified_names = [column[0] for column in error_columns + lr_ols_columns]
+        self._classified_severities = np.array([severity for _, severity, _ in error_columns] + 
+                                               [severity for *_, severity, _ in lr_ols_columns])
+        self._status_ids = status_ids
+
+
+    @staticmethod
+    def _set_missing_values(values: List[list], missing: 'np.ndarray') -> None:
+        """Method replaces missing values of the rows lists with None."""
+
+        for row, column in zip(*np.nonzero(missing)):
+            values[row][column] = None
+
+
+    def get_port_status_ids(self, severity: str) -> List[int]:
+        """Method finds the worst (maximum) status id of the severity classified columns of each port.
+
+        Args:
+            severity (str): error severity ('high','medium', 'low').
+
+        Returns:
+            list: port status id of each port (0 if there is no classified column of the severity).
+        """
+
+        severity_status_ids = self.status_ids[:, self._classified_severities == severity]
+        if not severity_status_ids.shape[1]:
+            return [0] * len(self.slot_ports)
+        return severity_status_ids.max(axis=1).tolist()
+
+
+    def get_categories(self, severity: str, status_id: int) -> Dict[int, List[int]]:
+        """Method finds classified columns of the severity with the status id for each port.
+
+        Args:
+            severity (str): error severity ('high','medium', 'low').
+            status_id (int): counter status id.
+
+        Returns:
+            dict: row and classified columns indexes (in the columns order) pairs. Rows without columns are not included.
+        """
+
+        severity_mask = self._classified_severities == severity
+        rows, columns = np.nonzero((self.status_ids == status_id) & severity_mask)
+        categories = {}
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            categories.setdefault(row, []).append(column)
+        return categories
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ports: {len(self.slot_ports)}"
+
+
+    @property
+    def slot_ports(self):
+        return self._slot_ports
+
+
+    @property
+    def deltas(self):
+        return self._deltas
+
+
+    @property
+    def classified_names(self):
+        return self._classified_names
+
+
+    @property
+    def classified_values(self):
+        return self._classified_values
+
+
+    @property
+    def status_ids(self):
+        return self._status_ids
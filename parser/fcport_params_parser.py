@@ -2,6 +2,9 @@ import re
 from typing import Dict, List, Optional, Self, Tuple, Union
 
 from .base_parser import BaseParser
+from .parser_snapshot import ParserSnapshot
+from .port_record import PortRecord
+from .port_registry import PortRegistry
 from .switch_parser import SwitchParser
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
@@ -17,6 +20,8 @@ class FCPortParametersParser(BaseParser):
         sw_parser: switch parameters retrieved from the sw_telemetry.
         port_owner: dictonary with port name as key and switchname to which port belongs to as value.
         fcport_params: fc port parameters dictionary ({vf_id:{slot_port_id:{param1: value1, param2: value2}}}).
+            Port parameters are FCPortParamsRecord records.
+        port_registry: registry of the fc ports (port handles shared by the fc port statistics and sfp media parsers).
         fcport_params_parser: fc port parameters class instance retrieved from the sw_telemetry (current class instance to find delta).
     """
 
@@ -76,13 +81,17 @@ class FCPortParametersParser(BaseParser):
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
             sw_parser (BrocadeSwitchParser): switch parameters retrieved from the sw_telemetry.
-            fcport_params_prev (FCPortParametersParser): 
+            fcport_params_prev (FCPortParametersParser, ParserSnapshot): previous fc port parameters (previous parser snapshot).
         """
         
         super().__init__(sw_telemetry)
         self._sw_parser: SwitchParser = sw_parser
         self._port_owner = self._get_ports_owner()
+        self._port_registry = PortRegistry()
         self._fcport_params = self. _get_port_params_values()
+        # changed keys values fingerprint of each port (created once per cycle, kept in the snapshot)
+        self._fcport_params_fingerprints = FCPortParametersParser.get_vfid_ports_fingerprints(
+            self.fcport_params, FCPortParametersParser.FC_PORT_PARAMS_CHANGED)
         if self.fcport_params:
             self._fcport_params_changed = self._get_changed_fcport_params(fcport_params_prev)
         else:
@@ -212,8 +221,12 @@ class FCPortParametersParser(BaseParser):
                     # dictionary with unchanged values from fc_interface_container
                     fcport_params_current_default_dct = {leaf: fc_interface_container.get(leaf) for leaf in FCPortParametersParser.FC_INTERFACE_LEAFS}
                     fcport_params_current_dct.update(fcport_params_current_default_dct)
-                    # add current port status dictionary to the summary port status dictionary with vf_id and slot_port as consecutive keys
-                    fcport_params_dct[vf_id][fc_interface_container['name']] = fcport_params_current_dct
+                    # register port in the port registry to get port handle shared by all parsers
+                    handle = self.port_registry.register(vf_id, slot_port_number)
+                    fcport_params_current_record = FCPortParamsRecord(fcport_params_current_dct, handle=handle)
+                    self.port_registry.set_port_params(handle, fcport_params_current_record)
+                    # add current port status record to the summary port status dictionary with vf_id and slot_port as consecutive keys
+                    fcport_params_dct[vf_id][fc_interface_container['name']] = fcport_params_current_record
         return fcport_params_dct
 
 
@@ -253,11 +266,13 @@ class FCPortParametersParser(BaseParser):
         # other is not exist (for examle 1st iteration)
         # other is not BrocadeFCPortParametersParser type
         # other's fcport_params atrribute is empty
-        if other is None or str(type(self)) != str(type(other)) or not other.fcport_params:
+        if other is None or not self.same_parser_type(other) or not other.fcport_params:
             return None
         
         # check if other is for the same switch
         elif self.same_chassis(other):
+            # port fingerprints of the previous cycle (missing in the previous parser of the earlier version)
+            fingerprints_prev = getattr(other, 'fcport_params_fingerprints', None) or {}
             for vf_id, fcport_params_vfid_now_dct in self.fcport_params.items():
 
                 fcport_params_changed_dct[vf_id] = {}
@@ -275,7 +290,9 @@ class FCPortParametersParser(BaseParser):
                 fcport_params_changed_dct[vf_id] = FCPortParametersParser.get_changed_vfid_ports(fcport_params_vfid_now_dct, fcport_params_vfid_prev_dct, 
                                                                                         changed_keys=FCPortParametersParser.FC_PORT_PARAMS_CHANGED, 
                                                                                         const_keys=FCPortParametersParser.FC_PORT_PATH, 
-                                                                                        time_now=time_now, time_prev=time_prev)
+                                                                                        time_now=time_now, time_prev=time_prev, 
+                                                                                        fingerprints_now=self.fcport_params_fingerprints.get(vf_id), 
+                                                                                        fingerprints_prev=fingerprints_prev.get(vf_id))
         return fcport_params_changed_dct
 
 
@@ -516,6 +533,19 @@ class FCPortParametersParser(BaseParser):
         # unknown status
         return 2
 
+
+    def _get_snapshot_state(self) -> Dict[str, Optional[dict]]:
+        """Method returns fc port parameters which are checked for changed values.
+
+        Returns:
+            dict: fc port parameters attribute name and copied port parameters pairs.
+        """
+
+        # port fingerprints are not changed after the parser is built
+        return {'fcport_params': ParserSnapshot.get_vfid_ports_snapshot(self.fcport_params, 
+                                                                        FCPortParametersParser.FC_PORT_PARAMS_CHANGED), 
+                'fcport_params_fingerprints': self.fcport_params_fingerprints}
+
     
     @property
     def sw_parser(self):
@@ -530,7 +560,23 @@ class FCPortParametersParser(BaseParser):
     @property
     def fcport_params(self):
         return self._fcport_params
+
+
+    @property
+    def port_registry(self):
+        return self._port_registry
     
     @property
     def fcport_params_changed(self):
-        return self._fcport_params_changed
\ No newline at end of file
+        return self._fcport_params_changed
+
+
+    @property
+    def fcport_params_fingerprints(self):
+        return self._fcport_params_fingerprints
+
+
+class FCPortParamsRecord(PortRecord):
+    """Class of the fc port parameters record. Fc port statistics and sfp media records read port identity parameters from it."""
+
+    __slots__ = ()
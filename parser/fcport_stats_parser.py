@@ -1,9 +1,13 @@
 import math
 import numbers
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Self, Tuple, Union
 
 from .base_parser import BaseParser
+from .fcport_counter_matrix import FCPortCounterMatrix, FCPortCountersDelta
+from .parser_snapshot import ParserSnapshot
+from .port_record import PortRecord
 from .switch_parser import SwitchParser
 from .fcport_params_parser import FCPortParametersParser
 from quantiphy import Quantity
@@ -20,7 +24,9 @@ class FCPortStatisticsParser(BaseParser):
         fcport_params_parser: fc port parameters class instance retrieved from the sw_telemetry.
         fcport_stats_parser: fc port stats class instance retrieved from the sw_telemetry (current class instance to find delta).
         fcport_stats: fc port statistics dictionary ({vf_id:{slot_port_id:{counter1: value1, counter2: value2}}}).
+            Port statistics are FCPortStatsRecord records.
         fcport_stats_growth: fc port statistics dictionary for ports with increased counters except FC_STATISTICS_STAT_LEAFS
+        fcport_counters: fc port counters matrices ({vf_id: FCPortCounterMatrix}). Empty if counter matrix engine is not used.
     """
     
 
@@ -66,6 +72,8 @@ class FCPortStatisticsParser(BaseParser):
     
     DELTA_TAG = '-delta'
     HRF_TAG = '-hrf'
+    # number of the memoized counter values rendered in hrf format
+    HRF_CACHE_SIZE = 8192
     
     LROUT_SUBTRACT_OLSIN_LEAF = 'lrout' + DELTA_TAG + '_subtract_olsin' + DELTA_TAG
     LRIN_SUBTRACT_OLSOUT_LEAF = 'lrin' + DELTA_TAG + '_subtract_olsout' + DELTA_TAG
@@ -80,6 +88,10 @@ class FCPortStatisticsParser(BaseParser):
     
     PORT_ERROR_STATUS_TAG = '-severity-errors_port-status'
 
+    # counters delta is calculated and error counters are classified with ports x counters matrices 
+    # if numpy is installed (per port counters loop otherwise)
+    COUNTER_MATRIX_ENGINE = True
+
     ERROR_SEVERITY_TYPES = ['high','medium', 'low']
 
     PORT_ERROR_STATUS_KEYS = [severity + '-severity-errors_port-status' for severity in ERROR_SEVERITY_TYPES]
@@ -108,18 +120,24 @@ class FCPortStatisticsParser(BaseParser):
             sw_telemetry {BrocadeSwitchTelemetry}: set of switch telemetry retrieved from the switch.
             sw_parser (BrocadeSwitchParser): switch parameters retrieved from the sw_telemetry.
             fcport_params_parser (BrocadeSwitchParser): fc port parameters class instance retrieved from the sw_telemetry.
-            fcport_stats_prev (FCPortStatisticsParser): previous fc port statistics retrieved from the switch.
+            fcport_stats_prev (FCPortStatisticsParser, ParserSnapshot): previous fc port statistics retrieved from the switch
+                (previous FCPortStatisticsParser snapshot).
         """
         
         super().__init__(sw_telemetry)
         self._sw_parser: SwitchParser = sw_parser
         self._fcport_params_parser: FCPortParametersParser = fcport_params_parser
         self._fcport_stats = self._get_port_stats_values()
+        self._fcport_counters = self._get_port_counters()
         if self.fcport_stats:
             self._fcport_stats_growth = self._calculate_counters_growth(fcport_stats_prev)
+            # changed keys values (statuses) fingerprint of each port (created once per cycle, kept in the snapshot)
+            self._fcport_stats_fingerprints = FCPortStatisticsParser.get_vfid_ports_fingerprints(
+                self.fcport_stats, FCPortStatisticsParser.FC_PORT_STATS_CHANGED)
             self._fcport_stats_changed = self._get_changed_fcport_stats(fcport_stats_prev)
         else:
             self._fcport_stats_growth = {}
+            self._fcport_stats_fingerprints = {}
             self._fcport_stats_changed = {}
     
 
@@ -145,23 +163,20 @@ class FCPortStatisticsParser(BaseParser):
                 
                 for fc_statistics_container in fc_statistics_container_lst:
                     # get port statistics from the container
-                    fcport_stats_current_dct = {leaf: fc_statistics_container.get(leaf) for leaf in FCPortStatisticsParser.FC_STATISTICS_LEAFS}
-                    # convert counters to the human readable format
-                    fcport_stats_current_hrf_dct = {leaf + FCPortStatisticsParser.HRF_TAG: FCPortStatisticsParser.int_to_hrf(fc_statistics_container.get(leaf)) 
-                                                    for leaf in FCPortStatisticsParser.FC_STATISTICS_COUNTER_LEAFS}
-                    # add hrf counters to the fc port statistics dictionary
-                    fcport_stats_current_dct.update(fcport_stats_current_hrf_dct)
+                    # counters in the human readable format are rendered when they are read for the first time
                     # slot_port_number in the format 'slot_number/port_number' (e.g. '0/1')
                     slot_port_number = fc_statistics_container['name']
+                    # port parameters are read from the fc port parameters record of the registered port (not copied)
+                    handle = self.fcport_params_parser.port_registry.get_handle(vf_id, slot_port_number)
+                    fcport_stats_current_dct = FCPortStatsRecord(
+                        {leaf: fc_statistics_container.get(leaf) for leaf in FCPortStatisticsParser.FC_STATISTICS_LEAFS}, 
+                        port_params=self.fcport_params_parser.port_registry.get_port_params(handle), handle=handle)
                     # split slot and port number
                     slot_number, port_number = slot_port_number.split('/')
                     fcport_stats_current_dct['slot-number'] = int(slot_number)
                     fcport_stats_current_dct['port-number'] = int(port_number)
                     # convert seconds to the human readable format datetime
                     fcport_stats_current_dct['time-generated-hrf'] = FCPortStatisticsParser.epoch_to_datetime(fc_statistics_container['time-generated'])
-                    # add port parameters to the fc port statistics dictionary
-                    fcport_params_dct = self._get_port_params(vf_id, slot_port_number)
-                    fcport_stats_current_dct.update(fcport_params_dct)
                     # convert io rates to bits and check if throuput threshold is exceded
                     self._add_io_troughput_status(fcport_stats_current_dct)
                     # add current fc port statistics dictionary to the summary port statistics dictionary with vf_id and slot_port as consecutive keys
@@ -169,21 +184,37 @@ class FCPortStatisticsParser(BaseParser):
         return fcport_stats_dct
 
 
-    def _get_port_params(self, vf_id: int, slot_port_number: str) -> Dict[str, Optional[str]]:
+    def _get_port_counters(self) -> Dict[int, FCPortCounterMatrix]:
+        """
+        Method builds fc port counters matrix of each vf_id switch if counter matrix engine is used.
+        
+        Returns:
+            dict: vf_id and counters matrix pairs. Switches with non integer counters are not included.
+        """
+
+        if not FCPortStatisticsParser.COUNTER_MATRIX_ENGINE or not FCPortCounterMatrix.is_available():
+            return {}
+        
+        fcport_counters_dct = {}
+        for vf_id, fcport_stats_vfid_dct in self.fcport_stats.items():
+            fcport_counters = FCPortCounterMatrix.from_ports(fcport_stats_vfid_dct, FCPortStatisticsParser.FC_STATISTICS_COUNTER_LEAFS)
+            if fcport_counters is not None:
+                fcport_counters_dct[vf_id] = fcport_counters
+        return fcport_counters_dct
+
+
+    def _get_port_params(self, handle: Optional[int]) -> Dict[str, Optional[str]]:
         """
         Method to get port parameters.
         
         Args:
-            vf_id {int}: switch vf_id.
-            slot_port_number {str}: slot and port number in the format'slot/port' (e.g. '0/1').
+            handle {int}: port handle in the port registry. None if port is not registered.
         
         Returns:
-            Dict[str, Optional[str]]: Dictionary with FC_PORT_PARAMS values.
+            Dict[str, Optional[str]]: Dictionary with FC_PORT_ADD_PARAMS values (shared by the port registry, must not be changed).
         """
         
-        fc_port_params_current = self.fcport_params_parser.fcport_params[vf_id][slot_port_number]
-        fcport_params = {param: fc_port_params_current.get(param) for param in FCPortStatisticsParser.FC_PORT_ADD_PARAMS}
-        return fcport_params
+        return self.fcport_params_parser.port_registry.get_port_add_params(handle)
 
 
     def _add_io_troughput_status(self, fcport_stats_current_dct) -> None:
@@ -237,7 +268,7 @@ class FCPortStatisticsParser(BaseParser):
         # other is not BrocadeFCPortStatisticsParser type
         # other's fcport_stats atrribute is empty
         # add empty delta keys to the each port stats dictionary
-        if other is None or str(type(self)) != str(type(other)) or not other.fcport_stats:
+        if other is None or not self.same_parser_type(other) or not other.fcport_stats:
             for vf_id, fcport_stats_vfid_now_dct in self.fcport_stats.items():
                 for fc_statistics_port_now_dct in fcport_stats_vfid_now_dct.values():
                     force_ok_status = True if other is None else False
@@ -254,6 +285,10 @@ class FCPortStatisticsParser(BaseParser):
                     for fc_statistics_port_now_dct in fcport_stats_vfid_now_dct.values():
                         self._add_empty_fields(vf_id, fc_statistics_port_now_dct)
                     continue
+
+                # find counters delta and port error statuses with the counter matrices
+                if self._calculate_vfid_counters_growth_matrix(vf_id, other, fcport_stats_growth_dct):
+                    continue
                     
                 fcport_stats_vfid_prev_dct = other.fcport_stats[vf_id]
                 for slot_port, fc_statistics_port_now_dct in fcport_stats_vfid_now_dct.items():
@@ -285,6 +320,129 @@ class FCPortStatisticsParser(BaseParser):
         return fcport_stats_growth_dct    
 
 
+    def _calculate_vfid_counters_growth_matrix(self, vf_id: int, other, fcport_stats_growth_dct: dict) -> bool:
+        """
+        Method calculates counters delta, port error statuses and error categories of the vf_id switch ports 
+        with the counter matrices (same values as _get_port_counters_delta and _detect_lr_ols_inconsistency 
+        calculated for each port) and adds them to the current port statistics dictionaries.
+        Ports which are not in the other get empty delta keys.
+        
+        Args:
+            vf_id (int): virtual switch ID.
+            other {FCPortStatisticsParser, ParserSnapshot}: fc port statistics retrieved from the previous sw_telemetry.
+            fcport_stats_growth_dct {dict}: dictionary with ports for which error counters have increased.
+        
+        Returns:
+            bool: True if counters growth is calculated. False if counter matrix of the current or previous statistics is not available.
+        """
+
+        fcport_counters_now = self.fcport_counters.get(vf_id)
+        if fcport_counters_now is None:
+            return False
+
+        fcport_stats_vfid_now_dct = self.fcport_stats[vf_id]
+        fcport_stats_vfid_prev_dct = other.fcport_stats[vf_id]
+        # previous parser counters matrix (built from the previous statistics if previous parser has no matrix)
+        fcport_counters_prev = (getattr(other, 'fcport_counters', None) or {}).get(vf_id)
+        if fcport_counters_prev is None or fcport_counters_prev.counter_leafs != fcport_counters_now.counter_leafs:
+            fcport_counters_prev = FCPortCounterMatrix.from_ports(fcport_stats_vfid_prev_dct, fcport_counters_now.counter_leafs)
+            if fcport_counters_prev is None:
+                return False
+
+        # ports present in both statistics
+        slot_ports = [slot_port for slot_port in fcport_stats_vfid_now_dct if slot_port in fcport_stats_vfid_prev_dct]
+        if slot_ports:
+            counters_delta = FCPortCountersDelta(fcport_counters_now, fcport_counters_prev, slot_ports, 
+                                                 *FCPortStatisticsParser._get_classified_columns())
+            port_status_ids = {severity: counters_delta.get_port_status_ids(severity) 
+                               for severity in FCPortStatisticsParser.ERROR_SEVERITY_TYPES}
+            # error category key and (port row and classified columns pairs) pairs
+            categories = {severity + '-severity_' + FCPortStatisticsParser.STATUS_ID[status_id].lower() + '-status_errors': 
+                              counters_delta.get_categories(severity, status_id)
+                          for severity in FCPortStatisticsParser.ERROR_SEVERITY_TYPES for status_id in [4, 3, 1]}
+            lr_ols_columns = [counters_delta.classified_names.index(leaf) for leaf in FCPortStatisticsParser.LR_SUBTRACT_OLS_LEAFS]
+        port_rows = {slot_port: row for row, slot_port in enumerate(slot_ports)}
+        delta_keys = [counter + FCPortStatisticsParser.DELTA_TAG for counter in fcport_counters_now.counter_leafs]
+
+        for slot_port, fc_statistics_port_now_dct in fcport_stats_vfid_now_dct.items():
+            # if there is no port number in other add empty delta keys to this port stats dictionary
+            if slot_port not in port_rows:
+                self._add_empty_fields(vf_id, fc_statistics_port_now_dct)
+                continue
+            
+            row = port_rows[slot_port]
+            port_deltas = counters_delta.deltas[row]
+            classified_values = counters_delta.classified_values[row]
+            fc_statistics_port_now_dct.update(zip(delta_keys, port_deltas))
+            for column in lr_ols_columns:
+                fc_statistics_port_now_dct[counters_delta.classified_names[column]] = classified_values[column]
+            # port error status (port without classified counters of the severity gets 'unknown' status below)
+            for severity, status_ids in port_status_ids.items():
+                if status_ids[row]:
+                    counter_status_key = severity + FCPortStatisticsParser.PORT_ERROR_STATUS_TAG
+                    fc_statistics_port_now_dct[counter_status_key] = FCPortStatisticsParser.STATUS_ID[status_ids[row]]
+                    fc_statistics_port_now_dct[counter_status_key + '-id'] = status_ids[row]
+            # counter names and deltas of each error category
+            for counter_category, category_rows in categories.items():
+                if row in category_rows:
+                    fc_statistics_port_now_dct[counter_category] = [counters_delta.classified_names[column] 
+                                                                    for column in category_rows[row]]
+                    fc_statistics_port_now_dct[counter_category + FCPortStatisticsParser.DELTA_TAG] = {
+                        counters_delta.classified_names[column]: classified_values[column] for column in category_rows[row]}
+            
+            # add io troughput MB, percentage, status, status id based on io octets values
+            self._add_io_octets_throughput_values(vf_id, fc_statistics_port_now_dct)
+            # add timestamp from the other to the current port statistics to see time period for which delta in counted for
+            fc_statistics_port_now_dct['time-generated-prev-hrf'] = fcport_stats_vfid_prev_dct[slot_port]['time-generated-hrf']
+            # add 'unknown' port error status for high, medium and low severity counters if it doesn't exist 
+            self._add_unknown_port_error_status_fields(vf_id, fc_statistics_port_now_dct)
+            # add None for list of errors for all severities and critical, warning and ok statuses if doesn't exist 
+            self._add_empty_error_category_fields(fc_statistics_port_now_dct)
+            # increased counters of the port
+            fcport_stats_growth_port_dct = {counter_delta: delta for counter_delta, delta in zip(delta_keys, port_deltas) if delta and delta > 0}
+            for column in lr_ols_columns:
+                FCPortStatisticsParser.save_positive_value(fcport_stats_growth_port_dct, 
+                                                           counters_delta.classified_names[column], classified_values[column])
+            self._update_fcport_stats_growth(fcport_stats_growth_dct, fcport_stats_growth_port_dct, fc_statistics_port_now_dct, vf_id, slot_port)
+
+        # set global switch port error status id (worst port error status)
+        for severity, status_ids in (port_status_ids.items() if slot_ports else []):
+            if max(status_ids):
+                self.sw_parser.update_param_status(vf_id, param_status_name=severity + FCPortStatisticsParser.PORT_ERROR_STATUS_TAG + '-id', 
+                                                   status_id=max(status_ids))
+        return True
+
+
+    @staticmethod
+    def _get_classified_columns() -> Tuple[List[Tuple[str, str, dict]], List[Tuple[str, str, str, str, dict]]]:
+        """
+        Method returns error counters classified by the counter matrix engine in the FC_STATISTICS_COUNTER_LEAFS order 
+        (counter name, severity, thresholds) and link reset and offline sequence deltas differences 
+        (leaf name, link reset counter, offline sequence counter, severity, thresholds).
+
+        Returns:
+            tuple: error counters columns and link reset and offline sequence columns.
+        """
+
+        thresholds = FCPortStatisticsParser.COUNTER_THRESHOLDS
+        error_columns = []
+        for counter in FCPortStatisticsParser.FC_STATISTICS_COUNTER_LEAFS:
+            if counter in FCPortStatisticsParser.HIGH_SEVERITY_ERROR_LEAFS:
+                error_columns.append((counter, 'high', thresholds['high_severity']))
+            elif counter in FCPortStatisticsParser.MEDIUM_SEVERITY_ERROR_LEAFS:
+                error_columns.append((counter, 'medium', thresholds['medium_severity']))
+            elif counter in FCPortStatisticsParser.LOW_SEVERITY_ERROR_LEAFS:
+                error_columns.append((counter, 'low', thresholds['low_severity']))
+            elif counter in FCPortStatisticsParser.LINK_ERROR_LEAFS:
+                error_columns.append((counter, 'high', thresholds['link_error']))
+        # lr_out is checked before lr_in
+        lr_ols_columns = [(FCPortStatisticsParser.LROUT_SUBTRACT_OLSIN_LEAF, 'out-link-resets', 'in-offline-sequences', 
+                           'medium', thresholds['lr_substract_ols']),
+                          (FCPortStatisticsParser.LRIN_SUBTRACT_OLSOUT_LEAF, 'in-link-resets', 'out-offline-sequences', 
+                           'medium', thresholds['lr_substract_ols'])]
+        return error_columns, lr_ols_columns
+
+
     def _add_io_octets_throughput_values(self, vf_id: int, fc_statistics_port_now_dct: dict, force_ok_status: bool = False) -> None:
         """Method adds io troughput MB, percentage, status, status id based on io octets values (based on io octets values).
         USED INSTEAD OF _add_io_troughput_status.
@@ -301,7 +459,8 @@ class FCPortStatisticsParser(BaseParser):
             octet_delta_key = octet_key + FCPortStatisticsParser.DELTA_TAG
             time_delta_key = 'time-generated' + FCPortStatisticsParser.DELTA_TAG
 
-            if fc_statistics_port_now_dct.get(octet_delta_key) is None:
+            # time delta is zero if statistics were not retrieved again (cached module response)
+            if fc_statistics_port_now_dct.get(octet_delta_key) is None or not fc_statistics_port_now_dct.get(time_delta_key):
                 throughput_mbytes = None
             else:
                 throughput_mbytes = round(
@@ -569,7 +728,7 @@ class FCPortStatisticsParser(BaseParser):
             fcport_stats_growth_port_dct['time-generated-hrf'] = fc_statistics_port_now_dct['time-generated-hrf']
             fcport_stats_growth_port_dct['time-generated-prev-hrf'] = fc_statistics_port_now_dct['time-generated-prev-hrf']
             # add port parameters to the fc port statistics dictionary
-            fcport_params_dct = self._get_port_params(vf_id, slot_port)
+            fcport_params_dct = self._get_port_params(fc_statistics_port_now_dct.handle)
             fcport_stats_growth_port_dct.update(fcport_params_dct)
             # add slot port information
             fcport_stats_growth_port_dct['slot-number'] = fc_statistics_port_now_dct['slot-number']
@@ -696,11 +855,13 @@ class FCPortStatisticsParser(BaseParser):
         # other is not exist (for examle 1st iteration)
         # other is not BrocadeFCPortParametersParser type
         # other's fcport_params atrribute is empty
-        if other is None or str(type(self)) != str(type(other)) or not other.fcport_stats:
+        if other is None or not self.same_parser_type(other) or not other.fcport_stats:
             return None
         
         # check if other is for the same switch
         elif self.same_chassis(other):
+            # port fingerprints of the previous cycle (missing in the previous parser of the earlier version)
+            fingerprints_prev = getattr(other, 'fcport_stats_fingerprints', None) or {}
             for vf_id, fcport_stats_vfid_now_dct in self.fcport_stats.items():
 
                 fcport_stats_changed_dct[vf_id] = {}
@@ -718,7 +879,9 @@ class FCPortStatisticsParser(BaseParser):
                 fcport_stats_changed_dct[vf_id] = FCPortStatisticsParser.get_changed_vfid_ports(fcport_stats_vfid_now_dct, fcport_params_vfid_prev_dct, 
                                                                                         changed_keys=FCPortStatisticsParser.FC_PORT_STATS_CHANGED, 
                                                                                         const_keys=FCPortStatisticsParser.FC_PORT_PATH, 
-                                                                                        time_now=time_now, time_prev=time_prev)
+                                                                                        time_now=time_now, time_prev=time_prev, 
+                                                                                        fingerprints_now=self.fcport_stats_fingerprints.get(vf_id), 
+                                                                                        fingerprints_prev=fingerprints_prev.get(vf_id))
         return fcport_stats_changed_dct
 
 
@@ -828,9 +991,11 @@ class FCPortStatisticsParser(BaseParser):
 
 
     @staticmethod
+    @lru_cache(maxsize=HRF_CACHE_SIZE, typed=True)
     def int_to_hrf(counter: int, precision: int = 1) -> str:
         """
         Method converts integer counters to the hrf format with k (10^3), m (10^6) and g (10^9 )endings.
+        Rendered values are memoized (HRF_CACHE_SIZE least recently used counter values).
         
         Returns:
             str: Integer counter in hrf format (3_600_000 -> 3,6m).
@@ -893,6 +1058,22 @@ class FCPortStatisticsParser(BaseParser):
         """
 
         return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+
+    def _get_snapshot_state(self) -> Dict[str, Optional[dict]]:
+        """Method returns fc port counters (to calculate counters growth), 
+        statistics timestamp and statuses which are checked for changed values.
+
+        Returns:
+            dict: fc port statistics attribute name and copied port statistics pairs.
+        """
+
+        snapshot_keys = FCPortStatisticsParser.FC_STATISTICS_COUNTER_LEAFS + ['time-generated-hrf'] + \
+            FCPortStatisticsParser.FC_PORT_STATS_CHANGED
+        # counter matrices and port fingerprints are not changed after the parser is built
+        return {'fcport_stats': ParserSnapshot.get_vfid_ports_snapshot(self.fcport_stats, snapshot_keys), 
+                'fcport_counters': dict(self.fcport_counters), 
+                'fcport_stats_fingerprints': self.fcport_stats_fingerprints}
     
 
     @property
@@ -910,6 +1091,11 @@ class FCPortStatisticsParser(BaseParser):
         return self._fcport_stats
     
 
+    @property
+    def fcport_counters(self):
+        return self._fcport_counters
+    
+
     @property
     def fcport_stats_growth(self):
         return self._fcport_stats_growth
@@ -917,4 +1103,38 @@ class FCPortStatisticsParser(BaseParser):
 
     @property
     def fcport_stats_changed(self):
-        return self._fcport_stats_changed
\ No newline at end of file
+        return self._fcport_stats_changed
+
+
+    @property
+    def fcport_stats_fingerprints(self):
+        return self._fcport_stats_fingerprints
+
+
+class FCPortStatsRecord(PortRecord):
+    """
+    Class of the fc port statistics record with the lazy counters in the human readable format.
+    Counter '-hrf' key (for example 'in-frames-hrf') is not stored in the record, 
+    its value is rendered when it's read (int_to_hrf is called for the counter value only if toolbar reads it).
+    Rendered values are memoized by int_to_hrf so record is not changed on read 
+    and lazy keys are not in the record keys (iteration, len and 'in' check the stored keys only).
+    Keys added to the record explicitly (for example 'time-generated-hrf') are not lazy.
+    """
+
+    __slots__ = ()
+
+    SHARED_KEYS = tuple(FCPortStatisticsParser.FC_PORT_ADD_PARAMS)
+
+    # lazy hrf key and counter key pairs
+    HRF_KEYS = {leaf + FCPortStatisticsParser.HRF_TAG: leaf for leaf in FCPortStatisticsParser.FC_STATISTICS_COUNTER_LEAFS}
+
+
+    def __missing__(self, key):
+        if key not in FCPortStatsRecord.HRF_KEYS:
+            raise KeyError(key)
+        # rendered counter is taken from the int_to_hrf cache (record is not changed)
+        return FCPortStatisticsParser.int_to_hrf(self.get(FCPortStatsRecord.HRF_KEYS[key]))
+
+
+    def _is_lazy_key(self, key):
+        return key in FCPortStatsRecord.HRF_KEYS
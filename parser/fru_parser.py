@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional, Self, Tuple, Union
 
 from .base_parser import BaseParser
+from .parser_snapshot import ParserSnapshot
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
@@ -47,7 +48,7 @@ class FRUParser(BaseParser):
         """
         Args:
             sw_telemetry (BrocadeSwitchTelemetry): set of switch telemetry retrieved from the switch.
-            fru_prev (FRUParser): previous fru readings.
+            fru_prev (FRUParser, ParserSnapshot): previous fru readings (previous FRUParser snapshot).
         """
         
         super().__init__(sw_telemetry)
@@ -186,7 +187,7 @@ class FRUParser(BaseParser):
 
         # other is not exist (for exaple 1st iteration)
         # other is not same class instance
-        if other is None or str(type(self)) != str(type(other)):
+        if other is None or not self.same_parser_type(other):
             return
 
         if fru_type == 'ps':
@@ -233,6 +234,26 @@ class FRUParser(BaseParser):
         return fru_params_changed_dct
 
 
+    def _clear_changed_values(self) -> None:
+        """Method clears fru parameters changed since the previous cycle."""
+
+        self._fru_ps_changed = {}
+        self._fru_fan_changed = {}
+        self._fru_sensor_changed = {}
+
+
+    def _get_snapshot_state(self) -> Dict[str, Optional[dict]]:
+        """Method returns fru parameters which are checked for changed values.
+
+        Returns:
+            dict: fru attribute name and copied fru parameters pairs.
+        """
+
+        return {'fru_ps': ParserSnapshot.get_params_snapshot(self.fru_ps, FRUParser.PS_CHANGED),
+                'fru_fan': ParserSnapshot.get_params_snapshot(self.fru_fan, FRUParser.FAN_CHANGED),
+                'fru_sensor': ParserSnapshot.get_params_snapshot(self.fru_sensor, FRUParser.SENSOR_CHANGED)}
+
+
     @property
     def fru_ps(self):
         return self._fru_ps
@@ -3,6 +3,7 @@ from collections import defaultdict
 from typing import Dict, List, Optional, Self, Union
 
 from .base_parser import BaseParser
+from .parser_snapshot import ParserSnapshot
 from .switch_parser import SwitchParser
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
@@ -49,7 +50,7 @@ class MAPSParser(BaseParser):
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
             sw_parser (BrocadeSwitchParser): switch parser object.
-            maps_parser_prev (): previous MAPSParser object.
+            maps_parser_prev (MAPSParser, ParserSnapshot): previous MAPSParser object (previous MAPSParser snapshot).
         """
         
         super().__init__(sw_telemetry)
@@ -304,7 +305,7 @@ class MAPSParser(BaseParser):
         # other doesn't exist (for examle 1st iteration)
         # other is not same class
         # other's required atrribute is empty
-        if other is None or str(type(self)) != str(type(other)) or not other.system_resources:
+        if other is None or not self.same_parser_type(other) or not other.system_resources:
             return None
         
         # check if other is for the same switch
@@ -342,7 +343,7 @@ class MAPSParser(BaseParser):
         # other is not exist (for examle 1st iteration)
         # other is not BrocadeFCPortParametersParser type
         # other's fcport_params atrribute is empty
-        if other is None or str(type(self)) != str(type(other)) or not other.ssp_report:
+        if other is None or not self.same_parser_type(other) or not other.ssp_report:
             return None
         
         # check if other is for the same switch
@@ -360,6 +361,20 @@ class MAPSParser(BaseParser):
         return ssp_report_changed_dct
 
 
+    def _get_snapshot_state(self) -> Dict[str, Optional[dict]]:
+        """Method returns system resources and ssp report statuses which are checked for changed values.
+
+        Returns:
+            dict: maps attribute name and copied values pairs.
+        """
+
+        system_resource_keys = list(MAPSParser.SYSTEM_RESOURCE_THRESHOLDS.keys()) + \
+            [system_resource + '-status' for system_resource in MAPSParser.SYSTEM_RESOURCE_THRESHOLDS]
+        ssp_report_keys = [key for key in (self.ssp_report or {}) if key.endswith(MAPSParser.STATUS_TAG)]
+        return {'system_resources': ParserSnapshot.get_values_snapshot(self.system_resources, system_resource_keys),
+                'ssp_report': ParserSnapshot.get_values_snapshot(self.ssp_report, ssp_report_keys)}
+
+
     @property
     def sw_parser(self):
         return self._sw_parser
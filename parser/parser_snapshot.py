@@ -0,0 +1,158 @@
+from typing import Any, Dict, List, Optional
+
+from .port_record import PortRecord
+
+
+class ParserSnapshot:
+    """
+    Class to keep the previous state of the parser.
+    Snapshot contains only values the next cycle parser compares with (counters, statuses and changed keys)
+    instead of the full parser with the raw switch telemetry and all derived per-port dictionaries.
+    Snapshot values are copied from the parser so snapshot is not affected by the parser changes
+    (for example dashboard fill of the current cycle). Snapshot attributes can't be modified.
+
+    State values are accessed as snapshot attributes (for example fcport_stats_snapshot.fcport_stats)
+    so parser compares with the snapshot the same way as with the previous parser.
+
+    Attributes:
+        parser_name (str): class name of the parser snapshot is taken from.
+        ch_wwn (str): chassis wwn.
+        telemetry_date (str): date of the parsed telemetry.
+        telemetry_time (str): time of the parsed telemetry.
+        state (dict): parser attribute name and copied attribute value pairs.
+    """
+
+
+    def __init__(self, parser_name: str, ch_wwn: Optional[str],
+                 telemetry_date: Optional[str], telemetry_time: Optional[str], state: Dict[str, Any]):
+        """
+        Args:
+            parser_name (str): class name of the parser snapshot is taken from.
+            ch_wwn (str): chassis wwn.
+            telemetry_date (str): date of the parsed telemetry.
+            telemetry_time (str): time of the parsed telemetry.
+            state (dict): parser attribute name and copied attribute value pairs.
+        """
+
+        object.__setattr__(self, '_parser_name', parser_name)
+        object.__setattr__(self, '_ch_wwn', ch_wwn)
+        object.__setattr__(self, '_telemetry_date', telemetry_date)
+        object.__setattr__(self, '_telemetry_time', telemetry_time)
+        object.__setattr__(self, '_state', state)
+
+
+    def __getattr__(self, name: str) -> Any:
+        # called only if name is not found in the snapshot instance (parser state value)
+        state = self.__dict__.get('_state', {})
+        if name in state:
+            return state[name]
+        raise AttributeError(f"{self.__class__.__name__} of the {self.__dict__.get('_parser_name')} has no attribute '{name}'")
+
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+
+    @staticmethod
+    def get_params_snapshot(params_dct: Optional[Dict[Any, dict]], keys: List[str]) -> Optional[Dict[Any, dict]]:
+        """Method copies keys values of each element of the parameters dictionary
+        (for example fru id and fru parameters pairs).
+
+        Args:
+            params_dct (dict): element id and element parameters dictionary pairs.
+            keys (List[str]): parameters to copy.
+
+        Returns:
+            dict: element id and copied element parameters pairs.
+        """
+
+        if params_dct is None:
+            return
+        return {element_id: ParserSnapshot.get_values_snapshot(element_dct, keys)
+                for element_id, element_dct in params_dct.items()}
+
+
+    @staticmethod
+    def get_vfid_ports_snapshot(ports_dct: Optional[Dict[int, Dict[str, dict]]], keys: List[str]) -> Optional[Dict[int, Dict[str, dict]]]:
+        """Method copies keys values of each port of each vf_id switch.
+
+        Args:
+            ports_dct (dict): vf_id and (slot_port and port parameters dictionary pairs) pairs.
+            keys (List[str]): port parameters to copy.
+
+        Returns:
+            dict: vf_id and (slot_port and copied port parameters pairs) pairs.
+        """
+
+        if ports_dct is None:
+            return
+        return {vf_id: ParserSnapshot.get_params_snapshot(ports_vfid_dct, keys)
+                for vf_id, ports_vfid_dct in ports_dct.items()}
+
+
+    @staticmethod
+    def get_values_snapshot(values_dct: Optional[dict], keys: List[str]) -> Optional[dict]:
+        """Method copies keys values of the dictionary. Missing keys are not added.
+        List and dictionary values are copied (shallow).
+
+        Args:
+            values_dct (dict): dictionary to copy values from.
+            keys (List[str]): keys to copy.
+
+        Returns:
+            dict: copied values.
+        """
+
+        if values_dct is None:
+            return
+        # port record gets all values in a single call
+        if isinstance(values_dct, PortRecord):
+            return {key: ParserSnapshot._copy_value(value) for key, value in values_dct.get_items(keys).items()}
+        return {key: ParserSnapshot._copy_value(values_dct[key]) for key in keys if key in values_dct}
+
+
+    @staticmethod
+    def _copy_value(value: Any) -> Any:
+        """Method copies list and dictionary values. Other values are immutable and returned as is."""
+
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__} "
+                f"parser: {self.parser_name}, "
+                f"date: {self.telemetry_date if self.telemetry_date else 'None'}, "
+                f"time: {self.telemetry_time if self.telemetry_time else 'None'}")
+
+
+    @property
+    def parser_name(self):
+        return self._parser_name
+
+
+    @property
+    def ch_wwn(self):
+        return self._ch_wwn
+
+
+    @property
+    def telemetry_date(self):
+        return self._telemetry_date
+
+
+    @property
+    def telemetry_time(self):
+        return self._telemetry_time
+
+
+    @property
+    def state(self):
+        return self._state
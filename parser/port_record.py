@@ -0,0 +1,300 @@
+import itertools
+import threading
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# marker of the key which is not set in the port record
+_ABSENT = object()
+
+
+class PortRecord(MutableMapping):
+    """
+    Class of the compact port parameters record with the dictionary interface
+    (toolbar gauges, snapshots and changed values detection read it as the port dictionary).
+    Record values are kept in the list. Key and list index pairs are shared by all records of the class
+    (key is added to the class keys when it's set in any record for the first time)
+    so record doesn't keep its own hash table and keys as the port dictionary does.
+    Each parser has its own record class (keys of the different parsers are not mixed).
+
+    Port identity parameters (SHARED_KEYS) are not copied to the record.
+    Their values are read from the referenced fc port parameters record of the same port.
+
+    Attributes:
+        port_params (Mapping): fc port parameters record SHARED_KEYS values are read from.
+            None if record has no shared keys.
+        handle (int): port handle in the port registry of the cycle. None if port is not registered.
+    """
+
+    __slots__ = ('_values', '_port_params', '_handle')
+
+    # keys which values are read from the referenced fc port parameters record
+    SHARED_KEYS = ()
+
+    _keys: List[str] = []
+    _key_index: Dict[str, int] = {}
+    _shared_keys = frozenset()
+    _keys_lock = threading.Lock()
+
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # each record class has its own keys
+        cls._keys = []
+        cls._key_index = {}
+        cls._shared_keys = frozenset(cls.SHARED_KEYS)
+
+
+    def __init__(self, values: Optional[Mapping] = None, port_params: Optional[Mapping] = None, handle: Optional[int] = None):
+        """
+        Args:
+            values (Mapping, optional): initial key and value pairs. Defaults to None.
+            port_params (Mapping, optional): fc port parameters record SHARED_KEYS values are read from
+                (empty dictionary if all SHARED_KEYS values are None). Defaults to None (no shared keys).
+            handle (int, optional): port handle in the port registry (PortRegistry). Defaults to None.
+        """
+
+        keys = self._keys
+        keys_number = len(keys)
+        self._port_params = port_params
+        self._handle = handle
+        # parser creates records of the same class from the same keys so values are copied as is
+        # if keys are in the class keys order
+        if isinstance(values, dict) and len(values) <= keys_number and keys[:len(values)] == list(values):
+            self._values = list(values.values()) + [_ABSENT] * (keys_number - len(values))
+            return
+        self._values = [_ABSENT] * keys_number
+        if values:
+            self.update(values)
+
+
+    @classmethod
+    def _get_key_index(cls, key: str) -> int:
+        """Method returns list index of the key. Key is added to the class keys if it's new.
+        Collector threads parse switches concurrently so keys are added under the lock."""
+
+        index = cls._key_index.get(key)
+        if index is None:
+            with cls._keys_lock:
+                index = cls._key_index.get(key)
+                if index is None:
+                    index = len(cls._keys)
+                    # key is added to the keys list before index is available for other threads
+                    cls._keys.append(key)
+                    cls._key_index[key] = index
+        return index
+
+
+    def _get_own_value(self, key: str) -> Any:
+        """Method returns value set in the record (not shared). _ABSENT if key is not set."""
+
+        try:
+            return self._values[self._key_index[key]]
+        # key is not in the class keys or it's added after the record is created
+        except (KeyError, IndexError):
+            return _ABSENT
+
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self._values[self._key_index[key]]
+        except (KeyError, IndexError):
+            value = _ABSENT
+        if value is not _ABSENT:
+            return value
+        if self._port_params is not None and key in self._shared_keys:
+            return self._port_params.get(key)
+        return self.__missing__(key)
+
+
+    def __missing__(self, key: str) -> Any:
+        raise KeyError(key)
+
+
+    def _is_lazy_key(self, key: str) -> bool:
+        """Method checks if key value is computed by __missing__ of the record subclass when it's read.
+        Lazy key is not stored in the record (it's not in the record keys till it's set explicitly)."""
+
+        return False
+
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            value = self._values[self._key_index[key]]
+        except (KeyError, IndexError):
+            value = _ABSENT
+        if value is not _ABSENT:
+            return value
+        if self._port_params is not None and key in self._shared_keys:
+            return self._port_params.get(key)
+        try:
+            return self.__missing__(key)
+        except KeyError:
+            return default
+
+
+    def get_values(self, keys: List[str], default: Any = None) -> List[Any]:
+        """Method returns values of the keys (toolbar gauge labels) in the keys order.
+
+        Args:
+            keys (List[str]): keys to get values.
+            default (Any, optional): value of the missing key. Defaults to None.
+
+        Returns:
+            list: ordered values.
+        """
+
+        key_index = self._key_index
+        values = self._values
+        values_number = len(values)
+        port_params = self._port_params
+        shared_keys = self._shared_keys if port_params is not None else ()
+        values_lst = []
+        for key in keys:
+            index = key_index.get(key)
+            value = values[index] if index is not None and index < values_number else _ABSENT
+            if value is _ABSENT:
+                if key in shared_keys:
+                    value = port_params.get(key)
+                # lazy key of the record subclass
+                elif self._is_lazy_key(key):
+                    value = self.__missing__(key)
+                else:
+                    value = default
+            values_lst.append(value)
+        return values_lst
+
+
+    def get_items(self, keys: List[str]) -> Dict[str, Any]:
+        """Method returns key and value pairs of the keys present in the record (parser snapshot values).
+
+        Args:
+            keys (List[str]): keys to get values.
+
+        Returns:
+            dict: key and value pairs in the keys order. Missing keys are not added.
+        """
+
+        key_index = self._key_index
+        values = self._values
+        values_number = len(values)
+        items = {}
+        for key in keys:
+            index = key_index.get(key)
+            value = values[index] if index is not None and index < values_number else _ABSENT
+            if value is not _ABSENT:
+                items[key] = value
+            elif key in self:
+                items[key] = self[key]
+            # lazy key of the record subclass
+            elif self._is_lazy_key(key):
+                items[key] = self.__missing__(key)
+        return items
+
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            self._values[self._key_index[key]] = value
+        # key is not in the class keys or it's added after the record is created
+        except (KeyError, IndexError):
+            index = self._get_key_index(key)
+            values = self._values
+            if index >= len(values):
+                values.extend([_ABSENT] * (index + 1 - len(values)))
+            values[index] = value
+
+
+    def __delitem__(self, key: str) -> None:
+        # shared keys are read only
+        if self._get_own_value(key) is _ABSENT:
+            raise KeyError(key)
+        self._values[self._key_index[key]] = _ABSENT
+
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            if self._values[self._key_index[key]] is not _ABSENT:
+                return True
+        except (KeyError, IndexError):
+            pass
+        return self._port_params is not None and key in self._shared_keys
+
+
+    def update(self, other: Union[Mapping, Iterable[Tuple[str, Any]]] = (), /, **kwargs) -> None:
+        # parsers fill records with update so values of the known keys are set without __setitem__ call
+        key_index = self._key_index
+        values = self._values
+        items = other.items() if isinstance(other, Mapping) else other
+        for key, value in itertools.chain(items, kwargs.items()):
+            index = key_index.get(key)
+            if index is not None and index < len(values):
+                values[index] = value
+            else:
+                self[key] = value
+
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self._keys
+        for index, value in enumerate(self._values):
+            if value is not _ABSENT:
+                yield keys[index]
+        if self._port_params is not None:
+            for key in self.SHARED_KEYS:
+                if self._get_own_value(key) is _ABSENT:
+                    yield key
+
+
+    def __len__(self) -> int:
+        values = self._values
+        own_number = len(values) - values.count(_ABSENT)
+        if self._port_params is None:
+            return own_number
+        return own_number + sum(1 for key in self.SHARED_KEYS if self._get_own_value(key) is _ABSENT)
+
+
+    def __bool__(self) -> bool:
+        # toolbar gauges skip empty port dictionaries
+        if self._port_params is not None and self.SHARED_KEYS:
+            return True
+        values = self._values
+        return values.count(_ABSENT) < len(values)
+
+
+    def get_own_items(self) -> Dict[str, Any]:
+        """Method returns key and value pairs set in the record (shared keys are not included).
+
+        Returns:
+            dict: key and value pairs.
+        """
+
+        keys = self._keys
+        return {keys[index]: value for index, value in enumerate(self._values) if value is not _ABSENT}
+
+
+    def copy(self) -> 'PortRecord':
+        """Method creates record copy with the same referenced fc port parameters record and port handle."""
+
+        return self.__class__(self.get_own_items(), self._port_params, self._handle)
+
+
+    def __reduce__(self):
+        # key indexes are not the same in different processes (parse worker) so record is pickled with keys
+        return (self.__class__, (self.get_own_items(), self._port_params, self._handle))
+
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._values.__sizeof__()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
+    @property
+    def port_params(self):
+        return self._port_params
+
+
+    @property
+    def handle(self):
+        return self._handle
@@ -0,0 +1,121 @@
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+from .base_parser import BaseParser
+
+
+class PortRegistry:
+    """
+    Class of the per cycle fc port registry.
+    Fc port parameters parser registers each port of the switch telemetry once
+    and port gets integer handle. Fc port statistics and sfp media parsers (and their records)
+    refer to the port with the same handle so port identity and parameters are kept in a single place
+    and port lookups of the different parsers are list index lookups.
+
+    Attributes:
+        port_params: fc port parameters records list. List index is port handle.
+    """
+
+    def __init__(self):
+        self._port_params: List[Mapping] = []
+        # (vf_id, slot_port) handle lookup
+        self._slot_port_handles: Dict[Tuple[int, str], int] = {}
+        # FC_PORT_ADD_PARAMS dictionaries are created once for the port when requested
+        self._port_add_params: Dict[int, Dict[str, Optional[str]]] = {}
+
+
+    def register(self, vf_id: int, slot_port: str) -> int:
+        """
+        Method registers the port and returns its handle.
+        Port registered again (same vf_id and slot_port) keeps its handle.
+        Fc port parameters record created with the handle is added with set_port_params method.
+
+        Args:
+            vf_id (int): switch vf_id.
+            slot_port (str): slot and port number in the format 'slot/port' (e.g. '0/1').
+
+        Returns:
+            int: port handle.
+        """
+
+        handle = self._slot_port_handles.get((vf_id, slot_port))
+        if handle is None:
+            handle = len(self._port_params)
+            # fc port parameters are empty until they are set
+            self._port_params.append({})
+            self._slot_port_handles[(vf_id, slot_port)] = handle
+        return handle
+
+
+    def set_port_params(self, handle: int, port_params: Mapping) -> None:
+        """
+        Method sets fc port parameters record of the port handle.
+
+        Args:
+            handle (int): port handle.
+            port_params (Mapping): fc port parameters record.
+        """
+
+        self._port_params[handle] = port_params
+        self._port_add_params.pop(handle, None)
+
+
+    def get_handle(self, vf_id: int, slot_port: str) -> Optional[int]:
+        """
+        Method returns handle of the port.
+
+        Args:
+            vf_id (int): switch vf_id.
+            slot_port (str): slot and port number in the format 'slot/port' (e.g. '0/1').
+
+        Returns:
+            int: port handle. None if port is not registered.
+        """
+
+        return self._slot_port_handles.get((vf_id, slot_port))
+
+
+    def get_port_params(self, handle: Optional[int]) -> Mapping:
+        """Method returns fc port parameters record of the port handle.
+        Empty dictionary if handle is None (port is not registered)."""
+
+        if handle is None:
+            return {}
+        return self._port_params[handle]
+
+
+    def get_port_add_params(self, handle: Optional[int]) -> Dict[str, Optional[str]]:
+        """
+        Method returns FC_PORT_ADD_PARAMS values of the port handle.
+        Dictionary is created once for the port and shared by all callers (must not be changed).
+
+        Args:
+            handle (int, optional): port handle. None if port is not registered (all values are None).
+
+        Returns:
+            Dict[str, Optional[str]]: Dictionary with FC_PORT_ADD_PARAMS values.
+        """
+
+        port_add_params = self._port_add_params.get(handle)
+        if port_add_params is None:
+            port_params = self.get_port_params(handle)
+            port_add_params = {param: port_params.get(param) for param in BaseParser.FC_PORT_ADD_PARAMS}
+            self._port_add_params[handle] = port_add_params
+        return port_add_params
+
+
+    def __len__(self) -> int:
+        return len(self._port_params)
+
+
+    def __contains__(self, port: Tuple[int, str]) -> bool:
+        return port in self._slot_port_handles
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(ports={len(self)})"
+
+
+    @property
+    def port_params(self):
+        return self._port_params
@@ -3,6 +3,8 @@ from typing import Dict, List, Union, Self
 
 from collection.switch_telemetry_request import SwitchTelemetryRequest
 
+from .parser_snapshot import ParserSnapshot
+
 
 class RequestStatusParser:
     """
@@ -28,26 +30,37 @@ class RequestStatusParser:
     # 401 - Unauthorized access
     # 503 - Chassis is not ready
     FAILED_STATUS_CODES = [401, 503]
+
+    # request duration, response size, json decode duration and number of retries of the module request
+    REQUEST_STATISTICS_KEYS = ['request-duration', 'response-bytes', 'decode-duration', 'request-retries', 'cached']
+
+    # failed module served from the last good response (stale flag and last good response age in sec)
+    STALE_KEYS = ['stale', 'telemetry-age']
+
+    # request status values kept in the previous state snapshot
+    SNAPSHOT_KEYS = ['status', 'status-code', 'stale']
     
     
     def __init__(self, 
                  sw_telemetry: SwitchTelemetryRequest, 
                  nameserver_dct: dict,
-                 request_status_parser_prev: Self = None) -> None:
+                 request_status_parser_prev: Union[ParserSnapshot, Self] = None) -> None:
         """
         Args:
             sw_telemetry: set of switch telemetry retrieved from the switch.
             nameserver_dct (Dict[str, str]): dictionary key as ip address and chassis name as value.
+            request_status_parser_prev (ParserSnapshot): previous request status snapshot (see get_snapshot method).
         """
         
         self._sw_telemetry: SwitchTelemetryRequest = sw_telemetry
+        self._sw_ipaddress = sw_telemetry.sw_ipaddress
         self._nameserver: dict = nameserver_dct.copy()
         self._request_status_parser_prev = request_status_parser_prev
         self._date: datetime = datetime.now().strftime("%d/%m/%Y")
         self._time: datetime = datetime.now().strftime("%H:%M:%S")
         self._request_status: dict = self._get_request_status()
 
-        if self.request_status_parser_prev:
+        if isinstance(self.request_status_parser_prev, RequestStatusParser):
             self._request_status_parser_prev._request_status_parser_prev = None
 
         
@@ -96,14 +109,24 @@ class RequestStatusParser:
             
         Returns:
             Request status dictionary for the request result telemetry_dct.
-            Dictionary keys are module name, container name, retrieve datetime, status and vf_id.
+            Dictionary keys are module name, container name, retrieve datetime, status, vf_id and request statistics.
         """
         
-        ip_address = self.sw_telemetry.sw_ipaddress
+        ip_address = self.sw_ipaddress
 
         # retrive values from the telemetry_dct
-        request_keys = ['date', 'time', 'status-code', 'error-message', 'vf-id']
+        # module-retries is number of the module request retries within the polling cycle
+        request_keys = ['date', 'time', 'status-code', 'error-message', 'vf-id', 'cancelled', 'module-retries']
+        # request statistics (cached flag is set if module response is reused from the previous cycles)
+        request_keys.extend(RequestStatusParser.REQUEST_STATISTICS_KEYS)
+        request_keys.extend(RequestStatusParser.STALE_KEYS)
         telemetry_status_dct = {key: telemetry_dct.get(key) for key in request_keys}
+        telemetry_status_dct['stale'] = bool(telemetry_dct.get('stale'))
+        telemetry_status_dct['telemetry-age'] = telemetry_dct.get('telemetry-age', 0) if telemetry_dct.get('stale') else 0
+        # stale container shows status code and error message of the failed request
+        if telemetry_dct.get('stale'):
+            telemetry_status_dct['status-code'] = telemetry_dct.get('failed-status-code')
+            telemetry_status_dct['error-message'] = telemetry_dct.get('failed-error-message')
         # add module name, container name and vf_id
         telemetry_status_dct['vf-id'] = vf_id
         telemetry_status_dct['module'] = module
@@ -122,6 +145,10 @@ class RequestStatusParser:
     def _get_container_status(container: Dict[str, Union[str, int]]) -> str:
         """
         Method verifies request response, error-message and resonse status-code.
+        Request cancelled due to polling cycle timeout gets WARNING status 
+        (container is filled with the last good response or error message).
+        Stale container (failed request served from the last good response) status 
+        is verified for the failed request.
         
         Args:
             container: container with switch telemetry
@@ -130,8 +157,16 @@ class RequestStatusParser:
             Response result status ('OK', 'WARNING', 'FAIL')
         """
     
+        # failed request status is verified for the stale container
+        if container.get('stale'):
+            container = {'status-code': container.get('failed-status-code'),
+                         'error-message': container.get('failed-error-message'),
+                         'cancelled': container.get('cancelled')}
+        # request cancelled due to the polling cycle timeout
+        if container.get('cancelled'):
+            return 'WARNING'
         # if response contains non-empty data 
-        if container.get('Response'):
+        elif container.get('Response'):
             return 'OK'
         # if error-message is in the ignore list
         elif container.get('error-message') in RequestStatusParser.IGNORED_ERRORS:
@@ -145,9 +180,30 @@ class RequestStatusParser:
             return 'FAIL'
 
         
+    def release_telemetry(self) -> None:
+        """Method drops the raw switch telemetry reference after the request status is created."""
+
+        self._sw_telemetry = None
+
+
+    def get_snapshot(self) -> ParserSnapshot:
+        """Method creates previous state snapshot of the request status for the next cycle parser.
+        Snapshot contains status, status code and stale flag of each request 
+        (module, container, vf-id) instead of the full request status parser.
+
+        Returns:
+            ParserSnapshot: request status snapshot.
+        """
+
+        request_status = {(status_dct['module'], status_dct['container'], status_dct['vf-id']): 
+                          ParserSnapshot.get_values_snapshot(status_dct, RequestStatusParser.SNAPSHOT_KEYS)
+                          for status_dct in self.request_status}
+        return ParserSnapshot(self.__class__.__name__, None, self.date, self.time, {'request_status': request_status})
+
+
     def __repr__(self):
         return (f"{self.__class__.__name__} " 
-                f"ip_address: {self.sw_telemetry.sw_ipaddress}, "
+                f"ip_address: {self.sw_ipaddress}, "
                 f"date: {self.telemetry_date if self.telemetry_date else 'None'}, "
                 f"time: {self.telemetry_time if self.telemetry_time else 'None'}")
     
@@ -157,6 +213,11 @@ class RequestStatusParser:
         return self._sw_telemetry
 
 
+    @property
+    def sw_ipaddress(self):
+        return self._sw_ipaddress
+
+
     @property
     def nameserver(self):
         return self._nameserver
@@ -1,7 +1,9 @@
 import math
-from typing import Dict, List, Optional, Self, Tuple, Union
+from typing import Dict, List, Mapping, Optional, Self, Tuple, Union
 
 from .base_parser import BaseParser
+from .parser_snapshot import ParserSnapshot
+from .port_record import PortRecord
 from .switch_parser import SwitchParser
 from .fcport_params_parser import FCPortParametersParser
 
@@ -17,6 +19,7 @@ class SFPMediaParser(BaseParser):
         sw_telemetry: set of switch telemetry retrieved from the switch.
         fcport_params_parser: fc ports parameters retrieved from the sw_telemetry.
         sfp_media: sfp media parameters dictionary ({vf_id:{slot_port_id:{param1: value1, param2: valuue2}}}).
+            Port sfp media parameters are SFPMediaRecord records.
     """
 
 
@@ -51,6 +54,9 @@ class SFPMediaParser(BaseParser):
     MEDIA_TEMPERATURE_CHANGED = ['temperature', 'remote-media-temperature']
     
     MEDIA_TEMPERATURE_STATUS_CHANGED = ['temperature-status', 'remote-media-temperature-status']
+
+    SFP_MEDIA_CHANGED = MEDIA_RDP_CHANGED + MEDIA_POWER_CHANGED + MEDIA_POWER_STATUS_CHANGED + \
+        MEDIA_TEMPERATURE_CHANGED + MEDIA_TEMPERATURE_STATUS_CHANGED
     
     SFP_POWER_ALERT = {'lw_tx': {'high-alarm': 2500, 'low-alarm': 1000, 'high-warning': 2300, 'low-warning': 1200},
                        'lw_rx': {'high-alarm': 630, 'low-alarm': 50, 'high-warning': 580, 'low-warning': 100},
@@ -68,13 +74,16 @@ class SFPMediaParser(BaseParser):
             sw_telemetry: set of switch telemetry retrieved from the switch.
             sw_parser (BrocadeSwitchParser): switch parameters retrieved from the sw_telemetry.
             fcport_params_parser (BrocadeSwitchParser): fc port parameters class instance retrieved from the sw_telemetry.
-            sfp_media_parser_prev (SFPMediaParser): previous sfp media params retrieved from the switch.
+            sfp_media_parser_prev (SFPMediaParser, ParserSnapshot): previous sfp media params retrieved from the switch 
+                (previous SFPMediaParser snapshot).
         """
         
         super().__init__(sw_telemetry)
         self._sw_parser: SwitchParser = sw_parser
         self._fcport_params_parser: FCPortParametersParser = fcport_params_parser
         self._sfp_media = self._get_sfp_media_values()
+        # changed keys values fingerprint of each port (created once per cycle, kept in the snapshot)
+        self._sfp_media_fingerprints = SFPMediaParser.get_vfid_ports_fingerprints(self.sfp_media, SFPMediaParser.SFP_MEDIA_CHANGED)
         if self.sfp_media:
             self._sfp_media_changed = self._get_changed_sfpmedia(sfp_media_parser_prev)
         else:
@@ -101,15 +110,18 @@ class SFPMediaParser(BaseParser):
                 sfp_media_dct[vf_id] = {}
                 
                 for sfp_media_container in sfp_media_container_lst:
-                    # get sfp media parameters from the container
-                    sfp_media_current_dct = {leaf: sfp_media_container.get(leaf) for leaf in SFPMediaParser.MEDIA_RDP_LEAFS}
-                    # convert uW values to the dBm
-                    self._add_sfp_dbm_power(sfp_media_current_dct)
                     # slot_port_number in the format 'protocol/slot_number/port_number' (e.g. 'fc/0/1')
                     slot_port_number = sfp_media_container['name']
                     # split protocol slot and port number
                     protocol, slot_number, port_number = slot_port_number.split('/')
                     slot_port_number = slot_number + '/' + port_number
+                    # get sfp media parameters from the container
+                    # port parameters are read from the fc port parameters record of the registered port (not copied)
+                    handle = self.fcport_params_parser.port_registry.get_handle(vf_id, slot_port_number) if protocol.lower() == 'fc' else None
+                    sfp_media_current_dct = SFPMediaRecord({leaf: sfp_media_container.get(leaf) for leaf in SFPMediaParser.MEDIA_RDP_LEAFS}, 
+                                                           port_params=self._get_port_params(handle), handle=handle)
+                    # convert uW values to the dBm
+                    self._add_sfp_dbm_power(sfp_media_current_dct)
                     sfp_media_current_dct['slot-number'] = int(slot_number)
                     sfp_media_current_dct['port-number'] = int(port_number)
                     sfp_media_current_dct['port-protocol'] = protocol
@@ -122,9 +134,6 @@ class SFPMediaParser(BaseParser):
                     sfp_media_current_dct.update(remote_optical_product_dct)
                     # present sfp module power-on-time in human readable format
                     SFPMediaParser._set_poweron_time_hrf(sfp_media_current_dct)
-                    # add port parameters to the sfp media dictionary
-                    fcport_params_dct = self._get_port_params(vf_id, protocol, slot_port_number)
-                    sfp_media_current_dct.update(fcport_params_dct)
                     # add power status ('ok', ''warning', 'critical) for the power parameters
                     self._add_power_status(vf_id, sfp_media_current_dct)
                     # add temperature status ('ok', ''warning', 'critical)
@@ -134,25 +143,19 @@ class SFPMediaParser(BaseParser):
         return sfp_media_dct
 
 
-    def _get_port_params(self, vf_id: int, protocol: str, slot_port_number: str) -> Dict[str, Optional[str]]:
+    def _get_port_params(self, handle: Optional[int]) -> Mapping[str, Optional[str]]:
         """
-        Method to get port parameters.
+        Method to get port parameters record sfp media record reads FC_PORT_ADD_PARAMS values from.
         
         Args:
-            vf_id {int}: switch vf_id.
-            protocol {str}: port protocol type.
-            slot_port_number {str}: slot and port number in the format'slot/port' (e.g. '0/1').
+            handle {int}: port handle in the port registry. None if port is not fc port.
         
         Returns:
-            Dict[str, Optional[str]]: Dictionary with FC_PORT_PARAMS values.
+            Mapping[str, Optional[str]]: fc port parameters record. 
+                Empty dictionary if port is not registered fc port (FC_PORT_ADD_PARAMS values are None).
         """
 
-        if protocol.lower() == 'fc':
-            fc_port_params_current = self.fcport_params_parser.fcport_params[vf_id][slot_port_number]
-            fcport_params = {param: fc_port_params_current.get(param) for param in SFPMediaParser.FC_PORT_ADD_PARAMS}
-        else:
-            fcport_params = {param: None for param in SFPMediaParser.FC_PORT_PARAMS}
-        return fcport_params
+        return self.fcport_params_parser.port_registry.get_port_params(handle)
 
 
     @staticmethod
@@ -453,11 +456,13 @@ class SFPMediaParser(BaseParser):
         # other is not exist (for examle 1st iteration)
         # other is not BrocadeSFPMediaParser type
         # other's sfp_media atrribute is empty
-        if other is None or str(type(self)) != str(type(other)) or not other.sfp_media:
+        if other is None or not self.same_parser_type(other) or not other.sfp_media:
             return None
         
         # check if other is for the same switch
         elif self.same_chassis(other):
+            # port fingerprints of the previous cycle (missing in the previous parser of the earlier version)
+            fingerprints_prev = getattr(other, 'sfp_media_fingerprints', None) or {}
             for vf_id, sfp_media_vfid_now_dct in self.sfp_media.items():
 
                 sfp_media_changed_dct[vf_id] = {}
@@ -474,14 +479,26 @@ class SFPMediaParser(BaseParser):
                 # add changed sfp_media ports for the current vf_id
                 sfp_media_changed_dct[vf_id] = SFPMediaParser.get_changed_vfid_ports(
                     sfp_media_vfid_now_dct, sfp_media_vfid_prev_dct, 
-                    changed_keys=SFPMediaParser.MEDIA_RDP_CHANGED + \
-                        SFPMediaParser.MEDIA_POWER_CHANGED + SFPMediaParser.MEDIA_POWER_STATUS_CHANGED + \
-                            SFPMediaParser.MEDIA_TEMPERATURE_CHANGED + SFPMediaParser.MEDIA_TEMPERATURE_STATUS_CHANGED,
+                    changed_keys=SFPMediaParser.SFP_MEDIA_CHANGED,
                     const_keys=SFPMediaParser.FC_PORT_PATH, 
-                    time_now=time_now, time_prev=time_prev)
+                    time_now=time_now, time_prev=time_prev, 
+                    fingerprints_now=self.sfp_media_fingerprints.get(vf_id), 
+                    fingerprints_prev=fingerprints_prev.get(vf_id))
         return sfp_media_changed_dct
 
 
+    def _get_snapshot_state(self) -> Dict[str, Optional[dict]]:
+        """Method returns sfp media parameters which are checked for changed values.
+
+        Returns:
+            dict: sfp media attribute name and copied port parameters pairs.
+        """
+
+        # port fingerprints are not changed after the parser is built
+        return {'sfp_media': ParserSnapshot.get_vfid_ports_snapshot(self.sfp_media, SFPMediaParser.SFP_MEDIA_CHANGED), 
+                'sfp_media_fingerprints': self.sfp_media_fingerprints}
+
+
     @property
     def sw_parser(self):
         return self._sw_parser
@@ -498,4 +515,17 @@ class SFPMediaParser(BaseParser):
     
     @property
     def sfp_media_changed(self):
-        return self._sfp_media_changed
\ No newline at end of file
+        return self._sfp_media_changed
+
+
+    @property
+    def sfp_media_fingerprints(self):
+        return self._sfp_media_fingerprints
+
+
+class SFPMediaRecord(PortRecord):
+    """Class of the sfp media parameters record."""
+
+    __slots__ = ()
+
+    SHARED_KEYS = tuple(SFPMediaParser.FC_PORT_ADD_PARAMS)